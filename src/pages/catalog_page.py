@@ -2,10 +2,16 @@
 Módulo para página de catalogo de https://www.saucedemo.com/
 """
 
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import Select, WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from pages.login_page import LoginPage
+from utils import config
+from utils.dom_batch import click, read_rows, run_actions
+from utils.element_cache import ElementCache
+from utils.session_store import CART_STORAGE_KEY
+from utils.waits import expect_present
 
 
 class CatalogPage:
@@ -16,6 +22,9 @@ class CatalogPage:
     _TITLE = (By.CLASS_NAME, "title")
     _PRODUCTS = (By.CLASS_NAME, "inventory_item")
     _ITEM_NAMES = (By.CLASS_NAME, "inventory_item_name")
+    _ITEM_PRICES = (By.CLASS_NAME, "inventory_item_price")
+    _ITEM_DESCRIPTIONS = (By.CLASS_NAME, "inventory_item_desc")
+    _ITEM_BUTTON = (By.TAG_NAME, "button")
     _ADD_BUTTONS = (By.CSS_SELECTOR, "button[data-test*='add-to-cart']")
     _CART_BADGE = (By.CLASS_NAME, "shopping_cart_badge")
     _CART_LINK = (By.CLASS_NAME, "shopping_cart_link")
@@ -24,22 +33,45 @@ class CatalogPage:
     _FILTER_BUTTON = (By.CLASS_NAME, "product_sort_container")
     _FILTER_OPTIONS = (By.TAG_NAME, "option")
     _LOGOUT_LINK = (By.ID, "logout_sidebar_link")
-
-    def __init__(self, driver):
+    URL = LoginPage.URL + "inventory.html"
+    _PRODUCT_FIELDS = {
+        "name": (_ITEM_NAMES, "text"),
+        "price": (_ITEM_PRICES, "text"),
+        "description": (_ITEM_DESCRIPTIONS, "text"),
+        "button": (_ITEM_BUTTON, "text"),
+    }
+    _INDEX_FIELDS = {
+        "name": (_ITEM_NAMES, "text"),
+        "item": (None, "element"),
+        "add_button": (_ADD_BUTTONS, "element"),
+        "price": (_ITEM_PRICES, "text"),
+    }
+
+    def __init__(self, driver, username="standard_user", password="secret_sauce"):
         # La página de catalogo solo tiene sentido cuando se inicia sesión
-        self.driver = (
-            LoginPage(driver)
-            .open()
-            .do_complete_login("standard_user", "secret_sauce")
-            .driver
-        )
+        login_page = LoginPage(driver)
+        if config.SAUCEDEMO_FAST_LOGIN:
+            login_page.do_fast_login(username, password)
+        else:
+            login_page.open().do_complete_login(username, password)
+        self.driver = login_page.driver
         self.wait = WebDriverWait(self.driver, 10)
+        self.elements = ElementCache(self.driver)
+        self._index = None
+
+    def open(self):
+        """
+        Abre directamente la página de catálogo; requiere una sesión iniciada.
+        """
+        self.elements.navigate(self.URL)
+        self._index = None
+        return self
 
     def get_title(self) -> str:
         """
         Obtiene el título de la página de catálogo.
         """
-        return self.driver.find_element(*self._TITLE).text
+        return self.elements.text(self._TITLE)
 
     def get_products(self):
         """
@@ -62,42 +94,107 @@ class CatalogPage:
         """
         Agrega un producto al carrito por su nombre.
         """
-        products = self.get_products()
-        for product in products:
-            if product.find_element(*self._ITEM_NAMES).text == name:
-                product.find_element(*self._ADD_BUTTONS).click()
-                return self
-        raise ValueError(f"Producto no encontrado: {name}")
+        for _ in range(2):
+            entry = self._get_index_entry(name)
+            if entry["add_button"] is not None:
+                try:
+                    entry["add_button"].click()
+                    # Al agregarse, SauceDemo reemplaza el botón por 'Remove'
+                    entry["add_button"] = None
+                    return self
+                except StaleElementReferenceException:
+                    pass
+            # El índice quedó desactualizado: se reconstruye una única vez
+            self._index = None
+        raise ValueError(f"El producto no tiene botón 'Add to cart' disponible: {name}")
+
+    def _get_index_entry(self, name: str):
+        """
+        Obtiene la entrada del índice nombre -> (producto, botón 'Add to cart', precio),
+        construyéndolo en una sola llamada al driver si no existe.
+        """
+        if self._index is None:
+            rows = read_rows(self.driver, self._PRODUCTS, self._INDEX_FIELDS)
+            self._index = {row["name"]: row for row in rows}
+        if name not in self._index:
+            raise ValueError(f"Producto no encontrado: {name}")
+        return self._index[name]
+
+    def add_products_to_cart_by_name(self, names):
+        """
+        Agrega varios productos al carrito haciendo todos los clics en una sola llamada al driver.
+        """
+        run_actions(
+            self.driver,
+            [click(self._add_button_locator(name)) for name in names],
+        )
+        return self
+
+    @staticmethod
+    def _add_button_locator(name: str):
+        """
+        Construye el localizador del botón 'Add to cart' de un producto a partir de su nombre.
+        """
+        slug = name.lower().replace(" ", "-")
+        return (By.CSS_SELECTOR, f"button[data-test='add-to-cart-{slug}']")
+
+    def seed_cart(self, product_ids, reload: bool = True):
+        """
+        Carga el carrito escribiendo los IDs de producto directamente en el
+        localStorage de SauceDemo, en una sola llamada al driver.
+        Con reload=False no se recarga la página, útil cuando el siguiente paso
+        navega directamente a otra página (carrito o checkout).
+        """
+        self.driver.execute_script(
+            "window.localStorage.setItem(arguments[0], JSON.stringify(arguments[1]));",
+            CART_STORAGE_KEY,
+            list(product_ids),
+        )
+        if reload:
+            self.driver.refresh()
+            self.elements.invalidate()
+            self._index = None
+        return self
 
     def get_cart_item_count(self) -> int:
         """
         Obtiene la cantidad de artículos en el carrito.
         """
-        try:
-            badge = self.driver.find_element(*self._CART_BADGE)
-            return int(badge.text)
-        except Exception:
-            return 0
+        badge = expect_present(
+            self.driver, self._CART_BADGE, timeout=config.SELENIUM_EXPLICIT_WAIT
+        )
+        return int(badge.text) if badge is not None else 0
 
     def click_menu_button(self):
         """
         Hace clic en el botón del menú.
         """
-        self.driver.find_element(*self._MENU_BUTTON).click()
+        self.elements.click(self._MENU_BUTTON)
         return self
 
     def menu_is_displayed(self) -> bool:
         """
         Verifica si el menú está desplegado.
         """
-        menu = self.driver.find_element(*self._MENU_DISPLAY)
-        return menu.is_displayed()
+        return self.elements.is_displayed(self._MENU_DISPLAY)
 
     def click_filter_button(self):
         """
         Hace clic en el botón de filtro.
         """
-        self.driver.find_element(*self._FILTER_BUTTON).click()
+        self.elements.click(self._FILTER_BUTTON)
+        return self
+
+    def sort_products(self, option_value: str):
+        """
+        Ordena el catálogo seleccionando una opción del filtro (az, za, lohi, hilo).
+        """
+        self.elements.run(
+            self._FILTER_BUTTON,
+            lambda element: Select(element).select_by_value(option_value),
+        )
+        self.elements.invalidate()
+        self._index = None
         return self
 
     def get_filter_options(self):
@@ -110,24 +207,30 @@ class CatalogPage:
         """
         Verifica si el ícono del carrito está visible.
         """
-        cart_icon = self.driver.find_element(*self._CART_LINK)
-        return cart_icon.is_displayed()
+        return self.elements.is_displayed(self._CART_LINK)
 
     def go_to_cart(self):
         """
         Navega a la página del carrito.
         """
-        self.driver.find_element(*self._CART_LINK).click()
+        self.elements.click(self._CART_LINK, navigates=True)
+        self._index = None
         from pages.shopping_cart_page import ShoppingCartPage
 
         return ShoppingCartPage(self.driver)
 
+    def get_product_rows(self):
+        """
+        Obtiene nombre, precio, descripción y texto del botón de cada producto
+        en una sola llamada al driver.
+        """
+        return read_rows(self.driver, self._PRODUCTS, self._PRODUCT_FIELDS)
+
     def get_product_names(self):
         """
         Obtiene los nombres de todos los productos en el catálogo.
         """
-        name_elements = self.driver.find_elements(*self._ITEM_NAMES)
-        return [element.text for element in name_elements]
+        return [row["name"] for row in self.get_product_rows()]
 
     def get_add_to_cart_buttons(self):
         """
@@ -139,8 +242,10 @@ class CatalogPage:
         """
         Realiza el flujo de cierre de sesión.
         """
-        self.driver.find_element(*self._MENU_BUTTON).click()
+        self.click_menu_button()
         self.wait.until(EC.element_to_be_clickable(self._LOGOUT_LINK)).click()
+        self.elements.invalidate()
+        self._index = None
         from pages.login_page import LoginPage
 
         return LoginPage(self.driver)
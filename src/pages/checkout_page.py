@@ -6,7 +6,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.catalog_page import CatalogPage
+from pages.login_page import LoginPage
+from utils import config
+from utils.dom_batch import fill, read_rows, run_actions
+from utils.element_cache import ElementCache
+from utils.waits import expect_present
 
 class CheckoutPage:
     """
@@ -25,50 +29,92 @@ class CheckoutPage:
     _FINISH_BUTTON = (By.ID, "finish")
     _CHECKOUT_ITEMS = (By.CLASS_NAME, "cart_item")
     _CHECKOUT_ITEMS_NAMES = (By.CLASS_NAME, "inventory_item_name")
+    _CHECKOUT_ITEMS_PRICES = (By.CLASS_NAME, "inventory_item_price")
+    _CHECKOUT_ITEMS_DESCRIPTIONS = (By.CLASS_NAME, "inventory_item_desc")
+    _CHECKOUT_ITEMS_QUANTITIES = (By.CLASS_NAME, "cart_quantity")
+    URL = LoginPage.URL + "checkout-step-one.html"
+    OVERVIEW_URL = LoginPage.URL + "checkout-step-two.html"
+    _CHECKOUT_ITEM_FIELDS = {
+        "name": (_CHECKOUT_ITEMS_NAMES, "text"),
+        "price": (_CHECKOUT_ITEMS_PRICES, "text"),
+        "description": (_CHECKOUT_ITEMS_DESCRIPTIONS, "text"),
+        "quantity": (_CHECKOUT_ITEMS_QUANTITIES, "text"),
+    }
     
     
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
-        
-    def fill_out_checkout_info(self, first_name: str, last_name: str, postal_code: str):
+        self.elements = ElementCache(driver)
+
+    def open(self):
+        """
+        Abre directamente el formulario de checkout; requiere una sesión iniciada.
+        """
+        self.elements.navigate(self.URL)
+        return self
+
+    def open_overview(self):
         """
-        Llena el formulario de información de checkout.
+        Abre directamente el resumen del checkout; requiere sesión y productos en el carrito.
         """
-        self.driver.find_element(*self._FIRST_NAME_INPUT).send_keys(first_name)
-        self.driver.find_element(*self._LAST_NAME_INPUT).send_keys(last_name)
-        self.driver.find_element(*self._POSTAL_CODE_INPUT).send_keys(postal_code)
+        self.elements.navigate(self.OVERVIEW_URL)
+        return self
+        
+    def fill_out_checkout_info(
+        self, first_name: str, last_name: str, postal_code: str, per_key: bool = False
+    ):
+        """
+        Llena el formulario de información de checkout en una sola llamada al driver.
+        Con per_key=True se tipea cada campo tecla por tecla con send_keys.
+        """
+        if per_key:
+            self.elements.send_keys(self._FIRST_NAME_INPUT, first_name)
+            self.elements.send_keys(self._LAST_NAME_INPUT, last_name)
+            self.elements.send_keys(self._POSTAL_CODE_INPUT, postal_code)
+            return self
+
+        run_actions(
+            self.driver,
+            [
+                fill(self._FIRST_NAME_INPUT, first_name),
+                fill(self._LAST_NAME_INPUT, last_name),
+                fill(self._POSTAL_CODE_INPUT, postal_code),
+            ],
+        )
         return self
     
     def click_continue(self):
         """
         Hace clic en el botón "Continue" para proceder con el checkout.
         """
-        self.driver.find_element(*self._CONTINUE_BUTTON).click()
+        self.elements.click(self._CONTINUE_BUTTON, navigates=True)
         return self
     
     def click_cancel(self):
         """
         Hace clic en el botón "Cancel" para cancelar el checkout.
         """
-        self.driver.find_element(*self._CANCEL_BUTTON).click()
+        self.elements.click(self._CANCEL_BUTTON, navigates=True)
         return self
     
     def get_title(self) -> str:
         """
         Obtiene el título de la página de checkout.
         """
-        return self.driver.find_element(*self._TITLE).text
+        return self.elements.text(self._TITLE)
     
     def error_message_displayed(self) -> bool:
         """
         Verifica si se muestra un mensaje de error en la página de checkout.
         """
-        try:
-            self.wait.until(EC.visibility_of_element_located(self._ERROR_MESSAGE))
-            return True
-        except:
-            return False
+        error = expect_present(
+            self.driver,
+            self._ERROR_MESSAGE,
+            timeout=config.SELENIUM_EXPLICIT_WAIT,
+            visible=True,
+        )
+        return error is not None
         
     def shipping_info_is_displayed(self) -> bool:
         """
@@ -96,16 +142,22 @@ class CheckoutPage:
         """
         return self.driver.find_elements(*self._CHECKOUT_ITEMS)
         
+    def get_checkout_item_rows(self):
+        """
+        Obtiene nombre, precio, descripción y cantidad de cada artículo del
+        checkout en una sola llamada al driver.
+        """
+        return read_rows(self.driver, self._CHECKOUT_ITEMS, self._CHECKOUT_ITEM_FIELDS)
+
     def get_checkout_item_names(self):
         """
         Obtiene los nombres de los artículos en la página de checkout.
         """
-        items = self.get_checkout_items()
-        return [item.find_element(*self._CHECKOUT_ITEMS_NAMES).text for item in items]
+        return [row["name"] for row in self.get_checkout_item_rows()]
     
     def click_finish(self):
         """
         Hace clic en el botón "Finish" para completar el checkout.
         """
-        self.driver.find_element(*self._FINISH_BUTTON).click()
+        self.elements.click(self._FINISH_BUTTON, navigates=True)
         return self
\ No newline at end of file
@@ -6,12 +6,19 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from utils import config
+from utils.dom_batch import click, fill, run_actions
+from utils.element_cache import ElementCache
+from utils.session_store import capture_session, inject_session
+from utils.waits import expect_present
+
 
 class LoginPage:
     """
     Clase que representa la página de login de SauceDemo.com.
     """
-    URL = "https://www.saucedemo.com/"
+    URL = config.SAUCEDEMO_URL
+    INVENTORY_URL = URL + "inventory.html"
     _USER_INPUT = (By.ID, "user-name")
     _PASSWORD_INPUT = (By.ID, "password")
     _LOGIN_BUTTON = (By.ID, "login-button")
@@ -20,12 +27,13 @@ class LoginPage:
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        self.elements = ElementCache(driver)
 
     def open(self):
         """
         Abre la página de inicio de sesión.
         """
-        self.driver.get(self.URL)
+        self.elements.navigate(self.URL)
         return self
 
     def enter_username(self, username: str):
@@ -43,38 +51,71 @@ class LoginPage:
         """
         Ingresa la contraseña en el campo correspondiente.
         """
-        element = self.driver.find_element(*self._PASSWORD_INPUT)
-        element.clear()
-        element.send_keys(password)
+        self.elements.send_keys(self._PASSWORD_INPUT, password, clear=True)
         return self
 
     def click_login(self):
         """
         Hace clic en el botón de inicio de sesión.
         """
-        self.driver.find_element(*self._LOGIN_BUTTON).click()
+        self.elements.click(self._LOGIN_BUTTON, navigates=True)
+        return self
+
+    def do_complete_login(self, username: str, password: str, per_key: bool = False):
+        """
+        Realiza el flujo completo de inicio de sesión en una sola llamada al driver.
+        Con per_key=True se tipean las credenciales tecla por tecla.
+        """
+        if per_key:
+            return (
+                self.enter_username(username).enter_password(password).click_login()
+            )
+
+        run_actions(
+            self.driver,
+            [
+                fill(self._USER_INPUT, username),
+                fill(self._PASSWORD_INPUT, password),
+                click(self._LOGIN_BUTTON),
+            ],
+        )
+        self.elements.invalidate()
         return self
 
-    def do_complete_login(self, username: str, password: str):
+    def do_fast_login(self, username: str, password: str):
         """
-        Realiza el flujo completo de inicio de sesión.
+        Inicia sesión inyectando la sesión ya capturada del usuario y abre el inventario.
+        Si no hay sesión guardada o la inyección falla, realiza el login por UI
+        y captura la sesión resultante para los próximos drivers.
         """
-        return self.enter_username(username).enter_password(password).click_login()
+        if inject_session(self.driver, username, self.URL, self.INVENTORY_URL):
+            return self
+
+        self.open().do_complete_login(username, password)
+        if "/inventory.html" in self.driver.current_url:
+            capture_session(self.driver, username)
+        return self
 
     def error_is_displayed(self) -> bool:
         """
         Se verifica si el mensaje de error es visible.
         """
-        try:
-            self.wait.until(EC.visibility_of_element_located(self._ERROR_MESSAGE))
-            return True
-        except Exception:
-            return False
+        error = expect_present(
+            self.driver,
+            self._ERROR_MESSAGE,
+            timeout=config.SELENIUM_EXPLICIT_WAIT,
+            visible=True,
+        )
+        return error is not None
 
     def get_error_message(self) -> str:
         """
         Obtiene el texto del mensaje de error si está presente.
         """
-        if self.error_is_displayed():
-            return self.driver.find_element(*self._ERROR_MESSAGE).text
-        return ""
+        error = expect_present(
+            self.driver,
+            self._ERROR_MESSAGE,
+            timeout=config.SELENIUM_EXPLICIT_WAIT,
+            visible=True,
+        )
+        return error.text if error is not None else ""
@@ -5,6 +5,11 @@ Módulo para página de carrito de compras de https://www.saucedemo.com/
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 
+from pages.login_page import LoginPage
+from utils.dom_batch import read_rows
+from utils.element_cache import ElementCache
+from utils.waits import expect_absent
+
 
 class ShoppingCartPage:
     """
@@ -14,19 +19,39 @@ class ShoppingCartPage:
     _TITLE = (By.CLASS_NAME, "title")
     _CART_ITEMS = (By.CLASS_NAME, "cart_item")
     _ITEM_NAMES = (By.CLASS_NAME, "inventory_item_name")
+    _ITEM_PRICES = (By.CLASS_NAME, "inventory_item_price")
+    _ITEM_DESCRIPTIONS = (By.CLASS_NAME, "inventory_item_desc")
+    _ITEM_QUANTITIES = (By.CLASS_NAME, "cart_quantity")
+    _ITEM_BUTTON = (By.TAG_NAME, "button")
     _CONTINUE_SHOPPING = (By.ID, "continue-shopping")
     _CHECKOUT_BUTTON = (By.ID, "checkout")
     _REMOVE_BUTTONS = (By.CSS_SELECTOR, "button[data-test*='remove']")
+    URL = LoginPage.URL + "cart.html"
+    _ITEM_FIELDS = {
+        "name": (_ITEM_NAMES, "text"),
+        "price": (_ITEM_PRICES, "text"),
+        "description": (_ITEM_DESCRIPTIONS, "text"),
+        "quantity": (_ITEM_QUANTITIES, "text"),
+        "button": (_ITEM_BUTTON, "text"),
+    }
 
     def __init__(self, driver):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
+        self.elements = ElementCache(driver)
+
+    def open(self):
+        """
+        Abre directamente la página del carrito; requiere una sesión iniciada.
+        """
+        self.elements.navigate(self.URL)
+        return self
 
     def get_title(self) -> str:
         """
         Obtiene el título de la página del carrito de compras.
         """
-        return self.driver.find_element(*self._TITLE).text
+        return self.elements.text(self._TITLE)
 
     def get_cart_items(self):
         """
@@ -34,18 +59,30 @@ class ShoppingCartPage:
         """
         return self.driver.find_elements(*self._CART_ITEMS)
 
+    def cart_is_empty(self) -> bool:
+        """
+        Verifica que no queden artículos en el carrito sin pagar la espera implícita completa.
+        """
+        return expect_absent(self.driver, self._CART_ITEMS)
+
+    def get_item_rows(self):
+        """
+        Obtiene nombre, precio, descripción, cantidad y texto del botón de cada
+        artículo del carrito en una sola llamada al driver.
+        """
+        return read_rows(self.driver, self._CART_ITEMS, self._ITEM_FIELDS)
+
     def get_item_names(self):
         """
         Obtiene los nombres de los artículos en el carrito de compras.
         """
-        items = self.get_cart_items()
-        return [item.find_element(*self._ITEM_NAMES).text for item in items]
+        return [row["name"] for row in self.get_item_rows()]
 
     def click_continue_shopping(self):
         """
         Hace clic en el botón de continuar comprando.
         """
-        self.driver.find_element(*self._CONTINUE_SHOPPING).click()
+        self.elements.click(self._CONTINUE_SHOPPING, navigates=True)
         return self
 
     def click_remove_button_by_index(self, index: int):
@@ -63,7 +100,7 @@ class ShoppingCartPage:
         """
         Navega a la página de checkout
         """
-        self.driver.find_element(*self._CHECKOUT_BUTTON).click()
+        self.elements.click(self._CHECKOUT_BUTTON, navigates=True)
         from pages.checkout_page import CheckoutPage
 
         return CheckoutPage(self.driver)
@@ -9,13 +9,33 @@ import pytest
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
+from utils import config
+from utils.api_client import ApiClient
+from utils.cassette import CassetteLibrary, use_cassettes
+from utils.driver_pool import DriverPool
+from utils.fault_proxy import FaultProxy, parse_rules
+from utils.latency_stats import api_latencies
+from utils.local_api import LocalApiServer
+from utils.logger import api_logger, ui_logger
+from utils.perf_baseline import perf_tracker
+from utils.rate_limiter import RateLimiter
+from utils.response_cache import ResponseCache
 from utils.screenshot_saver import take_screenshot
+from utils.static_site import StaticSiteServer
 
+DRIVER_POOL_KEY = pytest.StashKey[DriverPool]()
+API_CLIENT_KEY = pytest.StashKey[ApiClient]()
+CASSETTES_KEY = pytest.StashKey[CassetteLibrary]()
 
-@pytest.fixture(name="selenium_driver", scope="function")
-def selenium_driver():
+REPORTS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "reports")
+)
+API_LATENCY_REPORT = os.path.join(REPORTS_DIR, "api_latency.json")
+
+
+def _create_driver():
     """
-    Fixture para inicializar el driver de Selenium.
+    Crea una instancia nueva de Chrome con la configuración de la suite.
     """
     options = Options()
     options.add_argument("--headless")
@@ -25,35 +45,244 @@ def selenium_driver():
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-extensions")
     options.add_argument("--disable-software-rasterizer")
-    
+
     driver = webdriver.Chrome(options=options)
-    driver.implicitly_wait(20)
-    driver.set_page_load_timeout(30)
-    driver.set_script_timeout(30)
-    
+    driver.implicitly_wait(config.SELENIUM_IMPLICIT_WAIT)
+    driver.set_page_load_timeout(config.SELENIUM_PAGE_LOAD_TIMEOUT)
+    driver.set_script_timeout(config.SELENIUM_SCRIPT_TIMEOUT)
+    return driver
+
+
+@pytest.fixture(name="saucedemo_url", scope="session")
+def saucedemo_url():
+    """
+    Fixture con la URL base de SauceDemo.
+    Con SAUCEDEMO_LOCAL activo sirve la copia local del front end, que no viene
+    en el repositorio: hay que generarla antes (ver README).
+    """
+    if not config.SAUCEDEMO_LOCAL:
+        yield config.SAUCEDEMO_URL
+        return
+
+    try:
+        server = StaticSiteServer(
+            config.SAUCEDEMO_LOCAL_DIR, port=config.SAUCEDEMO_LOCAL_PORT
+        )
+    except FileNotFoundError as e:
+        pytest.fail(
+            "SAUCEDEMO_LOCAL requiere generar el build de SauceDemo "
+            f"(saucelabs/sample-app-web) en SAUCEDEMO_LOCAL_DIR; ver README. {e}"
+        )
+    server.start()
+    ui_logger.info(f"Copia local de SauceDemo servida en {config.SAUCEDEMO_URL}")
+    yield config.SAUCEDEMO_URL
+    server.close()
+
+
+@pytest.fixture(name="driver_pool", scope="session")
+def driver_pool(request, saucedemo_url):
+    """
+    Fixture que mantiene los drivers de Selenium vivos durante toda la sesión.
+    Depende de saucedemo_url para que el sitio esté disponible antes del primer test.
+    """
+    pool = DriverPool(
+        _create_driver,
+        max_uses=config.DRIVER_POOL_MAX_USES,
+        prewarm=config.DRIVER_POOL_PREWARM,
+    )
+    request.config.stash[DRIVER_POOL_KEY] = pool
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(name="selenium_driver", scope="function")
+def selenium_driver(driver_pool):
+    """
+    Fixture que entrega un driver del pool y lo reinicia al terminar el test.
+    """
+    driver = driver_pool.acquire()
     yield driver
-    driver.quit()
+    driver_pool.release(driver)
+
+
+@pytest.fixture(name="api_base_url", scope="session")
+def api_base_url():
+    """
+    Fixture con la URL base de la API bajo prueba.
+    Con API_LOCAL activo inicia el reemplazo local de JSONPlaceholder y con
+    API_FAULT_RULES interpone el proxy de fallas delante de la API. En replay
+    de cassettes no se inicia ninguno: las respuestas no salen de la red.
+    """
+    servers = []
+    url = config.API_URL
+    if config.API_CASSETTE_MODE == "replay":
+        yield url
+        return
+
+    if config.API_LOCAL:
+        servers.append(LocalApiServer())
+        url = servers[-1].start()
+        api_logger.info(f"Servidor local de API iniciado en {url}")
+
+    if config.API_FAULT_RULES:
+        servers.append(FaultProxy(url, parse_rules(config.API_FAULT_RULES)))
+        url = servers[-1].start()
+        api_logger.info(f"Proxy de fallas delante de la API en {url}")
+
+    yield url
+
+    for server in reversed(servers):
+        if isinstance(server, FaultProxy):
+            api_logger.info(f"Proxy de fallas: {server.stats.summary()}")
+        server.close()
+
+
+@pytest.fixture(name="api_client", scope="session")
+def api_client(request, api_base_url):
+    """
+    Fixture que comparte un cliente HTTP con conexiones keep-alive entre las pruebas de API.
+    Con API_CACHE activo, los GET repetidos se responden desde la caché de la sesión
+    y con API_RATE_LIMIT los requests respetan esa tasa máxima. Con API_SWEEP o
+    LOAD_TEST el pool admite las conexiones simultáneas del recorrido
+    (API_SWEEP_CONCURRENCY) o de los usuarios virtuales (LOAD_USERS).
+    """
+    cache = None
+    if config.API_CACHE:
+        cache = ResponseCache(config.API_CACHE_TTL, config.API_CACHE_SIZE)
+        api_logger.info(
+            f"Caché de respuestas GET activa (TTL {config.API_CACHE_TTL}s, "
+            f"{config.API_CACHE_SIZE} entradas)"
+        )
+    rate_limiter = None
+    if config.API_RATE_LIMIT > 0:
+        rate_limiter = RateLimiter(
+            config.API_RATE_LIMIT, config.API_RATE_BURST, config.API_RATE_RETRIES
+        )
+        api_logger.info(f"Límite de tasa de API: {config.API_RATE_LIMIT} req/s")
+    pool_size = config.API_POOL_SIZE
+    if config.API_SWEEP:
+        pool_size = max(pool_size, config.API_SWEEP_CONCURRENCY)
+    if config.LOAD_TEST:
+        pool_size = max(pool_size, config.LOAD_USERS)
+    client = ApiClient(
+        base_url=api_base_url,
+        pool_size=pool_size,
+        cache=cache,
+        rate_limiter=rate_limiter,
+    )
+    cassettes = request.config.stash.get(CASSETTES_KEY, None)
+    if cassettes is not None:
+        api_logger.info(f"Cassettes de API en modo {cassettes.mode}")
+        use_cassettes(client, cassettes)
+    request.config.stash[API_CLIENT_KEY] = client
+    yield client
+    api_logger.info(client.stats.summary())
+    if cache is not None:
+        api_logger.info(f"Caché de respuestas: {cache.summary()}")
+    if rate_limiter is not None:
+        api_logger.info(f"Limitador de tasa: {rate_limiter.summary()}")
+    client.close()
+
+
+def pytest_configure(config):
+    """
+    Hook de pytest que prepara los cassettes de API si hay un modo activo.
+    """
+    # El parámetro config de pytest oculta el módulo de configuración de la suite
+    from utils import config as suite_config
+
+    if suite_config.API_CASSETTE_MODE != "off":
+        config.stash[CASSETTES_KEY] = CassetteLibrary(
+            suite_config.API_CASSETTE_DIR,
+            suite_config.API_CASSETTE_MODE,
+            replay_latency=suite_config.API_CASSETTE_LATENCY,
+        )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """
+    Hook de pytest que asocia al test las latencias registradas desde su setup
+    y activa el cassette de API de su módulo.
+    """
+    perf_tracker.begin(item.nodeid)
+    cassettes = item.config.stash.get(CASSETTES_KEY, None)
+    if cassettes is not None:
+        cassettes.select(item.path.stem)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item):
     """
-    Hook de pytest que captura screenshots cuando un test falla.
+    Hook de pytest que captura screenshots cuando un test falla y marca las
+    regresiones de performance respecto de la línea base.
     """
     # Ejecutar todas las demás hooks para obtener el resultado
     outcome = yield
     report = outcome.get_result()
 
+    if report.when == "call":
+        regressions = perf_tracker.finish(item.nodeid)
+        if regressions:
+            detalle = "; ".join(str(regression) for regression in regressions)
+            report.user_properties.append(("perf_regression", detalle))
+            if config.PERF_FAIL_ON_REGRESSION and report.passed:
+                report.outcome = "failed"
+                report.longrepr = f"Regresión de performance: {detalle}"
+
     # Verificamos si estamos en la fase de call y si ha fallado el test
     if report.when == "call" and report.failed:
         driver = item.funcargs.get("selenium_driver")
 
         if driver:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            base_dir = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "reports", "screenshots")
-            )
+            base_dir = os.path.join(REPORTS_DIR, "screenshots")
             screenshot_route = os.path.join(
                 base_dir, f"failure_{item.name}_{timestamp}.png"
             )
             take_screenshot(driver, screenshot_route)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """
+    Hook de pytest que muestra las métricas de drivers, conexiones HTTP y latencias al final de la sesión.
+    """
+    pool = config.stash.get(DRIVER_POOL_KEY, None)
+    if pool is not None:
+        terminalreporter.write_sep("-", "Pool de drivers")
+        terminalreporter.write_line(pool.metrics.summary())
+
+    client = config.stash.get(API_CLIENT_KEY, None)
+    if client is not None:
+        terminalreporter.write_sep("-", "Conexiones HTTP de API")
+        terminalreporter.write_line(client.stats.summary())
+        if client.cache is not None:
+            terminalreporter.write_line(f"Caché de GET: {client.cache.summary()}")
+        if client.rate_limiter is not None:
+            terminalreporter.write_line(
+                f"Limitador de tasa: {client.rate_limiter.summary()}"
+            )
+
+    if perf_tracker.regressions:
+        terminalreporter.write_sep("-", "Regresiones de performance", yellow=True)
+        for regression in perf_tracker.regressions:
+            terminalreporter.write_line(f"{regression.test_id} -> {regression}")
+
+    if api_latencies:
+        terminalreporter.write_sep("-", "Latencias de API (p50/p90/p99/máx)")
+        terminalreporter.write_line(api_latencies.summary())
+        terminalreporter.write_line(f"Reporte: {API_LATENCY_REPORT}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Hook de pytest que guarda los percentiles de latencia de API de la sesión,
+    actualiza la línea base de performance y escribe los cassettes grabados.
+    """
+    if api_latencies:
+        api_latencies.write_report(API_LATENCY_REPORT)
+    perf_tracker.save()
+
+    cassettes = session.config.stash.get(CASSETTES_KEY, None)
+    if cassettes is not None:
+        cassettes.save()
@@ -0,0 +1,65 @@
+"""
+Prueba de carga que reutiliza los escenarios de test_json_placeholder.py.
+Se habilita con LOAD_TEST=1 y se configura con las variables LOAD_*.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import pytest_check as check
+from utils import config
+from utils.api_scenarios import load_scenarios
+from utils.load_runner import run_load
+from utils.logger import api_logger
+
+ESCENARIOS_JSON_PATH = Path(__file__).parent.parent / "data" / "escenarios_api.json"
+LOAD_REPORT_PATH = Path(__file__).parent.parent / "reports" / "load_report.json"
+
+
+@pytest.mark.load
+@pytest.mark.api
+@pytest.mark.skipif(
+    not config.LOAD_TEST, reason="Prueba de carga deshabilitada (LOAD_TEST=1)"
+)
+def test_api_scenarios_should_keep_error_rate_low_when_under_load(api_client):
+    """
+    Prueba de carga sobre los escenarios de API.
+    Verifica que la tasa de error se mantenga bajo LOAD_MAX_ERROR_RATE y deja
+    throughput y percentiles de latencia por endpoint en load_report.json.
+    """
+    api_logger.info(
+        f"Iniciando prueba de carga: {config.LOAD_USERS} usuarios, "
+        f"ramp-up {config.LOAD_RAMP_UP}s, duración {config.LOAD_DURATION}s, "
+        f"RPS objetivo {config.LOAD_TARGET_RPS or 'sin límite'}"
+    )
+
+    # Arrange
+    # El cliente de la sesión (cassettes, limitador de tasa y estadísticas de
+    # conexiones) ya tiene un pool de LOAD_USERS conexiones con LOAD_TEST activo
+    escenarios = load_scenarios(str(ESCENARIOS_JSON_PATH)).values()
+
+    # Act
+    result = run_load(
+        api_client,
+        escenarios,
+        users=config.LOAD_USERS,
+        duration=config.LOAD_DURATION,
+        ramp_up=config.LOAD_RAMP_UP,
+        target_rps=config.LOAD_TARGET_RPS,
+    )
+
+    LOAD_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    LOAD_REPORT_PATH.write_text(json.dumps(result.to_dict(), indent=2), encoding="utf-8")
+    api_logger.info(f"Resultado de la prueba de carga:\n{result.summary()}")
+
+    # Assert
+    check.greater(result.requests, 0, "La prueba de carga no envió ningún request")
+    check.less_equal(
+        result.error_rate,
+        config.LOAD_MAX_ERROR_RATE,
+        f"Tasa de error bajo carga demasiado alta: {result.error_rate:.2%} "
+        f"(máximo {config.LOAD_MAX_ERROR_RATE:.2%})",
+    )
+
+    api_logger.info("Prueba de carga completada")
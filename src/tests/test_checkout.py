@@ -8,6 +8,7 @@ import pytest
 import pytest_check as check
 
 from pages.catalog_page import CatalogPage
+from pages.checkout_page import CheckoutPage
 from utils.csv_reader import CSVReader
 from utils.json_reader import JSONReader
 from utils.logger import ui_logger
@@ -17,6 +18,8 @@ PRODUCTOS_JSON_PATH = Path(__file__).parent.parent / "data" / "productos.json"
 json_reader = JSONReader(str(PRODUCTOS_JSON_PATH))
 NOMBRES_PRODUCTOS = json_reader.read_field_as_tuples("nombre")
 PRODUCTOS_COMPLETOS = json_reader.read_as_dicts()
+IDS_PRODUCTOS = json_reader.read_field_as_tuples("id")
+ID_POR_NOMBRE = {producto["nombre"]: producto["id"] for producto in PRODUCTOS_COMPLETOS}
 
 # Cargar datos de checkout desde el archivo CSV
 CHECKOUT_CSV_PATH = Path(__file__).parent.parent / "data" / "checkout.csv"
@@ -36,7 +39,7 @@ def test_checkout_should_display_correct_title_when_user_navigates_to_checkout(
 
     # Arrange
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1])
     cart_page = catalog_page.go_to_cart()
     ui_logger.debug("Navegando a checkout")
 
@@ -68,9 +71,8 @@ def test_checkout_should_work_when_information_provided(
 
     # Arrange
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
-    cart_page = catalog_page.go_to_cart()
-    checkout_page = cart_page.go_to_checkout()
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1], reload=False)
+    checkout_page = CheckoutPage(selenium_driver).open()
     ui_logger.debug("En pagina de checkout")
 
     # Act
@@ -107,9 +109,8 @@ def test_checkout_should_return_to_cart_when_cancel_button_clicked(selenium_driv
 
     # Arrange
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
-    cart_page = catalog_page.go_to_cart()
-    checkout_page = cart_page.go_to_checkout()
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1], reload=False)
+    checkout_page = CheckoutPage(selenium_driver).open()
     ui_logger.debug("En pagina de checkout")
 
     # Act
@@ -135,8 +136,9 @@ def test_checkout_overview_should_display_payment_and_shipping_info(selenium_dri
     )
 
     # Arrange
+    # Flujo real del usuario: carrito -> Checkout -> formulario -> Continue
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1])
     cart_page = catalog_page.go_to_cart()
     checkout_page = cart_page.go_to_checkout()
 
@@ -173,13 +175,10 @@ def test_checkout_overview_should_display_added_product(
     # Arrange
     catalog_page = CatalogPage(selenium_driver)
     ui_logger.info(f"Agregando producto: {nombre_producto}")
-    catalog_page.add_product_to_cart_by_name(nombre_producto)
-    cart_page = catalog_page.go_to_cart()
-    checkout_page = cart_page.go_to_checkout()
+    catalog_page.seed_cart([ID_POR_NOMBRE[nombre_producto]], reload=False)
 
     # Act
-    checkout_page.fill_out_checkout_info("John", "Doe", "12345")
-    checkout_page.click_continue()
+    checkout_page = CheckoutPage(selenium_driver).open_overview()
     item_names = checkout_page.get_checkout_item_names()
     ui_logger.info(f"Productos en checkout: {item_names}")
 
@@ -208,15 +207,10 @@ def test_checkout_overview_should_display_multiple_products_when_multiple_added(
     expected_count = len(PRODUCTOS_COMPLETOS)
 
     ui_logger.info(f"Agregando {expected_count} productos al carrito")
-    for producto in PRODUCTOS_COMPLETOS:
-        catalog_page.add_product_to_cart_by_name(producto["nombre"])
-
-    cart_page = catalog_page.go_to_cart()
-    checkout_page = cart_page.go_to_checkout()
+    catalog_page.seed_cart(IDS_PRODUCTOS, reload=False)
 
     # Act
-    checkout_page.fill_out_checkout_info("John", "Doe", "12345")
-    checkout_page.click_continue()
+    checkout_page = CheckoutPage(selenium_driver).open_overview()
     checkout_items = checkout_page.get_checkout_items()
     ui_logger.info(f"Productos en checkout overview: {len(checkout_items)}")
 
@@ -237,15 +231,16 @@ def test_checkout_should_complete_when_finish_button_clicked(selenium_driver):
     ui_logger.info("Iniciando test_checkout_should_complete_when_finish_button_clicked")
 
     # Arrange
+    # Flujo completo sin atajos: el formulario del paso uno lleva al overview
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1])
     cart_page = catalog_page.go_to_cart()
     checkout_page = cart_page.go_to_checkout()
-
-    # Act
     ui_logger.info("Completando proceso de checkout")
     checkout_page.fill_out_checkout_info("John", "Doe", "12345")
     checkout_page.click_continue()
+
+    # Act
     ui_logger.info("Haciendo clic en boton Finish")
     checkout_page.click_finish()
 
@@ -267,13 +262,10 @@ def test_checkout_overview_should_display_correct_title(selenium_driver):
 
     # Arrange
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
-    cart_page = catalog_page.go_to_cart()
-    checkout_page = cart_page.go_to_checkout()
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1], reload=False)
 
     # Act
-    checkout_page.fill_out_checkout_info("John", "Doe", "12345")
-    checkout_page.click_continue()
+    checkout_page = CheckoutPage(selenium_driver).open_overview()
     title = checkout_page.get_title()
     ui_logger.info(f"Titulo de overview: {title}")
 
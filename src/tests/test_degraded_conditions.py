@@ -0,0 +1,204 @@
+"""
+Tests de comportamiento bajo condiciones de red degradadas.
+Interponen el proxy de fallas entre el cliente y el servidor local de API (o el
+sitio de SauceDemo) para verificar que timeouts, errores 5xx, conexiones
+cortadas y respuestas lentas se detectan y se informan como corresponde.
+Se habilita con DEGRADED_TEST=1. Las latencias inyectadas no se registran en
+los histogramas de la sesión ni en la línea base de performance.
+"""
+
+import time
+
+import pytest
+import pytest_check as check
+import requests
+from selenium.common.exceptions import TimeoutException
+from utils import config
+from utils.api_client import ApiClient
+from utils.api_schemas import COMMENT_SCHEMA, POST_SCHEMA
+from utils.api_utils import validate_api_list_stream, validate_api_response
+from utils.fault_proxy import FaultProxy, FaultRule
+from utils.local_api import LocalApiServer
+from utils.logger import api_logger, ui_logger
+
+pytestmark = [
+    pytest.mark.degraded,
+    pytest.mark.skipif(
+        not config.DEGRADED_TEST,
+        reason="Pruebas bajo red degradada deshabilitadas (DEGRADED_TEST=1)",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def upstream_api():
+    """
+    Fixture con un servidor local de API propio del módulo, detrás de cada proxy.
+    """
+    server = LocalApiServer()
+    url = server.start()
+    yield url
+    server.close()
+
+
+@pytest.fixture
+def degraded_api(upstream_api):
+    """
+    Fixture factory: inicia un proxy con las reglas indicadas y retorna un
+    ApiClient apuntando a él. Cierra clientes y proxies al terminar el test.
+    """
+    created = []
+
+    def _build(*rules, timeout=config.API_TIMEOUT):
+        proxy = FaultProxy(upstream_api, rules, seed=1)
+        client = ApiClient(base_url=proxy.start(), timeout=timeout)
+        created.append((proxy, client))
+        return client
+
+    yield _build
+
+    for proxy, client in created:
+        api_logger.info(f"Proxy de fallas: {proxy.stats.summary()}")
+        client.close()
+        proxy.close()
+
+
+@pytest.mark.api
+def test_get_post_should_raise_timeout_when_latency_exceeds_client_timeout(
+    degraded_api,
+):
+    """
+    Test que verifica que una latencia mayor al timeout del cliente corta el request.
+    """
+    # Arrange
+    client = degraded_api(FaultRule(pattern="^/posts", latency=3.0), timeout=0.5)
+
+    # Act
+    started = time.perf_counter()
+    with pytest.raises(requests.exceptions.Timeout):
+        client.get("/posts/1")
+    waited = time.perf_counter() - started
+
+    # Assert
+    check.less(
+        waited,
+        2.0,
+        f"El cliente esperó {waited:.2f}s: no respetó el timeout de 0.5s",
+    )
+
+
+@pytest.mark.api
+def test_get_post_should_report_injected_latency_when_route_is_slow(degraded_api):
+    """
+    Test que verifica que la latencia inyectada se refleja en el tiempo medido
+    y que solo afecta a las rutas que coinciden con la regla.
+    """
+    # Arrange
+    latency = 1.0
+    client = degraded_api(FaultRule(pattern="^/posts/1$", latency=latency))
+
+    # Act
+    slow = client.get("/posts/1")
+    fast = client.get("/posts/2")
+
+    # Assert
+    validate_api_response(
+        slow, 200, schema=POST_SCHEMA, max_time=5.0, record_latency=False
+    )
+    validate_api_response(
+        fast, 200, schema=POST_SCHEMA, max_time=5.0, record_latency=False
+    )
+    slow_time = slow.elapsed.total_seconds()
+    fast_time = fast.elapsed.total_seconds()
+    check.greater_equal(
+        slow_time, latency, f"La latencia inyectada no se reflejó: {slow_time:.3f}s"
+    )
+    check.less(
+        fast_time,
+        slow_time / 2,
+        f"Una ruta sin regla fue demorada: {fast_time:.3f}s contra {slow_time:.3f}s",
+    )
+
+
+@pytest.mark.api
+def test_get_post_should_return_503_when_server_error_is_injected(degraded_api):
+    """
+    Test que verifica que los errores 5xx inyectados llegan al cliente con su status.
+    """
+    # Arrange
+    client = degraded_api(FaultRule(pattern="^/posts", error_rate=1.0))
+
+    # Act
+    response = client.get("/posts/1")
+
+    # Assert
+    body = validate_api_response(response, 503, {"error"}, record_latency=False)
+    check.is_in("error", body or {}, "La respuesta de error no tiene detalle")
+
+
+@pytest.mark.api
+def test_get_post_should_raise_connection_error_when_connection_is_dropped(
+    degraded_api,
+):
+    """
+    Test que verifica que una conexión cortada sin respuesta se informa como
+    error de conexión y no como una respuesta vacía.
+    """
+    # Arrange
+    client = degraded_api(FaultRule(pattern="^/posts", drop_rate=1.0))
+
+    # Act / Assert
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client.get("/posts/1")
+
+
+@pytest.mark.api
+def test_get_comments_should_take_longer_when_bandwidth_is_limited(degraded_api):
+    """
+    Test que verifica que el límite de ancho de banda demora la descarga del body.
+    elapsed solo mide hasta los headers: el tiempo total se mide aparte.
+    """
+    # Arrange
+    bandwidth = 300_000
+    client = degraded_api(FaultRule(pattern="^/comments$", bandwidth=bandwidth))
+
+    # Act
+    started = time.perf_counter()
+    response = client.get("/comments", stream=True)
+    total_items = validate_api_list_stream(
+        response, 200, schema=COMMENT_SCHEMA, record_latency=False
+    )
+    download_time = time.perf_counter() - started
+
+    # Assert
+    expected_time = int(response.headers["Content-Length"]) / bandwidth
+    check.equal(total_items, 500, f"Cantidad de comentarios: {total_items}")
+    check.greater_equal(
+        download_time,
+        expected_time * 0.8,
+        f"La descarga tardó {download_time:.2f}s con un límite que exige "
+        f"~{expected_time:.2f}s",
+    )
+
+
+@pytest.mark.ui
+def test_login_page_should_time_out_when_site_is_slower_than_page_load_timeout(
+    selenium_driver, saucedemo_url
+):
+    """
+    Test que verifica que Chrome corta la carga de una página más lenta que su
+    page load timeout, sirviendo SauceDemo a través del proxy de fallas.
+    """
+    # Arrange
+    proxy = FaultProxy(saucedemo_url, [FaultRule(latency=3.0)], seed=1)
+    url = proxy.start()
+    selenium_driver.set_page_load_timeout(1)
+
+    # Act / Assert
+    try:
+        ui_logger.info(f"Cargando {url} con 3s de latencia y timeout de 1s")
+        with pytest.raises(TimeoutException):
+            selenium_driver.get(url)
+    finally:
+        selenium_driver.set_page_load_timeout(config.SELENIUM_PAGE_LOAD_TIMEOUT)
+        proxy.close()
@@ -0,0 +1,130 @@
+"""
+Tests unitarios del pool de drivers de utils/driver_pool.py.
+Usan un driver falso en lugar de Chrome.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+import pytest_check as check
+
+from utils.driver_pool import DriverPool
+
+
+class FakeDriver:
+    """
+    Driver mínimo que acepta los comandos del reinicio de estado del pool.
+    """
+
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.switch_to = SimpleNamespace(window=lambda handle: None)
+        self.quit_calls = 0
+
+    def execute_script(self, script):
+        return None
+
+    def execute_cdp_cmd(self, command, params):
+        return {}
+
+    def get(self, url):
+        return None
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def _factory(delay: float = 0.0):
+    created = []
+    lock = threading.Lock()
+
+    def factory():
+        time.sleep(delay)
+        driver = FakeDriver()
+        with lock:
+            created.append(driver)
+        return driver
+
+    factory.created = created
+    return factory
+
+
+@pytest.mark.unit
+def test_acquire_should_reuse_released_driver_when_pool_has_idle_driver():
+    """
+    Test que verifica que un driver devuelto se reutiliza y se cuenta como tal.
+    """
+    # Arrange
+    factory = _factory()
+    pool = DriverPool(factory, max_uses=10)
+
+    # Act
+    first = pool.acquire()
+    pool.release(first)
+    second = pool.acquire()
+    pool.release(second)
+    pool.close()
+
+    # Assert
+    metrics = pool.metrics
+    check.is_true(first is second, "No se reutilizó el driver devuelto")
+    check.equal(len(factory.created), 1, "Se crearon drivers de más")
+    check.equal((metrics.acquisitions, metrics.reused), (2, 1), "Métricas de reúso")
+    check.equal(first.quit_calls, 1, "El driver no se cerró al cerrar el pool")
+
+
+@pytest.mark.unit
+def test_acquire_should_recycle_driver_when_max_uses_is_reached():
+    """
+    Test que verifica que un driver se cierra al alcanzar la cantidad máxima de usos.
+    """
+    # Arrange
+    factory = _factory()
+    pool = DriverPool(factory, max_uses=2)
+
+    # Act
+    for _ in range(3):
+        pool.release(pool.acquire())
+    pool.close()
+
+    # Assert
+    check.equal(len(factory.created), 2, "El driver no se recicló tras 2 usos")
+    check.equal(factory.created[0].quit_calls, 1, "El driver reciclado no se cerró")
+    check.equal(pool.metrics.cold_starts, 2, "Arranques en frío")
+
+
+@pytest.mark.unit
+def test_metrics_should_add_up_when_tests_acquire_concurrently_with_prewarm():
+    """
+    Test que verifica que con el hilo de precalentamiento y varias pruebas
+    pidiendo drivers a la vez, cada entrega se cuenta una sola vez.
+    """
+    # Arrange
+    factory = _factory(delay=0.002)
+    pool = DriverPool(factory, max_uses=5, prewarm=True)
+    rounds = 50
+
+    def use_driver(_):
+        pool.release(pool.acquire())
+
+    # Act
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use_driver, range(rounds)))
+    pool.close()
+
+    # Assert
+    metrics = pool.metrics
+    check.equal(metrics.acquisitions, rounds, "Entregas contadas")
+    check.equal(
+        metrics.reused + metrics.prewarmed + metrics.cold_starts,
+        rounds,
+        f"Las métricas no suman las entregas: {metrics.summary()}",
+    )
+    check.equal(
+        sum(driver.quit_calls for driver in factory.created),
+        len(factory.created),
+        "Cada driver creado debe cerrarse una vez",
+    )
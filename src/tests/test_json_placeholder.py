@@ -2,17 +2,40 @@
 Tests para endpoints de API en https://jsonplaceholder.typicode.com/
 """
 
+from pathlib import Path
+
 import pytest
-import requests
 import pytest_check as check
+from utils import config
 from utils.logger import api_logger
-from utils.api_utils import validate_api_response
+from utils.api_scenarios import ScenarioRunner, load_scenarios
+from utils.api_schemas import COMMENT_SCHEMA, PHOTO_SCHEMA, POST_SCHEMA
+from utils.api_utils import validate_api_list_stream, validate_api_response
+
+# Cargar escenarios de API desde el archivo JSON
+ESCENARIOS_JSON_PATH = Path(__file__).parent.parent / "data" / "escenarios_api.json"
+ESCENARIOS = load_scenarios(str(ESCENARIOS_JSON_PATH))
+
 
-API_URL = "https://jsonplaceholder.typicode.com"
+@pytest.fixture(scope="module")
+def scenario_runner(api_client):
+    """
+    Fixture que ejecuta los escenarios de API.
+    Con API_CONCURRENT activo, todos los escenarios se envían en paralelo antes
+    del primer test y cada test valida la respuesta que le corresponde.
+    """
+    runner = ScenarioRunner(api_client)
+    if config.API_CONCURRENT:
+        api_logger.info(
+            f"Ejecutando {len(ESCENARIOS)} escenarios en paralelo "
+            f"(concurrencia máxima: {config.API_CONCURRENCY})"
+        )
+        runner.prefetch(ESCENARIOS.values(), config.API_CONCURRENCY)
+    return runner
 
 
 @pytest.mark.api
-def test_get_all_posts_should_return_list_when_endpoint_is_called():
+def test_get_all_posts_should_return_list_when_endpoint_is_called(scenario_runner):
     """
     Prueba GET para obtener todos los posts.
     Verifica que la API retorne una lista de posts con la estructura correcta.
@@ -22,15 +45,16 @@ def test_get_all_posts_should_return_list_when_endpoint_is_called():
     )
 
     # Arrange
-    endpoint = f"{API_URL}/posts"
-    expected_fields = {"userId", "id", "title", "body"}
+    escenario = ESCENARIOS["get_all_posts"]
+    endpoint = escenario["endpoint"]
+    expected_fields = set(escenario["campos_esperados"])
 
     # Act
     api_logger.info(f"Realizando GET a {endpoint}")
-    response = requests.get(endpoint, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
-    body = validate_api_response(response, 200, expected_fields)
+    body = validate_api_response(response, 200, expected_fields, schema=POST_SCHEMA)
 
     check.is_not_none(body, "La respuesta no contiene datos")
     check.is_true(isinstance(body, list), "La respuesta no es una lista")
@@ -40,7 +64,36 @@ def test_get_all_posts_should_return_list_when_endpoint_is_called():
 
 
 @pytest.mark.api
-def test_get_single_post_should_return_post_when_valid_id_provided():
+@pytest.mark.parametrize(
+    "endpoint, schema",
+    [("/photos", PHOTO_SCHEMA), ("/comments", COMMENT_SCHEMA)],
+    ids=["photos", "comments"],
+)
+def test_get_large_collection_should_return_valid_items_when_streamed(
+    api_client, endpoint, schema
+):
+    """
+    Prueba GET de una colección grande validada en streaming.
+    Verifica que todos los elementos de la lista tengan los campos esperados.
+    """
+    api_logger.info(
+        "Iniciando test_get_large_collection_should_return_valid_items_when_streamed"
+    )
+
+    # Act
+    api_logger.info(f"Realizando GET a {endpoint} en streaming")
+    response = api_client.get(endpoint, stream=True)
+
+    # Assert
+    total = validate_api_list_stream(response, 200, schema=schema)
+
+    check.greater(total, 0, f"La colección {endpoint} está vacía")
+
+    api_logger.info(f"Test completado exitosamente - {total} elementos validados")
+
+
+@pytest.mark.api
+def test_get_single_post_should_return_post_when_valid_id_provided(scenario_runner):
     """
     Prueba GET para obtener un post específico por ID.
     Verifica que la API retorne un post individual con todos sus campos.
@@ -51,15 +104,16 @@ def test_get_single_post_should_return_post_when_valid_id_provided():
 
     # Arrange
     post_id = 1
-    endpoint = f"{API_URL}/posts/{post_id}"
-    expected_fields = {"userId", "id", "title", "body"}
+    escenario = ESCENARIOS["get_single_post"]
+    endpoint = escenario["endpoint"]
+    expected_fields = set(escenario["campos_esperados"])
 
     # Act
     api_logger.info(f"Realizando GET a {endpoint}")
-    response = requests.get(endpoint, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
-    body = validate_api_response(response, 200, expected_fields)
+    body = validate_api_response(response, 200, expected_fields, schema=POST_SCHEMA)
 
     check.is_not_none(body, "La respuesta no contiene datos")
     check.is_true(isinstance(body, dict), "La respuesta no es un objeto")
@@ -73,7 +127,7 @@ def test_get_single_post_should_return_post_when_valid_id_provided():
 
 
 @pytest.mark.api
-def test_post_create_post_should_return_created_when_valid_data_provided():
+def test_post_create_post_should_return_created_when_valid_data_provided(scenario_runner):
     """
     Prueba POST para crear un nuevo post.
     Verifica que la API cree el recurso y retorne status 201 con el recurso creado.
@@ -83,17 +137,14 @@ def test_post_create_post_should_return_created_when_valid_data_provided():
     )
 
     # Arrange
-    endpoint = f"{API_URL}/posts"
-    new_post = {
-        "title": "Test Post Title",
-        "body": "Este es el contenido del post de prueba",
-        "userId": 1,
-    }
-    expected_fields = {"id", "title", "body", "userId"}
+    escenario = ESCENARIOS["create_post"]
+    endpoint = escenario["endpoint"]
+    new_post = escenario["payload"]
+    expected_fields = set(escenario["campos_esperados"])
 
     # Act
     api_logger.info(f"Realizando POST a {endpoint}")
-    response = requests.post(endpoint, json=new_post, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
     body = validate_api_response(response, 201, expected_fields)
@@ -110,7 +161,7 @@ def test_post_create_post_should_return_created_when_valid_data_provided():
 
 
 @pytest.mark.api
-def test_put_update_post_should_return_updated_when_valid_data_provided():
+def test_put_update_post_should_return_updated_when_valid_data_provided(scenario_runner):
     """
     Prueba PUT para actualizar completamente un post existente.
     Verifica que la API actualice todos los campos del recurso.
@@ -121,18 +172,14 @@ def test_put_update_post_should_return_updated_when_valid_data_provided():
 
     # Arrange
     post_id = 1
-    endpoint = f"{API_URL}/posts/{post_id}"
-    updated_post = {
-        "id": post_id,
-        "title": "Updated Post Title",
-        "body": "Contenido completamente actualizado del post",
-        "userId": 1,
-    }
-    expected_fields = {"id", "title", "body", "userId"}
+    escenario = ESCENARIOS["update_post"]
+    endpoint = escenario["endpoint"]
+    updated_post = escenario["payload"]
+    expected_fields = set(escenario["campos_esperados"])
 
     # Act
     api_logger.info(f"Realizando PUT a {endpoint}")
-    response = requests.put(endpoint, json=updated_post, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
     body = validate_api_response(response, 200, expected_fields)
@@ -153,7 +200,9 @@ def test_put_update_post_should_return_updated_when_valid_data_provided():
 
 
 @pytest.mark.api
-def test_patch_partial_update_post_should_return_updated_when_valid_field_provided():
+def test_patch_partial_update_post_should_return_updated_when_valid_field_provided(
+    scenario_runner,
+):
     """
     Prueba PATCH para actualizar parcialmente un post existente.
     Verifica que la API actualice solo los campos enviados.
@@ -164,13 +213,14 @@ def test_patch_partial_update_post_should_return_updated_when_valid_field_provid
 
     # Arrange
     post_id = 1
-    endpoint = f"{API_URL}/posts/{post_id}"
-    partial_update = {"title": "Título Parcialmente Actualizado"}
-    expected_fields = {"id", "title", "body", "userId"}
+    escenario = ESCENARIOS["patch_post"]
+    endpoint = escenario["endpoint"]
+    partial_update = escenario["payload"]
+    expected_fields = set(escenario["campos_esperados"])
 
     # Act
     api_logger.info(f"Realizando PATCH a {endpoint}")
-    response = requests.patch(endpoint, json=partial_update, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
     body = validate_api_response(response, 200, expected_fields)
@@ -193,7 +243,7 @@ def test_patch_partial_update_post_should_return_updated_when_valid_field_provid
 
 
 @pytest.mark.api
-def test_delete_post_should_return_success_when_valid_id_provided():
+def test_delete_post_should_return_success_when_valid_id_provided(scenario_runner):
     """
     Prueba DELETE para eliminar un post existente.
     Verifica que la API retorne un status exitoso al eliminar el recurso.
@@ -204,11 +254,12 @@ def test_delete_post_should_return_success_when_valid_id_provided():
 
     # Arrange
     post_id = 1
-    endpoint = f"{API_URL}/posts/{post_id}"
+    escenario = ESCENARIOS["delete_post"]
+    endpoint = escenario["endpoint"]
 
     # Act
     api_logger.info(f"Realizando DELETE a {endpoint}")
-    response = requests.delete(endpoint, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
     validate_api_response(response, 200)
@@ -221,7 +272,9 @@ def test_delete_post_should_return_success_when_valid_id_provided():
 
 
 @pytest.mark.api
-def test_get_nonexistent_post_should_return_not_found_when_invalid_id_provided():
+def test_get_nonexistent_post_should_return_not_found_when_invalid_id_provided(
+    scenario_runner,
+):
     """
     Prueba GET con un ID inexistente.
     Verifica que la API maneje correctamente recursos no encontrados.
@@ -231,12 +284,12 @@ def test_get_nonexistent_post_should_return_not_found_when_invalid_id_provided()
     )
 
     # Arrange
-    invalid_id = 99999
-    endpoint = f"{API_URL}/posts/{invalid_id}"
+    escenario = ESCENARIOS["get_nonexistent_post"]
+    endpoint = escenario["endpoint"]
 
     # Act
     api_logger.info(f"Realizando GET a {endpoint} con ID inexistente")
-    response = requests.get(endpoint, timeout=5)
+    response = scenario_runner.run(escenario)
 
     # Assert
     validate_api_response(response, 404)
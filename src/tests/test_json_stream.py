@@ -0,0 +1,148 @@
+"""
+Tests unitarios del recorrido incremental de arrays JSON de utils/json_stream.py.
+Los bloques se arman en memoria para cubrir cada punto de corte posible.
+"""
+
+import json
+
+import pytest
+import pytest_check as check
+
+from utils.json_stream import JSONStreamError, iter_json_array
+
+ITEMS = [
+    {"id": 1, "title": "ñandú «cita» 🚀", "tags": ["a", "b"], "nested": {"x": None}},
+    {"id": 22, "score": -1.5e3, "ok": True},
+    "texto con \\\" escapes \\n",
+    12345,
+    [],
+    {},
+]
+
+
+def _chunks(data: bytes, size: int):
+    return [data[start : start + size] for start in range(0, len(data), size)]
+
+
+@pytest.mark.unit
+def test_iter_json_array_should_yield_same_items_when_split_at_every_byte():
+    """
+    Test que verifica que cortar el flujo en cualquier byte (incluso dentro de
+    un carácter UTF-8 multibyte, un string o un número) no cambia el resultado.
+    """
+    # Arrange
+    data = json.dumps(ITEMS, ensure_ascii=False, indent=2).encode("utf-8")
+
+    for cut in range(1, len(data)):
+        # Act
+        items = list(iter_json_array([data[:cut], data[cut:]]))
+
+        # Assert
+        check.equal(items, ITEMS, f"Resultado distinto al cortar en el byte {cut}")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 64])
+def test_iter_json_array_should_yield_same_items_when_chunks_are_small(size):
+    """
+    Test que verifica el recorrido con bloques de tamaño fijo y pequeño.
+    """
+    # Arrange
+    data = json.dumps(ITEMS, ensure_ascii=False).encode("utf-8")
+
+    # Act
+    items = list(iter_json_array(_chunks(data, size)))
+
+    # Assert
+    check.equal(items, ITEMS, f"Resultado distinto con bloques de {size} bytes")
+
+
+@pytest.mark.unit
+def test_iter_json_array_should_not_truncate_number_when_it_ends_a_chunk():
+    """
+    Test que verifica que un número al final de un bloque espera al siguiente.
+    """
+    # Act
+    items = list(iter_json_array([b"[12", b"34, 5", b"6]"]))
+
+    # Assert
+    check.equal(items, [1234, 56], "Números partidos entre bloques")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"[]"], []),
+        ([b"  \n [ \t ]  "], []),
+        ([b"\xef\xbb\xbf[1]"], [1]),
+        ([b"\xef", b"\xbb\xbf[", b"1]"], [1]),
+        ([b"[1]", b" basura que no se lee"], [1]),
+    ],
+)
+def test_iter_json_array_should_accept_edge_cases_when_array_is_valid(chunks, expected):
+    """
+    Test que verifica arrays vacíos, espacios, BOM (incluso partido) y que no se
+    lee más allá del ']' de cierre.
+    """
+    # Act
+    items = list(iter_json_array(chunks))
+
+    # Assert
+    check.equal(items, expected, f"Resultado incorrecto para {chunks}")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        [b""],
+        [b'{"id": 1}'],
+        [b"[1, 2"],
+        [b"[1, 2,"],
+        [b"[1 2]"],
+        [b"[1,]"],
+        [b"[,1]"],
+        [b'[{"id": 1}, {"id": ', b"2"],
+    ],
+    ids=[
+        "vacio",
+        "objeto",
+        "sin-cierre",
+        "coma-final",
+        "sin-coma",
+        "coma-y-cierre",
+        "coma-inicial",
+        "elemento-cortado",
+    ],
+)
+def test_iter_json_array_should_raise_error_when_array_is_invalid(chunks):
+    """
+    Test que verifica que un contenido que no es un array JSON completo y válido
+    se informa con JSONStreamError (subclase de ValueError).
+    """
+    # Act / Assert
+    with pytest.raises(JSONStreamError):
+        list(iter_json_array(chunks))
+
+
+@pytest.mark.unit
+def test_iter_json_array_should_yield_items_lazily_when_stream_is_consumed():
+    """
+    Test que verifica que cada elemento se entrega sin leer los bloques siguientes.
+    """
+    # Arrange
+    read = []
+
+    def chunks():
+        for chunk in (b"[1,", b"2,", b"3]"):
+            read.append(chunk)
+            yield chunk
+
+    # Act
+    items = iter_json_array(chunks())
+    first = next(items)
+
+    # Assert
+    check.equal(first, 1, "Primer elemento incorrecto")
+    check.equal(read, [b"[1,"], "Se leyeron bloques de más para el primer elemento")
@@ -0,0 +1,146 @@
+"""
+Tests unitarios de los histogramas de latencia de utils/latency_stats.py.
+No usan red ni navegador.
+"""
+
+import json
+
+import pytest
+import pytest_check as check
+
+from utils.latency_stats import (
+    BUCKET_GROWTH,
+    MAX_LATENCY,
+    MIN_LATENCY,
+    LatencyHistogram,
+    LatencyRecorder,
+    endpoint_key,
+)
+
+
+@pytest.mark.unit
+def test_percentile_should_stay_within_bucket_error_when_latencies_are_uniform():
+    """
+    Test que verifica que p50/p90/p99 de 1..1000ms caen dentro del error
+    relativo de un bucket respecto del valor exacto.
+    """
+    # Arrange
+    histogram = LatencyHistogram()
+    samples = [ms / 1000 for ms in range(1, 1001)]
+
+    # Act
+    for seconds in samples:
+        histogram.record(seconds)
+
+    # Assert
+    for fraction, exact in ((0.5, 0.5), (0.9, 0.9), (0.99, 0.99)):
+        value = histogram.percentile(fraction)
+        check.greater_equal(value, exact, f"p{fraction * 100:.0f} por debajo: {value}")
+        check.less_equal(
+            value,
+            exact * BUCKET_GROWTH,
+            f"p{fraction * 100:.0f} fuera del error de un bucket: {value}",
+        )
+    check.equal(histogram.count, 1000, "Cantidad de muestras incorrecta")
+    check.almost_equal(histogram.mean, 0.5005, abs=1e-9)
+
+
+@pytest.mark.unit
+def test_percentile_should_cap_at_max_when_single_sample_is_recorded():
+    """
+    Test que verifica que el límite del bucket se acota por la latencia máxima.
+    """
+    # Arrange
+    histogram = LatencyHistogram()
+
+    # Act
+    histogram.record(0.0123)
+
+    # Assert
+    check.equal(histogram.percentile(0.5), 0.0123, "p50 no acotado por el máximo")
+    check.equal(histogram.percentile(1.0), 0.0123, "p100 no acotado por el máximo")
+
+
+@pytest.mark.unit
+def test_percentile_should_return_zero_when_histogram_is_empty():
+    """
+    Test que verifica que un histograma sin muestras informa ceros.
+    """
+    # Arrange
+    histogram = LatencyHistogram()
+
+    # Act
+    summary = histogram.to_dict()
+
+    # Assert
+    check.equal(histogram.percentile(0.9), 0.0, "p90 de un histograma vacío")
+    check.equal(summary["count"], 0, "count de un histograma vacío")
+    check.equal(summary["mean_ms"], 0.0, "media de un histograma vacío")
+
+
+@pytest.mark.unit
+def test_record_should_clamp_to_edge_buckets_when_latency_is_out_of_range():
+    """
+    Test que verifica que latencias fuera de [MIN_LATENCY, MAX_LATENCY] caen en
+    el primer o el último bucket sin error.
+    """
+    # Arrange
+    histogram = LatencyHistogram()
+
+    # Act
+    histogram.record(0.0)
+    histogram.record(MIN_LATENCY / 10)
+    histogram.record(MAX_LATENCY * 10)
+
+    # Assert
+    check.equal(histogram.counts[0], 2, "Latencias mínimas fuera del primer bucket")
+    check.equal(histogram.counts[-1], 1, "Latencia máxima fuera del último bucket")
+    check.equal(histogram.percentile(1.0), MAX_LATENCY * 10, "p100 distinto al máximo")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "method, url, expected",
+    [
+        ("get", "https://api.test/posts/1", "GET /posts/{id}"),
+        ("GET", "https://api.test/posts/1/comments?x=2", "GET /posts/{id}/comments"),
+        ("DELETE", "http://api/users/10/posts/3", "DELETE /users/{id}/posts/{id}"),
+        ("GET", "https://api.test/posts", "GET /posts"),
+        ("GET", "https://api.test/v2/posts", "GET /v2/posts"),
+        ("GET", "https://api.test", "GET /"),
+    ],
+)
+def test_endpoint_key_should_group_numeric_ids_when_path_has_ids(
+    method, url, expected
+):
+    """
+    Test que verifica que los IDs numéricos pasan a {id} y se ignora la query.
+    """
+    # Act
+    key = endpoint_key(method, url)
+
+    # Assert
+    check.equal(key, expected, f"Clave incorrecta para {url}")
+
+
+@pytest.mark.unit
+def test_recorder_should_group_latencies_by_key_when_reporting(tmp_path):
+    """
+    Test que verifica que el recorder agrupa por clave y escribe el reporte JSON.
+    """
+    # Arrange
+    recorder = LatencyRecorder()
+    report_path = tmp_path / "reports" / "latency.json"
+
+    # Act
+    recorder.record("GET /posts/{id}", 0.010)
+    recorder.record("GET /posts/{id}", 0.020)
+    recorder.record("POST /posts", 0.030)
+    recorder.write_report(report_path)
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+
+    # Assert
+    check.is_true(bool(recorder), "El recorder con muestras debe ser verdadero")
+    check.equal(list(report), ["GET /posts/{id}", "POST /posts"], "Claves del reporte")
+    check.equal(report["GET /posts/{id}"]["count"], 2, "Muestras de GET /posts/{id}")
+    check.almost_equal(report["POST /posts"]["max_ms"], 30.0, abs=1e-9)
@@ -0,0 +1,192 @@
+"""
+Tests unitarios de la línea base de performance de utils/perf_baseline.py.
+Usan un historial en un directorio temporal: no tocan la línea base de la suite.
+"""
+
+import json
+import math
+
+import pytest
+import pytest_check as check
+
+from utils.perf_baseline import BaselineStore, PerfTracker
+
+TEST_ID = "tests/test_x.py::test_y"
+METRIC = "GET /posts/{id}"
+
+
+@pytest.fixture
+def store(tmp_path):
+    """
+    Fixture con un historial vacío en un archivo temporal.
+    """
+    return BaselineStore(tmp_path / "baseline.json", max_history=5)
+
+
+def _tracker(store, **kwargs):
+    options = {"enabled": True, "min_runs": 3, "z_threshold": 3.0, "min_ratio": 1.5}
+    options.update(kwargs)
+    return PerfTracker(store, **options)
+
+
+def _run(tracker, *latencies, metric=METRIC, target=""):
+    """
+    Simula un test que registra las latencias indicadas y retorna sus regresiones.
+    """
+    tracker.begin(TEST_ID)
+    for seconds in latencies:
+        tracker.record(metric, seconds, target)
+    return tracker.finish(TEST_ID)
+
+
+def _seed(store, metric, *seconds):
+    for value in seconds:
+        store.append(f"{TEST_ID}::{metric}", math.log(value))
+
+
+@pytest.mark.unit
+def test_finish_should_report_regression_when_latency_is_far_above_history(store):
+    """
+    Test que verifica que un test mucho más lento que su historial es una regresión.
+    """
+    # Arrange
+    _seed(store, METRIC, 0.100, 0.105, 0.095, 0.100)
+    tracker = _tracker(store)
+
+    # Act
+    regressions = _run(tracker, 0.300, 0.300)
+
+    # Assert
+    check.equal(len(regressions), 1, "Se esperaba una regresión")
+    regression = regressions[0]
+    check.equal(regression.metric, METRIC, "Métrica de la regresión")
+    check.almost_equal(regression.current, 0.300, rel=1e-9)
+    check.almost_equal(regression.ratio, 3.0, rel=0.05)
+    check.greater_equal(regression.z_score, 3.0, "z-score bajo el umbral")
+
+
+@pytest.mark.unit
+def test_finish_should_ignore_slowdown_when_ratio_is_below_minimum(store):
+    """
+    Test que verifica que un historial estable no convierte una variación
+    pequeña (z alto pero menos de min_ratio) en una regresión.
+    """
+    # Arrange
+    _seed(store, METRIC, 0.100, 0.100, 0.100, 0.100)
+    tracker = _tracker(store)
+
+    # Act
+    regressions = _run(tracker, 0.130)
+
+    # Assert
+    check.equal(regressions, [], "x1.3 no supera min_ratio=1.5")
+
+
+@pytest.mark.unit
+def test_finish_should_ignore_slowdown_when_history_is_noisy(store):
+    """
+    Test que verifica que con un historial muy disperso el z-score no alcanza el
+    umbral aunque el cociente supere min_ratio.
+    """
+    # Arrange
+    _seed(store, METRIC, 0.050, 0.400, 0.080, 0.300)
+    tracker = _tracker(store)
+
+    # Act
+    regressions = _run(tracker, 0.300)
+
+    # Assert
+    check.equal(regressions, [], "Un historial disperso no debería marcar regresión")
+
+
+@pytest.mark.unit
+def test_finish_should_not_compare_when_history_has_fewer_than_min_runs(store):
+    """
+    Test que verifica que no se compara sin suficientes ejecuciones previas.
+    """
+    # Arrange
+    _seed(store, METRIC, 0.100, 0.100)
+    tracker = _tracker(store, min_runs=3)
+
+    # Act
+    regressions = _run(tracker, 1.0)
+
+    # Assert
+    check.equal(regressions, [], "Con dos ejecuciones previas no hay comparación")
+
+
+@pytest.mark.unit
+def test_record_should_key_metric_by_target_when_target_is_given(store):
+    """
+    Test que verifica que el historial de otro destino no se usa para comparar.
+    """
+    # Arrange
+    _seed(store, METRIC, 0.010, 0.010, 0.010, 0.010)
+    tracker = _tracker(store)
+
+    # Act
+    regressions = _run(tracker, 0.300, target="https://api.test")
+    tracker.save()
+    saved = json.loads(store.path.read_text(encoding="utf-8"))
+
+    # Assert
+    check.equal(regressions, [], "Se comparó contra el historial de otro destino")
+    check.is_in(f"{TEST_ID}::{METRIC} @ https://api.test", saved, "Clave por destino")
+
+
+@pytest.mark.unit
+def test_record_should_do_nothing_when_tracker_is_disabled_or_outside_test(store):
+    """
+    Test que verifica que sin línea base activa o fuera de un test no se registra nada.
+    """
+    # Arrange
+    disabled = _tracker(store, enabled=False)
+    idle = _tracker(store)
+
+    # Act
+    _run(disabled, 0.100)
+    idle.record(METRIC, 0.100)
+    disabled.save()
+    idle.save()
+
+    # Assert
+    check.is_false(store.path.exists(), "No debería escribirse el historial")
+    check.equal(idle.finish(TEST_ID), [], "Un test no iniciado no tiene muestras")
+
+
+@pytest.mark.unit
+def test_save_should_keep_last_runs_when_history_exceeds_max(store):
+    """
+    Test que verifica que el historial se recorta a max_history y persiste la
+    media geométrica de las muestras de cada ejecución.
+    """
+    # Arrange
+    key = f"{TEST_ID}::{METRIC}"
+    _seed(store, METRIC, *(0.1 * (index + 1) for index in range(5)))
+
+    # Act
+    tracker = _tracker(store)
+    _run(tracker, 0.100, 0.400)
+    tracker.save()
+    history = BaselineStore(store.path).get(key)
+
+    # Assert
+    check.equal(len(history), 5, "El historial no se recortó a max_history")
+    check.almost_equal(history[0], math.log(0.2), rel=1e-9)
+    check.almost_equal(math.exp(history[-1]), 0.200, rel=1e-9)
+
+
+@pytest.mark.unit
+def test_history_should_start_empty_when_file_is_corrupt(tmp_path):
+    """
+    Test que verifica que un archivo de historial dañado no frena la suite.
+    """
+    # Arrange
+    path = tmp_path / "baseline.json"
+    path.write_text("{no es json", encoding="utf-8")
+
+    # Act
+    store = BaselineStore(path)
+
+    # Assert
+    check.equal(store.history, {}, "El historial dañado debería descartarse")
@@ -4,22 +4,19 @@ Simula el flujo real: Crear -> Leer -> Actualizar -> Eliminar (CRUD).
 """
 
 import pytest
-import requests
 import pytest_check as check
 from utils.logger import e2e_logger
 from utils.api_utils import validate_api_response
 
-API_URL = "https://jsonplaceholder.typicode.com"
-
 
 @pytest.fixture(scope="module")
-def created_post():
+def created_post(api_client):
     """
     Fixture que simula la creación de un post.
     """
     e2e_logger.info("Creando post para el ciclo de vida E2E")
 
-    endpoint = f"{API_URL}/posts"
+    endpoint = "/posts"
     payload = {
         "title": "Post para testing E2E",
         "body": "Contenido del post de prueba para el ciclo de vida completo",
@@ -28,7 +25,7 @@ def created_post():
     expected_fields = {"id", "title", "body", "userId"}
 
     e2e_logger.info(f"POST a {endpoint} con payload: {payload}")
-    response = requests.post(endpoint, json=payload, timeout=5)
+    response = api_client.post(endpoint, json=payload)
 
     # Validar la respuesta con la función helper
     post_data = validate_api_response(response, 201, expected_fields)
@@ -75,7 +72,7 @@ def test_post_lifecycle_step_1_create_post_should_return_201_with_id(created_pos
 @pytest.mark.e2e
 @pytest.mark.api
 def test_post_lifecycle_step_2_read_created_post_should_return_200_with_data(
-    created_post,
+    api_client, created_post
 ):
     """
     Paso 2 del ciclo de vida: Leer el post existente.
@@ -85,12 +82,12 @@ def test_post_lifecycle_step_2_read_created_post_should_return_200_with_data(
 
     # Arrange
     post_id = created_post.get("id")
-    endpoint = f"{API_URL}/posts/{post_id}"
+    endpoint = f"/posts/{post_id}"
     expected_fields = {"userId", "id", "title", "body"}
 
     # Act
     e2e_logger.info(f"GET a {endpoint}")
-    response = requests.get(endpoint, timeout=5)
+    response = api_client.get(endpoint)
 
     # Assert
     body = validate_api_response(response, 200, expected_fields)
@@ -105,7 +102,9 @@ def test_post_lifecycle_step_2_read_created_post_should_return_200_with_data(
 
 @pytest.mark.e2e
 @pytest.mark.api
-def test_post_lifecycle_step_3_update_post_with_patch_should_return_200(created_post):
+def test_post_lifecycle_step_3_update_post_with_patch_should_return_200(
+    api_client, created_post
+):
     """
     Paso 3 del ciclo de vida: Actualizar parcialmente el post con PATCH.
     Verifica que el post pueda ser actualizado parcialmente.
@@ -114,13 +113,13 @@ def test_post_lifecycle_step_3_update_post_with_patch_should_return_200(created_
 
     # Arrange
     post_id = created_post.get("id")
-    endpoint = f"{API_URL}/posts/{post_id}"
+    endpoint = f"/posts/{post_id}"
     partial_update = {"title": "Titulo actualizado por QA"}
     expected_fields = {"id", "title", "body", "userId"}
 
     # Act
     e2e_logger.info(f"PATCH a {endpoint} con datos: {partial_update}")
-    response = requests.patch(endpoint, json=partial_update, timeout=5)
+    response = api_client.patch(endpoint, json=partial_update)
 
     # Assert
     body = validate_api_response(response, 200, expected_fields)
@@ -140,7 +139,9 @@ def test_post_lifecycle_step_3_update_post_with_patch_should_return_200(created_
 
 @pytest.mark.e2e
 @pytest.mark.api
-def test_post_lifecycle_step_4_update_post_with_put_should_return_200(created_post):
+def test_post_lifecycle_step_4_update_post_with_put_should_return_200(
+    api_client, created_post
+):
     """
     Paso 4 del ciclo de vida: Actualizar completamente el post con PUT.
     Verifica que el post pueda ser actualizado completamente.
@@ -149,7 +150,7 @@ def test_post_lifecycle_step_4_update_post_with_put_should_return_200(created_po
 
     # Arrange
     post_id = created_post.get("id")
-    endpoint = f"{API_URL}/posts/{post_id}"
+    endpoint = f"/posts/{post_id}"
     full_update = {
         "title": "Post completamente actualizado",
         "body": "Nuevo contenido completo del post despues de PUT",
@@ -159,7 +160,7 @@ def test_post_lifecycle_step_4_update_post_with_put_should_return_200(created_po
 
     # Act
     e2e_logger.info(f"PUT a {endpoint} con datos completos")
-    response = requests.put(endpoint, json=full_update, timeout=5)
+    response = api_client.put(endpoint, json=full_update)
 
     # Assert
     body = validate_api_response(response, 200, expected_fields)
@@ -181,7 +182,9 @@ def test_post_lifecycle_step_4_update_post_with_put_should_return_200(created_po
 
 @pytest.mark.e2e
 @pytest.mark.api
-def test_post_lifecycle_step_5_delete_post_should_return_200(created_post):
+def test_post_lifecycle_step_5_delete_post_should_return_200(
+    api_client, created_post
+):
     """
     Paso 5 del ciclo de vida: Eliminar el post.
     Verifica que el post pueda ser eliminado correctamente.
@@ -190,11 +193,11 @@ def test_post_lifecycle_step_5_delete_post_should_return_200(created_post):
 
     # Arrange
     post_id = created_post.get("id")
-    endpoint = f"{API_URL}/posts/{post_id}"
+    endpoint = f"/posts/{post_id}"
 
     # Act
     e2e_logger.info(f"DELETE a {endpoint}")
-    response = requests.delete(endpoint, timeout=5)
+    response = api_client.delete(endpoint)
 
     # Assert
     validate_api_response(response, 200)
@@ -0,0 +1,97 @@
+"""
+Prueba de soak del ciclo de vida de un post (Crear -> Leer -> PATCH -> PUT -> Eliminar).
+Repite el flujo de test_post_lifecycle.py por SOAK_DURATION segundos o
+SOAK_ITERATIONS ciclos para detectar degradaciones lentas: deriva de latencia,
+rachas de errores y crecimiento de memoria. Se habilita con SOAK_TEST=1.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import pytest_check as check
+from utils import config
+from utils.logger import e2e_logger
+from utils.soak_runner import run_soak
+
+SOAK_REPORT_PATH = Path(__file__).parent.parent / "reports" / "soak_report.json"
+
+# El timeout global de pytest.ini (300s) cortaría la prueba con el SOAK_DURATION por
+# defecto: se extiende a la duración más el último ciclo (5 requests) y el arranque
+# de los servidores locales. Solo con SOAK_ITERATIONS no hay tope de tiempo (0).
+SOAK_TIMEOUT = (
+    config.SOAK_DURATION + 5 * config.API_TIMEOUT + 60
+    if config.SOAK_DURATION > 0
+    else 0
+)
+
+
+@pytest.mark.soak
+@pytest.mark.timeout(SOAK_TIMEOUT)
+@pytest.mark.e2e
+@pytest.mark.api
+@pytest.mark.skipif(
+    not config.SOAK_TEST, reason="Prueba de soak deshabilitada (SOAK_TEST=1)"
+)
+def test_post_lifecycle_should_not_degrade_when_repeated_over_time(api_client):
+    """
+    Prueba de soak del ciclo de vida completo.
+    Verifica la tasa de error, la ausencia de rachas de errores, la deriva del
+    p90 entre la primera y la última ventana y el crecimiento de la memoria
+    residente del proceso, y deja las métricas por ventana en soak_report.json.
+    """
+    e2e_logger.info(
+        f"Iniciando prueba de soak: duración {config.SOAK_DURATION}s, "
+        f"ciclos {config.SOAK_ITERATIONS or 'sin límite'}, "
+        f"ventanas de {config.SOAK_WINDOW}s"
+    )
+
+    # Act
+    result = run_soak(
+        api_client,
+        duration=config.SOAK_DURATION,
+        iterations=config.SOAK_ITERATIONS,
+        window=config.SOAK_WINDOW,
+        burst_threshold=config.SOAK_BURST,
+        # El servidor local guarda los posts creados; JSONPlaceholder no
+        reuse_created=config.API_LOCAL,
+        trace_allocations=config.SOAK_TRACEMALLOC,
+    )
+
+    SOAK_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SOAK_REPORT_PATH.write_text(json.dumps(result.to_dict(), indent=2), encoding="utf-8")
+    e2e_logger.info(f"Resultado de la prueba de soak:\n{result.summary()}")
+
+    # Assert
+    check.greater(result.iterations, 0, "La prueba de soak no completó ningún ciclo")
+    check.less_equal(
+        result.error_rate,
+        config.SOAK_MAX_ERROR_RATE,
+        f"Tasa de error demasiado alta: {result.error_rate:.2%} "
+        f"(máximo {config.SOAK_MAX_ERROR_RATE:.2%})",
+    )
+    check.equal(
+        len(result.bursts),
+        0,
+        f"Rachas de {config.SOAK_BURST} o más errores seguidos: {result.bursts}",
+    )
+    check.less_equal(
+        result.drift(),
+        config.SOAK_MAX_DRIFT,
+        f"El p90 de la última ventana es x{result.drift():.2f} el de la primera "
+        f"(máximo x{config.SOAK_MAX_DRIFT})",
+    )
+    max_growth = config.SOAK_MAX_MEMORY_GROWTH_MB * 1024 * 1024
+    top = (
+        f"Mayor crecimiento: {result.memory_top[:3]}"
+        if result.memory_top
+        else "Con SOAK_TRACEMALLOC=1 se reportan las líneas con mayor crecimiento"
+    )
+    check.less_equal(
+        result.memory_growth,
+        max_growth,
+        f"La memoria del proceso creció {result.memory_growth / 1024 / 1024:.1f} MB "
+        f"(máximo {config.SOAK_MAX_MEMORY_GROWTH_MB} MB). {top}",
+    )
+
+    e2e_logger.info("Prueba de soak completada")
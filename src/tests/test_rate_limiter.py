@@ -0,0 +1,163 @@
+"""
+Tests unitarios del limitador de tasa de utils/rate_limiter.py.
+El reloj y las esperas se simulan: los tests no duermen ni usan la red.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import pytest_check as check
+import requests
+
+from utils import rate_limiter
+from utils.rate_limiter import MAX_BACKOFF, RateLimiter, retry_after
+
+
+def _response(retry_after_header=None):
+    response = requests.Response()
+    response.status_code = 429
+    if retry_after_header is not None:
+        response.headers["Retry-After"] = retry_after_header
+    return response
+
+
+def _http_date(seconds_from_now: float) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds_from_now)
+    return format_datetime(moment, usegmt=True)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Fixture con un reloj simulado: time.sleep avanza el reloj en lugar de dormir.
+    """
+    state = {"now": 100.0, "slept": []}
+
+    def sleep(seconds):
+        state["slept"].append(seconds)
+        state["now"] += seconds
+
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(rate_limiter.time, "sleep", sleep)
+    return state
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, 2.0),
+        ("", 2.0),
+        ("7", 7.0),
+        ("1.5", 1.5),
+        ("-3", 0.0),
+        ("3600", MAX_BACKOFF),
+        ("no es una fecha", 2.0),
+    ],
+)
+def test_retry_after_should_parse_seconds_when_header_is_numeric_or_missing(
+    header, expected
+):
+    """
+    Test que verifica Retry-After en segundos, ausente o inválido (default) y
+    acotado a [0, MAX_BACKOFF].
+    """
+    # Act
+    delay = retry_after(_response(header), default=2.0)
+
+    # Assert
+    check.equal(delay, expected, f"Espera incorrecta para Retry-After={header!r}")
+
+
+@pytest.mark.unit
+def test_retry_after_should_parse_http_date_when_header_is_a_date():
+    """
+    Test que verifica Retry-After como fecha HTTP: futura, pasada y lejana.
+    """
+    # Act
+    future = retry_after(_response(_http_date(10)), default=2.0)
+    past = retry_after(_response(_http_date(-60)), default=2.0)
+    far = retry_after(_response(_http_date(3600)), default=2.0)
+
+    # Assert
+    check.between(future, 8.0, 10.0, f"Espera hasta una fecha futura: {future}")
+    check.equal(past, 0.0, "Una fecha pasada no debe esperar")
+    check.equal(far, MAX_BACKOFF, "La espera no se acotó a MAX_BACKOFF")
+
+
+@pytest.mark.unit
+def test_retry_after_should_cap_default_when_header_is_missing():
+    """
+    Test que verifica que el default también se acota a MAX_BACKOFF.
+    """
+    # Act
+    delay = retry_after(_response(), default=MAX_BACKOFF * 4)
+
+    # Assert
+    check.equal(delay, MAX_BACKOFF, "El default no se acotó a MAX_BACKOFF")
+
+
+@pytest.mark.unit
+def test_backoff_should_grow_exponentially_when_attempts_increase():
+    """
+    Test que verifica el backoff 2^intento / tasa, acotado a MAX_BACKOFF.
+    """
+    # Arrange
+    limiter = RateLimiter(rate=4.0)
+
+    # Act
+    delays = [limiter.backoff(attempt) for attempt in range(10)]
+
+    # Assert
+    check.equal(delays[:4], [0.25, 0.5, 1.0, 2.0], "Backoff de los primeros intentos")
+    check.equal(delays[-1], MAX_BACKOFF, "El backoff no se acotó a MAX_BACKOFF")
+
+
+@pytest.mark.unit
+def test_acquire_should_space_requests_when_burst_is_exhausted(clock):
+    """
+    Test que verifica el token bucket: la ráfaga sale sin esperar y el resto
+    espaciado a 1/tasa.
+    """
+    # Arrange
+    limiter = RateLimiter(rate=10.0, burst=3)
+
+    # Act
+    for _ in range(6):
+        limiter.acquire()
+
+    # Assert
+    check.equal(len(clock["slept"]), 3, f"Esperas: {clock['slept']}")
+    for wait in clock["slept"]:
+        check.almost_equal(wait, 0.1, rel=1e-6)
+    check.almost_equal(limiter.achieved_rate, 5 / 0.3, rel=1e-6)
+    check.equal(limiter.requests, 6, "Cantidad de requests")
+
+
+@pytest.mark.unit
+def test_on_throttled_should_halve_rate_and_pause_when_server_throttles(clock):
+    """
+    Test que verifica que un 429/503 reduce la tasa a la mitad (hasta el mínimo),
+    pausa los envíos y que cada respuesta normal recupera la tasa de a poco.
+    """
+    # Arrange
+    limiter = RateLimiter(rate=16.0, burst=5)
+
+    # Act
+    limiter.on_throttled(delay=2.0, retry=True)
+    halved = limiter.rate
+    limiter.acquire()
+    paused = clock["slept"][-1]
+    for _ in range(10):
+        limiter.on_throttled(delay=0.0, retry=False)
+    floor = limiter.rate
+    for _ in range(100):
+        limiter.on_success()
+
+    # Assert
+    check.equal(halved, 8.0, "La tasa no se redujo a la mitad")
+    check.almost_equal(paused, 2.0, rel=1e-6)
+    check.equal(floor, limiter.min_rate, "La tasa bajó del mínimo")
+    check.equal(limiter.rate, limiter.max_rate, "La tasa no volvió al máximo")
+    check.equal((limiter.throttled, limiter.retried), (11, 1), "Contadores de 429/503")
@@ -0,0 +1,71 @@
+"""
+Recorrido completo de las colecciones de JSONPlaceholder.
+Valida cada elemento de cada colección con concurrencia acotada y reporta un
+resumen por recurso. Se habilita con API_SWEEP=1.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import pytest_check as check
+from utils import config
+from utils.api_schemas import SCHEMAS
+from utils.logger import api_logger
+from utils.resource_sweep import sweep_resource
+
+SWEEP_REPORT_PATH = Path(__file__).parent.parent / "reports" / "sweep_report.json"
+
+pytestmark = [
+    pytest.mark.sweep,
+    pytest.mark.api,
+    pytest.mark.skipif(
+        not config.API_SWEEP,
+        reason="Recorrido de colecciones deshabilitado (API_SWEEP=1)",
+    ),
+]
+
+
+@pytest.fixture(scope="module")
+def sweep_report():
+    """
+    Fixture que junta el resumen de cada recurso y lo escribe en sweep_report.json.
+    """
+    report = {}
+    yield report
+    SWEEP_REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    SWEEP_REPORT_PATH.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+@pytest.mark.parametrize("resource", list(SCHEMAS))
+def test_sweep_collection_should_return_valid_item_when_each_id_is_requested(
+    api_client, sweep_report, resource
+):
+    """
+    Recorrido de una colección: valida la lista y cada elemento pedido por id.
+    Verifica status, Content-Type, esquema, id y tiempo de respuesta de todos.
+    """
+    api_logger.info(
+        f"Recorriendo /{resource} con concurrencia {config.API_SWEEP_CONCURRENCY}"
+    )
+
+    # Act
+    result = sweep_resource(
+        api_client, resource, SCHEMAS[resource], config.API_SWEEP_CONCURRENCY
+    )
+    sweep_report[resource] = result.to_dict()
+    api_logger.info(result.summary())
+
+    # Assert
+    check.greater(result.expected, 0, f"La colección /{resource} está vacía")
+    check.equal(
+        result.requests,
+        result.expected + 1,
+        f"Requests sin respuesta: {result.expected + 1 - result.requests}",
+    )
+    check.equal(
+        result.failures,
+        0,
+        f"{result.failures} respuestas inválidas en /{resource}. Primeras: "
+        + "; ".join(f"{path}: {error}" for path, error in result.details),
+    )
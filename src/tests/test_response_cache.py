@@ -0,0 +1,181 @@
+"""
+Tests unitarios de la caché de respuestas GET de utils/response_cache.py.
+Las respuestas se arman en memoria: no se envía ningún request.
+"""
+
+import pytest
+import pytest_check as check
+import requests
+
+from utils import response_cache
+from utils.response_cache import ResponseCache
+
+BASE_URL = "https://api.test"
+
+
+def _key(path: str, headers=None):
+    request = requests.Request("GET", f"{BASE_URL}{path}", headers=headers)
+    return ResponseCache.key(request.prepare())
+
+
+def _response(status: int = 200, content: bytes = b"{}"):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response._content_consumed = True
+    return response
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """
+    Fixture con un reloj controlado por el test en lugar de time.monotonic.
+    """
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.unit
+def test_get_should_return_copy_marked_from_cache_when_entry_is_fresh(clock):
+    """
+    Test que verifica que un acierto retorna una copia marcada con from_cache.
+    """
+    # Arrange
+    cache = ResponseCache(ttl=30, max_entries=10)
+    original = _response(content=b'{"id": 1}')
+    cache.put(_key("/posts/1"), original)
+
+    # Act
+    cached = cache.get(_key("/posts/1"))
+
+    # Assert
+    check.is_not_none(cached, "La respuesta vigente no se encontró")
+    check.is_false(cached is original, "Se retornó el objeto guardado y no una copia")
+    check.is_true(cached.from_cache, "La copia no está marcada con from_cache")
+    check.equal(cached.json(), {"id": 1}, "Contenido distinto al guardado")
+    check.equal((cache.hits, cache.misses), (1, 0), "Contadores de aciertos/fallos")
+
+
+@pytest.mark.unit
+def test_get_should_miss_when_entry_is_older_than_ttl(clock):
+    """
+    Test que verifica que una entrada vencida se descarta.
+    """
+    # Arrange
+    cache = ResponseCache(ttl=30, max_entries=10)
+    cache.put(_key("/posts/1"), _response())
+
+    # Act
+    clock[0] += 30.5
+    expired = cache.get(_key("/posts/1"))
+
+    # Assert
+    check.is_none(expired, "Se retornó una entrada vencida")
+    check.equal(len(cache), 0, "La entrada vencida no se eliminó")
+    check.equal(cache.misses, 1, "El vencimiento no cuenta como fallo")
+
+
+@pytest.mark.unit
+def test_key_should_distinguish_query_and_headers_when_building_key():
+    """
+    Test que verifica que la clave incluye la query y los headers, sin
+    distinguir mayúsculas en el nombre del header.
+    """
+    # Act
+    plain = _key("/posts")
+    with_query = _key("/posts?userId=1")
+    with_header = _key("/posts", {"Accept": "application/json"})
+    same_header = _key("/posts", {"accept": "application/json"})
+
+    # Assert
+    check.not_equal(plain, with_query, "La query no forma parte de la clave")
+    check.not_equal(plain, with_header, "Los headers no forman parte de la clave")
+    check.equal(with_header, same_header, "El nombre del header distingue mayúsculas")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "status, consumed", [(201, True), (404, True), (500, True), (200, False)]
+)
+def test_put_should_skip_response_when_not_ok_or_not_downloaded(status, consumed):
+    """
+    Test que verifica que solo se guardan respuestas 200 con el body ya descargado.
+    """
+    # Arrange
+    cache = ResponseCache(ttl=30, max_entries=10)
+    response = _response(status)
+    response._content_consumed = consumed
+
+    # Act
+    cache.put(_key("/posts/1"), response)
+
+    # Assert
+    check.equal(len(cache), 0, f"Se guardó una respuesta {status} ({consumed=})")
+
+
+@pytest.mark.unit
+def test_put_should_evict_least_recently_used_when_cache_is_full(clock):
+    """
+    Test que verifica el descarte LRU: un acierto renueva la entrada.
+    """
+    # Arrange
+    cache = ResponseCache(ttl=30, max_entries=2)
+    cache.put(_key("/posts/1"), _response())
+    cache.put(_key("/posts/2"), _response())
+    cache.get(_key("/posts/1"))
+
+    # Act
+    cache.put(_key("/posts/3"), _response())
+
+    # Assert
+    check.equal(cache.evictions, 1, "Cantidad de descartes por tamaño")
+    check.is_none(cache.get(_key("/posts/2")), "Se conservó la entrada menos usada")
+    check.is_not_none(cache.get(_key("/posts/1")), "Se descartó la entrada usada")
+    check.is_not_none(cache.get(_key("/posts/3")), "Se descartó la entrada nueva")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "modified, stale, fresh",
+    [
+        (
+            "/posts/1",
+            ["/posts/1", "/posts", "/posts?userId=1", "/posts/1/comments"],
+            ["/posts/2", "/posts/10", "/comments", "/comments?postId=1", "/users/1"],
+        ),
+        (
+            "/posts",
+            ["/posts", "/posts?userId=1", "/posts/1", "/posts/1/comments"],
+            ["/postsx", "/comments", "/users/1"],
+        ),
+        (
+            "/posts/1/comments",
+            ["/posts/1/comments", "/posts/1"],
+            ["/posts", "/posts/2", "/comments"],
+        ),
+    ],
+    ids=["recurso", "coleccion", "subrecurso"],
+)
+def test_invalidate_should_drop_resource_children_and_parent_when_url_is_modified(
+    clock, modified, stale, fresh
+):
+    """
+    Test que verifica que modificar un recurso invalida el mismo path, sus
+    subrecursos y la colección que lo contiene, pero no recursos hermanos ni
+    paths que solo comparten un prefijo de texto (/posts/1 contra /posts/10).
+    """
+    # Arrange
+    cache = ResponseCache(ttl=30, max_entries=100)
+    for path in stale + fresh:
+        cache.put(_key(path), _response())
+
+    # Act
+    cache.invalidate(f"{BASE_URL}{modified}/")
+
+    # Assert
+    check.equal(cache.invalidations, len(stale), f"Invalidaciones por {modified}")
+    for path in stale:
+        check.is_none(cache.get(_key(path)), f"{path} sigue en la caché")
+    for path in fresh:
+        check.is_not_none(cache.get(_key(path)), f"{path} se invalidó de más")
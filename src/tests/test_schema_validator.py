@@ -0,0 +1,205 @@
+"""
+Tests unitarios de los validadores compilados de utils/schema_validator.py.
+"""
+
+import pytest
+import pytest_check as check
+
+from utils.api_schemas import SCHEMAS, USER_SCHEMA
+from utils.schema_validator import SchemaError, compile_schema, scan_items
+
+VALID_USER = {
+    "id": 1,
+    "name": "Leanne Graham",
+    "username": "Bret",
+    "email": "Sincere@april.biz",
+    "address": {
+        "street": "Kulas Light",
+        "suite": "Apt. 556",
+        "city": "Gwenborough",
+        "zipcode": "92998-3874",
+        "geo": {"lat": "-37.3159", "lng": "81.1496"},
+    },
+    "phone": "1-770-736-8031 x56442",
+    "website": "hildegard.org",
+    "company": {"name": "Romaguera-Crona", "catchPhrase": "...", "bs": "..."},
+}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "spec, value, expected",
+    [
+        (int, 1, None),
+        (int, True, ": se esperaba int, se obtuvo bool"),
+        (int, 1.0, ": se esperaba int, se obtuvo float"),
+        (float, 1, None),
+        (float, 1.5, None),
+        (bool, 0, ": se esperaba bool, se obtuvo int"),
+        (str, None, ": se esperaba str, se obtuvo NoneType"),
+        (None, None, None),
+        ((str, None), None, None),
+        ((str, None), 3, ": se esperaba str | null, se obtuvo int"),
+        (dict, {}, None),
+        (list, [], None),
+    ],
+)
+def test_compiled_validator_should_check_json_types_when_spec_is_a_type(
+    spec, value, expected
+):
+    """
+    Test que verifica los tipos escalares: float acepta int, bool no es int y
+    las tuplas declaran alternativas.
+    """
+    # Act
+    error = compile_schema(spec)(value)
+
+    # Assert
+    check.equal(error, expected, f"Error incorrecto para {spec!r} con {value!r}")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "change, expected",
+    [
+        (lambda user: user, None),
+        (lambda user: user.pop("email"), ".email: campo faltante"),
+        (
+            lambda user: user["address"]["geo"].pop("lat"),
+            ".address.geo.lat: campo faltante",
+        ),
+        (
+            lambda user: user["address"].update(city=7),
+            ".address.city: se esperaba str, se obtuvo int",
+        ),
+        (
+            lambda user: user.update(company=[]),
+            ".company: se esperaba un objeto, se obtuvo list",
+        ),
+        (lambda user: user.update(extra="ignorado"), None),
+    ],
+    ids=["valido", "faltante", "anidado", "tipo-anidado", "objeto", "campo-extra"],
+)
+def test_compiled_validator_should_report_path_when_nested_object_is_invalid(
+    change, expected
+):
+    """
+    Test que verifica que el error informa la ruta completa del primer campo
+    inválido y que los campos no declarados se ignoran.
+    """
+    # Arrange
+    user = {
+        **VALID_USER,
+        "address": {**VALID_USER["address"], "geo": dict(VALID_USER["address"]["geo"])},
+    }
+    change(user)
+
+    # Act
+    error = compile_schema(USER_SCHEMA)(user)
+
+    # Assert
+    check.equal(error, expected, "Error o ruta incorrecta")
+
+
+@pytest.mark.unit
+def test_compiled_validator_should_accept_missing_field_when_it_is_optional():
+    """
+    Test que verifica que los campos terminados en "?" pueden faltar pero, si
+    están, se validan.
+    """
+    # Arrange
+    validator = compile_schema({"id": int, "tags?": [str]})
+
+    # Act
+    missing = validator({"id": 1})
+    valid = validator({"id": 1, "tags": ["a", "b"]})
+    invalid = validator({"id": 1, "tags": ["a", 2]})
+
+    # Assert
+    check.is_none(missing, "Un campo opcional ausente no es un error")
+    check.is_none(valid, "Un campo opcional válido no es un error")
+    check.equal(invalid, ".tags[1]: se esperaba str, se obtuvo int", "Ruta en lista")
+
+
+@pytest.mark.unit
+def test_compiled_validator_should_report_index_when_list_item_is_invalid():
+    """
+    Test que verifica las listas de objetos: índice del elemento y campo.
+    """
+    # Arrange
+    validator = compile_schema([{"id": int}])
+
+    # Act
+    not_a_list = validator({"id": 1})
+    error = validator([{"id": 1}, {"id": "2"}])
+
+    # Assert
+    check.equal(not_a_list, ": se esperaba una lista, se obtuvo dict", "Tipo de lista")
+    check.equal(error, "[1].id: se esperaba int, se obtuvo str", "Ruta del elemento")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "schema",
+    [{"id": set}, [int, str], {"x": [complex]}],
+    ids=["set", "lista", "complex"],
+)
+def test_compile_schema_should_raise_schema_error_when_schema_is_malformed(schema):
+    """
+    Test que verifica que un esquema mal declarado falla al compilar.
+    """
+    # Act / Assert
+    with pytest.raises(SchemaError):
+        compile_schema(schema)
+
+
+@pytest.mark.unit
+def test_compile_schema_should_reuse_validator_when_same_schema_is_compiled():
+    """
+    Test que verifica la caché por identidad: el mismo esquema no se recompila
+    y un esquema igual pero distinto objeto tiene su propio validador.
+    """
+    # Arrange
+    schema = {"id": int}
+
+    # Act
+    first = compile_schema(schema)
+    second = compile_schema(schema)
+    other = compile_schema({"id": int})
+
+    # Assert
+    check.is_true(first is second, "El mismo esquema se compiló dos veces")
+    check.is_false(first is other, "Otro objeto de esquema reutilizó el validador")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("resource", list(SCHEMAS))
+def test_api_schemas_should_compile_when_validator_is_built(resource):
+    """
+    Test que verifica que todos los esquemas de api_schemas.py compilan.
+    """
+    # Act
+    validator = compile_schema(SCHEMAS[resource])
+
+    # Assert
+    check.is_true(callable(validator), f"El esquema de {resource} no compiló")
+
+
+@pytest.mark.unit
+def test_scan_items_should_count_failures_when_some_items_are_invalid():
+    """
+    Test que verifica el resumen de scan_items: total, inválidos y primer error.
+    """
+    # Arrange
+    validator = compile_schema({"id": int})
+    items = iter([{"id": 1}, {"id": "x"}, {}, {"id": 4}])
+
+    # Act
+    total, failing, first_failure = scan_items(validator, items)
+
+    # Assert
+    check.equal(total, 4, "Total de elementos")
+    check.equal(failing, 2, "Elementos inválidos")
+    check.equal(
+        first_failure, (1, ".id: se esperaba int, se obtuvo str"), "Primer error"
+    )
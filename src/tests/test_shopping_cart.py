@@ -8,6 +8,7 @@ import pytest
 import pytest_check as check
 
 from pages.catalog_page import CatalogPage
+from pages.shopping_cart_page import ShoppingCartPage
 from utils.json_reader import JSONReader
 from utils.logger import ui_logger
 
@@ -16,6 +17,7 @@ PRODUCTOS_JSON_PATH = Path(__file__).parent.parent / "data" / "productos.json"
 json_reader = JSONReader(str(PRODUCTOS_JSON_PATH))
 NOMBRES_PRODUCTOS = json_reader.read_field_as_tuples("nombre")
 PRODUCTOS_COMPLETOS = json_reader.read_as_dicts()
+IDS_PRODUCTOS = json_reader.read_field_as_tuples("id")
 
 
 @pytest.mark.smoke
@@ -113,10 +115,10 @@ def test_cart_should_display_all_products_when_multiple_products_added(
     catalog_page = CatalogPage(selenium_driver)
 
     # Act
-    for producto in productos_agregados:
-        catalog_page.add_product_to_cart_by_name(producto["nombre"])
-
-    cart_page = catalog_page.go_to_cart()
+    catalog_page.seed_cart(
+        [producto["id"] for producto in productos_agregados], reload=False
+    )
+    cart_page = ShoppingCartPage(selenium_driver).open()
     cart_items = cart_page.get_cart_items()
     item_names = cart_page.get_item_names()
 
@@ -141,16 +143,16 @@ def test_cart_should_remove_product_when_remove_button_is_clicked(selenium_drive
 
     # Arrange
     catalog_page = CatalogPage(selenium_driver)
-    catalog_page.add_product_to_cart_by_index(0)
-    ui_logger.info("Producto agregado al carrito")
-    page = catalog_page.go_to_cart()
-    ui_logger.info("Navegando al carrito")
+    catalog_page.seed_cart(IDS_PRODUCTOS[:1], reload=False)
+    ui_logger.info("Producto cargado en el carrito")
+    page = ShoppingCartPage(selenium_driver).open()
+    ui_logger.info("Carrito abierto directamente")
 
     # Act
     page.click_remove_button_by_index(0)
     ui_logger.info("Producto removido del carrito")
-    cart_items = page.get_cart_items()
+    cart_is_empty = page.cart_is_empty()
 
     # Assert
-    check.equal(len(cart_items), 0, "El carrito no esta vacio despues de remover el producto")
+    check.is_true(cart_is_empty, "El carrito no esta vacio despues de remover el producto")
     ui_logger.info("Test completado exitosamente")
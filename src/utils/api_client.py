@@ -0,0 +1,209 @@
+"""
+Módulo con el cliente HTTP compartido por las pruebas de API.
+Reutiliza conexiones keep-alive mediante un pool y cuenta cuántas se reutilizaron.
+Opcionalmente sirve los GET repetidos desde una caché de respuestas y limita la
+tasa de requests con un token bucket adaptativo.
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from utils import config
+from utils.rate_limiter import THROTTLE_STATUSES, RateLimiter, retry_after
+from utils.response_cache import ResponseCache
+
+# Métodos que modifican recursos e invalidan las respuestas cacheadas
+_MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+class ConnectionStats:
+    """
+    Contadores de requests enviados y de conexiones nuevas (handshakes TCP/TLS).
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.new_connections = 0
+        self._lock = threading.Lock()
+
+    def add_request(self):
+        """
+        Registra un request enviado.
+        """
+        with self._lock:
+            self.requests += 1
+
+    def add_connection(self):
+        """
+        Registra la apertura de una conexión nueva.
+        """
+        with self._lock:
+            self.new_connections += 1
+
+    @property
+    def reused(self) -> int:
+        """
+        Cantidad de requests que viajaron por una conexión ya abierta.
+        """
+        return max(self.requests - self.new_connections, 0)
+
+    def summary(self) -> str:
+        """
+        Devuelve un resumen legible de los contadores.
+        """
+        return (
+            f"Requests: {self.requests} | Conexiones nuevas: {self.new_connections} | "
+            f"Conexiones reutilizadas: {self.reused}"
+        )
+
+
+def _counting_pool_class(base_class, stats: ConnectionStats):
+    """
+    Crea una subclase del pool de urllib3 que registra cada conexión nueva en stats.
+    """
+
+    class CountingConnectionPool(base_class):
+        def _new_conn(self):
+            stats.add_connection()
+            return super()._new_conn()
+
+    return CountingConnectionPool
+
+
+class CountingAdapter(HTTPAdapter):
+    """
+    Adapter de requests que cuenta requests enviados y conexiones abiertas.
+    """
+
+    def __init__(self, stats: ConnectionStats, **kwargs):
+        # init_poolmanager se invoca desde HTTPAdapter.__init__ y necesita stats
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, **kwargs):
+        self.stats.add_request()
+        return super().send(request, **kwargs)
+
+
+class ApiClient:
+    """
+    Cliente HTTP sobre una sesión de requests con pool de conexiones keep-alive,
+    URL base y timeout por defecto. Con una ResponseCache, los GET se responden
+    desde la caché mientras sigan vigentes; con un RateLimiter, los requests
+    respetan su tasa y se reintentan ante 429/503.
+    """
+
+    def __init__(
+        self,
+        base_url: str = config.API_URL,
+        timeout: float = config.API_TIMEOUT,
+        pool_size: int = config.API_POOL_SIZE,
+        cache: ResponseCache = None,
+        rate_limiter: RateLimiter = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.stats = ConnectionStats()
+        self.session = requests.Session()
+        adapter = CountingAdapter(
+            self.stats, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path: str) -> str:
+        """
+        Construye la URL completa a partir de un path relativo a la URL base.
+        """
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def request(self, method: str, path: str, cache: bool = True, **kwargs):
+        """
+        Envía un request usando el timeout por defecto si no se indica otro.
+        Con la caché activa, un GET sin stream se responde desde ella si hay una
+        respuesta vigente; cache=False fuerza el request y renueva la entrada.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        url = self.url(path)
+        method = method.upper()
+        if self.cache is None:
+            return self._send(method, url, **kwargs)
+
+        if method in _MUTATING_METHODS:
+            response = self._send(method, url, **kwargs)
+            self.cache.invalidate(response.request.url)
+            return response
+        if method != "GET" or kwargs.get("stream"):
+            return self._send(method, url, **kwargs)
+
+        prepared = self.session.prepare_request(
+            requests.Request(
+                method, url, params=kwargs.get("params"), headers=kwargs.get("headers")
+            )
+        )
+        key = ResponseCache.key(prepared)
+        if cache:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        response = self._send(method, url, **kwargs)
+        self.cache.put(key, response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs):
+        """
+        Envía el request por la sesión, pasando antes por el limitador de tasa si
+        hay uno. Un 429/503 pausa el limitador y el request se reintenta; tras el
+        último reintento se retorna esa respuesta.
+        """
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self.session.request(method, url, **kwargs)
+
+        for attempt in range(limiter.retries + 1):
+            limiter.acquire()
+            response = self.session.request(method, url, **kwargs)
+            if response.status_code not in THROTTLE_STATUSES:
+                limiter.on_success()
+                return response
+            retry = attempt < limiter.retries
+            limiter.on_throttled(retry_after(response, limiter.backoff(attempt)), retry)
+            if not retry:
+                return response
+            response.close()
+
+    def get(self, path: str, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path: str, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path: str, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path: str, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path: str, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        """
+        Cierra la sesión y sus conexiones.
+        """
+        self.session.close()
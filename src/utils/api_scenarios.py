@@ -0,0 +1,81 @@
+"""
+Módulo para ejecutar escenarios de API declarados en archivos de datos.
+Cada escenario indica nombre, método, endpoint, payload, status y campos esperados.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterable
+
+from utils.async_api_client import AsyncApiClient
+from utils.json_reader import JSONReader
+
+
+def load_scenarios(file_path: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Lee los escenarios de un archivo JSON y los indexa por nombre.
+    """
+    return {
+        escenario["nombre"]: escenario
+        for escenario in JSONReader(file_path).read_as_dicts()
+    }
+
+
+def send_scenario(client, scenario: Dict[str, Any], **options):
+    """
+    Envía el request de un escenario con el cliente indicado.
+    Con un AsyncApiClient retorna la corrutina del request. options se pasan
+    tal cual al request (por ejemplo cache=False).
+    """
+    kwargs = dict(options)
+    if scenario.get("payload") is not None:
+        kwargs["json"] = scenario["payload"]
+    return client.request(scenario["metodo"], scenario["endpoint"], **kwargs)
+
+
+async def gather_scenarios(
+    async_client: AsyncApiClient, scenarios: Iterable[Dict[str, Any]]
+):
+    """
+    Envía todos los escenarios de forma concurrente.
+
+    Returns:
+        Dict nombre -> Response, o la excepción que produjo el request
+    """
+    scenarios = list(scenarios)
+    results = await asyncio.gather(
+        *(send_scenario(async_client, scenario) for scenario in scenarios),
+        return_exceptions=True,
+    )
+    return {scenario["nombre"]: result for scenario, result in zip(scenarios, results)}
+
+
+class ScenarioRunner:
+    """
+    Ejecuta escenarios de API para las pruebas.
+    En modo concurrente, prefetch() envía todos los escenarios en paralelo antes
+    de los tests y run() entrega a cada test la respuesta que le corresponde,
+    de modo que las validaciones se siguen reportando test por test.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._results = {}
+
+    def prefetch(self, scenarios: Iterable[Dict[str, Any]], concurrency: int):
+        """
+        Envía todos los escenarios de forma concurrente con el límite indicado.
+        """
+        async_client = AsyncApiClient(self.client, concurrency)
+        self._results = asyncio.run(gather_scenarios(async_client, scenarios))
+
+    def run(self, scenario: Dict[str, Any]):
+        """
+        Devuelve la respuesta del escenario, ya obtenida en el prefetch o enviándolo en ese momento.
+        """
+        if scenario["nombre"] not in self._results:
+            return send_scenario(self.client, scenario)
+
+        result = self._results.pop(scenario["nombre"])
+        if isinstance(result, BaseException):
+            raise result
+        return result
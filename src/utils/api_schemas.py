@@ -0,0 +1,47 @@
+"""
+Módulo con los esquemas de respuesta de los recursos de JSONPlaceholder.
+El formato de los esquemas se describe en utils/schema_validator.py.
+"""
+
+POST_SCHEMA = {"userId": int, "id": int, "title": str, "body": str}
+
+COMMENT_SCHEMA = {"postId": int, "id": int, "name": str, "email": str, "body": str}
+
+ALBUM_SCHEMA = {"userId": int, "id": int, "title": str}
+
+PHOTO_SCHEMA = {
+    "albumId": int,
+    "id": int,
+    "title": str,
+    "url": str,
+    "thumbnailUrl": str,
+}
+
+TODO_SCHEMA = {"userId": int, "id": int, "title": str, "completed": bool}
+
+USER_SCHEMA = {
+    "id": int,
+    "name": str,
+    "username": str,
+    "email": str,
+    "address": {
+        "street": str,
+        "suite": str,
+        "city": str,
+        "zipcode": str,
+        "geo": {"lat": str, "lng": str},
+    },
+    "phone": str,
+    "website": str,
+    "company": {"name": str, "catchPhrase": str, "bs": str},
+}
+
+# Esquema de cada colección por nombre de recurso
+SCHEMAS = {
+    "posts": POST_SCHEMA,
+    "comments": COMMENT_SCHEMA,
+    "albums": ALBUM_SCHEMA,
+    "photos": PHOTO_SCHEMA,
+    "todos": TODO_SCHEMA,
+    "users": USER_SCHEMA,
+}
@@ -2,11 +2,110 @@
 Módulo de utilidades para validación de respuestas API.
 """
 
+from typing import Optional
+
 import pytest_check as check
 
+from utils import config
+from utils.json_stream import JSONStreamError, iter_json_array
+from utils.latency_stats import api_latencies, endpoint_key
+from utils.perf_baseline import perf_tracker
+from utils.schema_validator import compile_schema, scan_items
+
+# Tamaño de los bloques leídos en la validación en streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def status_error(response, expected_status) -> Optional[str]:
+    """
+    Nivel 1: Status Code. Retorna el error o None, sin registrar un check.
+    """
+    if response.status_code != expected_status:
+        return (
+            f"Status code incorrecto. Esperado: {expected_status}, "
+            f"Obtenido: {response.status_code}"
+        )
+    return None
+
+
+def headers_error(response, expected_status) -> Optional[str]:
+    """
+    Nivel 2: Headers. Retorna el error o None, sin registrar un check.
+    """
+    content_type = response.headers.get("Content-Type", "")
+    # 204 No Content puede no tener Content-Type
+    if expected_status != 204 and "application/json" not in content_type:
+        return f"Content-Type incorrecto. Obtenido: {content_type or None}"
+    return None
+
+
+def items_error(total, failing, first_failure) -> Optional[str]:
+    """
+    Niveles 3-4 sobre todos los elementos: cuántos fallaron y el primero, o None.
+    """
+    if not failing:
+        return None
+    detalle = ""
+    if first_failure is not None:
+        index, error = first_failure
+        detalle = f" Primer elemento inválido: [{index}]{error}"
+    return f"{failing} de {total} elementos no cumplen el esquema.{detalle}"
+
+
+def performance_error(response, max_time) -> Optional[str]:
+    """
+    Nivel 5: Performance. Retorna el error o None, sin registrar un check.
+    """
+    elapsed_time = response.elapsed.total_seconds()
+    if elapsed_time >= max_time:
+        return f"Respuesta muy lenta. Tiempo: {elapsed_time:.2f}s, Máximo: {max_time}s"
+    return None
+
+
+def record_response_latency(response):
+    """
+    Registra la latencia de la respuesta en los histogramas y la línea base.
+    Las respuestas servidas desde la caché conservan el elapsed original y no se
+    vuelven a registrar.
+    """
+    if getattr(response, "from_cache", False):
+        return
+    api_latencies.record_response(response)
+    perf_tracker.record(
+        endpoint_key(response.request.method, response.request.url),
+        response.elapsed.total_seconds(),
+        config.API_PERF_TARGET,
+    )
+
+
+def _check(error: Optional[str]):
+    """
+    Registra un check fallido de pytest_check si hay error.
+    """
+    if error is not None:
+        check.fail(error)
+
+
+def _fields_validator(expected_fields):
+    """
+    Validador de elementos que solo verifica que estén los campos esperados.
+    """
+
+    def validator(item):
+        actual_fields = set(item.keys()) if isinstance(item, dict) else set()
+        missing = expected_fields - actual_fields
+        return f": faltan {missing}" if missing else None
+
+    return validator
+
 
 def validate_api_response(
-    response, expected_status, expected_fields=None, max_time=15.0
+    response,
+    expected_status,
+    expected_fields=None,
+    max_time=15.0,
+    schema=None,
+    record_latency=True,
 ):
     """
     Función helper para validar respuestas API con los 5 niveles de validación.
@@ -16,28 +115,21 @@ def validate_api_response(
         expected_status: Código de status HTTP esperado
         expected_fields: Set de campos esperados en la respuesta JSON (opcional)
         max_time: Tiempo máximo de respuesta en segundos (default 15.0)
+        schema: Esquema de utils/api_schemas.py que debe cumplir el objeto o
+            cada elemento de la lista (opcional)
+        record_latency: Registra la latencia en los histogramas de la sesión y en
+            la línea base (False para respuestas degradadas a propósito)
 
     Returns:
         Dict con el JSON de la respuesta si existe, None si no hay contenido
     """
-    # Nivel 1: Status Code
-    check.equal(
-        response.status_code,
-        expected_status,
-        f"Status code incorrecto. Esperado: {expected_status}, Obtenido: {response.status_code}",
-    )
-
-    # Nivel 2: Headers
-    if expected_status != 204:  # 204 No Content puede no tener Content-Type
-        check.is_in(
-            "application/json",
-            response.headers.get("Content-Type", ""),
-            f"Content-Type incorrecto. Obtenido: {response.headers.get('Content-Type')}",
-        )
+    _check(status_error(response, expected_status))
+    _check(headers_error(response, expected_status))
 
     # Nivel 3-4: Estructura y contenido (si hay expected_fields)
+    # response.content ya está en memoria: no se decodifica el texto solo para ver si hay cuerpo
     body = None
-    if expected_fields and response.text:
+    if expected_fields and response.content:
         try:
             body = response.json()
             # Para listas, validar el primer elemento
@@ -55,15 +147,71 @@ def validate_api_response(
         except Exception as e:
             check.fail(f"Error al parsear JSON: {str(e)}")
 
-    # Nivel 5: Performance
-    elapsed_time = response.elapsed.total_seconds()
-    check.less(
-        elapsed_time,
-        max_time,
-        f"Respuesta muy lenta. Tiempo: {elapsed_time:.2f}s, Máximo: {max_time}s",
-    )
+    # Nivel 3-4 con esquema: tipos y campos de todos los elementos
+    if schema is not None and response.content:
+        try:
+            body = response.json() if body is None else body
+            items = body if isinstance(body, list) else [body]
+            _check(items_error(*scan_items(compile_schema(schema), items)))
+        except ValueError as e:
+            check.fail(f"Error al parsear JSON: {str(e)}")
+
+    if record_latency:
+        record_response_latency(response)
+    _check(performance_error(response, max_time))
 
     # Retornar el body parseado si existe
-    if response.text and expected_status != 204:
+    if response.content and expected_status != 204:
         return response.json() if body is None else body
     return None
+
+
+def validate_api_list_stream(
+    response,
+    expected_status,
+    expected_fields=None,
+    max_time=15.0,
+    schema=None,
+    record_latency=True,
+):
+    """
+    Valida una respuesta de lista grande leyéndola en streaming.
+    El request debe enviarse con stream=True: el array se recorre elemento por
+    elemento desde el flujo de bytes, con memoria acotada, y se verifica cada
+    elemento (no solo el primero) contra el esquema o los campos esperados.
+
+    Args:
+        response: Objeto Response de requests obtenido con stream=True
+        expected_status: Código de status HTTP esperado
+        expected_fields: Set de campos esperados en cada elemento (si no hay schema)
+        max_time: Tiempo máximo de respuesta en segundos (default 15.0)
+        schema: Esquema de utils/api_schemas.py que debe cumplir cada elemento
+        record_latency: Registra la latencia en los histogramas de la sesión y en
+            la línea base (False para respuestas degradadas a propósito)
+
+    Returns:
+        Cantidad de elementos recorridos
+    """
+    _check(status_error(response, expected_status))
+    _check(headers_error(response, expected_status))
+
+    # Nivel 3-4: Estructura y contenido de cada elemento
+    if schema is not None:
+        validator = compile_schema(schema)
+    else:
+        validator = _fields_validator(expected_fields or set())
+    items = iter_json_array(response.iter_content(chunk_size=STREAM_CHUNK_SIZE))
+
+    total = 0
+    try:
+        total, failing, first_failure = scan_items(validator, items)
+        _check(items_error(total, failing, first_failure))
+    except JSONStreamError as e:
+        check.fail(f"Error al parsear JSON en streaming: {str(e)}")
+    finally:
+        response.close()
+
+    if record_latency:
+        record_response_latency(response)
+    _check(performance_error(response, max_time))
+    return total
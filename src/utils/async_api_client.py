@@ -0,0 +1,42 @@
+"""
+Módulo con un cliente asyncio para ejecutar requests de API de forma concurrente.
+"""
+
+import asyncio
+
+from utils import config
+
+
+class AsyncApiClient:
+    """
+    Cliente asyncio sobre un ApiClient.
+    Cada request corre en un hilo sobre la sesión con pool de conexiones y un
+    semáforo limita cuántos requests pueden estar en vuelo al mismo tiempo.
+    """
+
+    def __init__(self, client, concurrency: int = config.API_CONCURRENCY):
+        self.client = client
+        self.concurrency = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(self, method: str, path: str, **kwargs):
+        """
+        Envía un request respetando el límite de concurrencia.
+        """
+        async with self._semaphore:
+            return await asyncio.to_thread(self.client.request, method, path, **kwargs)
+
+    async def get(self, path: str, **kwargs):
+        return await self.request("GET", path, **kwargs)
+
+    async def post(self, path: str, **kwargs):
+        return await self.request("POST", path, **kwargs)
+
+    async def put(self, path: str, **kwargs):
+        return await self.request("PUT", path, **kwargs)
+
+    async def patch(self, path: str, **kwargs):
+        return await self.request("PATCH", path, **kwargs)
+
+    async def delete(self, path: str, **kwargs):
+        return await self.request("DELETE", path, **kwargs)
@@ -0,0 +1,225 @@
+"""
+Módulo de grabación y reproducción (cassettes) de los intercambios HTTP de las pruebas de API.
+En modo "record" cada request real se guarda con su status, headers, body y
+latencia original; en modo "replay" las respuestas salen del cassette sin
+tocar la red, opcionalmente esperando la latencia grabada.
+"""
+
+import base64
+import datetime
+import gzip
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from utils.api_client import CountingAdapter
+
+MODES = ("off", "record", "replay")
+
+
+class CassetteMissError(RequestsConnectionError):
+    """
+    El request no está grabado en el cassette activo durante el modo replay.
+    """
+
+
+def fingerprint(request, base_url: str = "") -> str:
+    """
+    Huella de un PreparedRequest: método, path y query relativos a base_url, y body.
+    Sin el host, un cassette grabado contra el servidor local o el proxy de fallas
+    (con puerto asignado por el sistema) sigue valiendo en la próxima ejecución.
+    """
+    url = request.url
+    base_url = base_url.rstrip("/")
+    if base_url and url.startswith(base_url):
+        relative = url[len(base_url) :]
+        if not relative or relative[0] in "/?":
+            url = relative or "/"
+    body = request.body or b""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha1(body).hexdigest()[:16]
+    return f"{request.method} {url} {digest}"
+
+
+class CassetteLibrary:
+    """
+    Conjunto de cassettes, uno por nombre (por ejemplo, por módulo de test),
+    guardados como JSON comprimido con gzip en el directorio indicado.
+    """
+
+    def __init__(self, directory, mode: str, replay_latency: bool = False):
+        if mode not in MODES:
+            raise ValueError(f"Modo de cassette inválido: {mode}. Opciones: {MODES}")
+        self.directory = Path(directory)
+        self.mode = mode
+        self.replay_latency = replay_latency
+        self.current = "default"
+        self._cassettes = {}
+        self._used = set()
+        self._positions = {}
+        self._lock = threading.Lock()
+
+    def select(self, name: str):
+        """
+        Activa el cassette con el nombre indicado.
+        """
+        self.current = name
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json.gz"
+
+    def _load(self, name: str) -> dict:
+        if name not in self._cassettes:
+            path = self._path(name)
+            if self.mode == "replay" and path.exists():
+                with gzip.open(path, "rt", encoding="utf-8") as archivo:
+                    self._cassettes[name] = json.load(archivo)["interactions"]
+            else:
+                # En modo record el cassette se vuelve a grabar desde cero
+                self._cassettes[name] = {}
+        return self._cassettes[name]
+
+    def record(self, key: str, response, latency: float):
+        """
+        Guarda bajo la huella key la respuesta real y su latencia en el cassette activo.
+        """
+        content = response.content
+        try:
+            body, encoding = content.decode("utf-8"), "utf-8"
+        except UnicodeDecodeError:
+            body, encoding = base64.b64encode(content).decode("ascii"), "base64"
+        interaction = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": dict(response.headers),
+            "body": body,
+            "encoding": encoding,
+            "latency": latency,
+        }
+        with self._lock:
+            cassette = self._load(self.current)
+            cassette.setdefault(key, []).append(interaction)
+            self._used.add(self.current)
+
+    def replay(self, key: str, request) -> dict:
+        """
+        Retorna la interacción grabada bajo la huella key. Las repeticiones de un
+        mismo request se responden en el orden grabado y luego con la última.
+        """
+        with self._lock:
+            interactions = self._load(self.current).get(key)
+            if not interactions:
+                raise CassetteMissError(
+                    f"Request no grabado en el cassette '{self.current}': "
+                    f"{request.method} {request.url}"
+                )
+            position = self._positions.get((self.current, key), 0)
+            self._positions[(self.current, key)] = position + 1
+        return interactions[min(position, len(interactions) - 1)]
+
+    def save(self):
+        """
+        Escribe los cassettes grabados en esta sesión.
+        """
+        if self.mode != "record":
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for name in sorted(self._used):
+            with gzip.open(self._path(name), "wt", encoding="utf-8") as archivo:
+                json.dump(
+                    {"version": 1, "interactions": self._cassettes[name]},
+                    archivo,
+                    separators=(",", ":"),
+                )
+
+
+def _build_response(request, interaction: dict) -> Response:
+    """
+    Construye un Response de requests a partir de una interacción grabada.
+    """
+    response = Response()
+    response.request = request
+    response.url = request.url
+    response.status_code = interaction["status"]
+    response.reason = interaction["reason"]
+    response.headers = CaseInsensitiveDict(interaction["headers"])
+    response.encoding = get_encoding_from_headers(response.headers)
+    if interaction["encoding"] == "base64":
+        response._content = base64.b64decode(interaction["body"])
+    else:
+        response._content = interaction["body"].encode("utf-8")
+    # El contenido ya está en memoria: iter_content lo entrega en bloques
+    response._content_consumed = True
+    response.recorded_latency = interaction["latency"]
+    return response
+
+
+def _restore_recorded_latency(response, **kwargs):
+    """
+    Hook de respuesta: Session.send pisa elapsed con el tiempo real, que en replay
+    es casi cero; se reemplaza por la latencia grabada.
+    """
+    latency = getattr(response, "recorded_latency", None)
+    if latency is not None:
+        response.elapsed = datetime.timedelta(seconds=latency)
+    return response
+
+
+class CassetteAdapter(CountingAdapter):
+    """
+    Adapter que graba o reproduce los intercambios según el modo de la biblioteca.
+    """
+
+    def __init__(
+        self, stats, library: CassetteLibrary, base_url: str = "", **kwargs
+    ):
+        self.library = library
+        self.base_url = base_url
+        super().__init__(stats, **kwargs)
+
+    def install(self, session):
+        """
+        Monta el adapter en la sesión y agrega el hook que conserva la latencia grabada.
+        """
+        session.mount("http://", self)
+        session.mount("https://", self)
+        session.hooks["response"].append(_restore_recorded_latency)
+
+    def send(self, request, **kwargs):
+        key = fingerprint(request, self.base_url)
+        if self.library.mode == "replay":
+            interaction = self.library.replay(key, request)
+            if self.library.replay_latency:
+                time.sleep(interaction["latency"])
+            return _build_response(request, interaction)
+
+        # Session.send recién completa elapsed al volver del adapter: la latencia
+        # se mide acá, hasta recibir los headers como hace requests
+        started = time.perf_counter()
+        response = super().send(request, **kwargs)
+        if self.library.mode == "record":
+            latency = time.perf_counter() - started
+            self.library.record(key, response, latency)
+        return response
+
+
+def use_cassettes(client, library: CassetteLibrary):
+    """
+    Reemplaza el adapter de un ApiClient por uno que graba o reproduce cassettes.
+    """
+    adapter = CassetteAdapter(
+        client.stats,
+        library,
+        base_url=client.base_url,
+        pool_connections=client.pool_size,
+        pool_maxsize=client.pool_size,
+    )
+    adapter.install(client.session)
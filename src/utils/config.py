@@ -0,0 +1,153 @@
+"""
+Módulo de configuración de la suite leída desde variables de entorno.
+"""
+
+import hashlib
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """
+    Lee una variable de entorno entera, usando el valor por defecto si no existe.
+    """
+    valor = os.getenv(name)
+    return int(valor) if valor not in (None, "") else default
+
+
+def env_float(name: str, default: float) -> float:
+    """
+    Lee una variable de entorno decimal, usando el valor por defecto si no existe.
+    """
+    valor = os.getenv(name)
+    return float(valor) if valor not in (None, "") else default
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    """
+    Lee una variable de entorno booleana ('1', 'true', 'yes', 'on' se consideran verdaderos).
+    """
+    valor = os.getenv(name)
+    if valor in (None, ""):
+        return default
+    return valor.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Selenium
+SELENIUM_IMPLICIT_WAIT = env_int("SELENIUM_IMPLICIT_WAIT", 20)
+SELENIUM_PAGE_LOAD_TIMEOUT = env_int("SELENIUM_PAGE_LOAD_TIMEOUT", 30)
+SELENIUM_SCRIPT_TIMEOUT = env_int("SELENIUM_SCRIPT_TIMEOUT", 30)
+
+# Espera explícita (segundos) de los elementos que deben aparecer
+SELENIUM_EXPLICIT_WAIT = env_int("SELENIUM_EXPLICIT_WAIT", 10)
+
+# Tiempo máximo (segundos) de las verificaciones rápidas de ausencia
+FAST_WAIT_TIMEOUT = env_float("FAST_WAIT_TIMEOUT", 0.5)
+
+# Pool de drivers: cantidad de tests que atiende un driver antes de reciclarlo
+DRIVER_POOL_MAX_USES = env_int("DRIVER_POOL_MAX_USES", 50)
+
+# Inicia en segundo plano el próximo Chrome mientras corre el test actual
+DRIVER_POOL_PREWARM = env_bool("DRIVER_POOL_PREWARM")
+
+# SauceDemo: sitio bajo prueba. Con SAUCEDEMO_LOCAL se sirve una copia local del
+# front end desde SAUCEDEMO_LOCAL_DIR en SAUCEDEMO_LOCAL_PORT, un puerto fijo
+# porque las URLs de los page objects se arman al importar la configuración
+SAUCEDEMO_LOCAL = env_bool("SAUCEDEMO_LOCAL")
+SAUCEDEMO_LOCAL_DIR = os.getenv(
+    "SAUCEDEMO_LOCAL_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "data", "saucedemo"),
+)
+SAUCEDEMO_LOCAL_PORT = env_int("SAUCEDEMO_LOCAL_PORT", 8765)
+if SAUCEDEMO_LOCAL:
+    SAUCEDEMO_URL = f"http://127.0.0.1:{SAUCEDEMO_LOCAL_PORT}/"
+else:
+    SAUCEDEMO_URL = os.getenv("SAUCEDEMO_URL", "https://www.saucedemo.com/")
+    SAUCEDEMO_URL = SAUCEDEMO_URL.rstrip("/") + "/"
+
+# SauceDemo: reutiliza la sesión capturada en el primer login por UI de cada usuario
+SAUCEDEMO_FAST_LOGIN = env_bool("SAUCEDEMO_FAST_LOGIN")
+
+# API
+API_URL = os.getenv("API_URL", "https://jsonplaceholder.typicode.com")
+API_TIMEOUT = env_float("API_TIMEOUT", 5.0)
+API_POOL_SIZE = env_int("API_POOL_SIZE", 10)
+
+# Caché de respuestas GET compartida por las pruebas de API de la sesión
+API_CACHE = env_bool("API_CACHE")
+API_CACHE_TTL = env_float("API_CACHE_TTL", 60.0)
+API_CACHE_SIZE = env_int("API_CACHE_SIZE", 256)
+
+# Límite de requests por segundo del cliente de API de la sesión (0 = sin límite).
+# Se adapta ante 429/503 y reintenta esos requests hasta API_RATE_RETRIES veces
+API_RATE_LIMIT = env_float("API_RATE_LIMIT", 0.0)
+API_RATE_BURST = env_int("API_RATE_BURST", 1)
+API_RATE_RETRIES = env_int("API_RATE_RETRIES", 3)
+
+# Recorrido de todos los elementos de cada colección (test_resource_sweep.py)
+API_SWEEP = env_bool("API_SWEEP")
+API_SWEEP_CONCURRENCY = env_int("API_SWEEP_CONCURRENCY", 32)
+
+# Reemplaza JSONPlaceholder por el servidor local de utils/local_api.py
+API_LOCAL = env_bool("API_LOCAL")
+
+# Habilita test_degraded_conditions.py (timeouts, 5xx y cortes vía proxy de fallas)
+DEGRADED_TEST = env_bool("DEGRADED_TEST")
+
+# Reglas del proxy de fallas (JSON, ver utils/fault_proxy.py) aplicadas a toda la
+# suite de API; vacío para no usar el proxy
+API_FAULT_RULES = os.getenv("API_FAULT_RULES", "")
+
+# Cassettes de API: "off", "record" (graba los intercambios reales) o "replay"
+# (responde desde los cassettes sin red, opcionalmente con la latencia grabada)
+API_CASSETTE_MODE = os.getenv("API_CASSETTE_MODE", "off").strip().lower()
+API_CASSETTE_DIR = os.getenv(
+    "API_CASSETTE_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "data", "cassettes"),
+)
+API_CASSETTE_LATENCY = env_bool("API_CASSETTE_LATENCY")
+
+# Ejecuta en paralelo los escenarios independientes de API antes de sus tests
+API_CONCURRENT = env_bool("API_CONCURRENT")
+API_CONCURRENCY = env_int("API_CONCURRENCY", 8)
+
+# Prueba de carga de API (se habilita con LOAD_TEST=1)
+LOAD_TEST = env_bool("LOAD_TEST")
+LOAD_USERS = env_int("LOAD_USERS", 10)
+LOAD_RAMP_UP = env_float("LOAD_RAMP_UP", 5.0)
+LOAD_DURATION = env_float("LOAD_DURATION", 30.0)
+LOAD_TARGET_RPS = env_float("LOAD_TARGET_RPS", 0.0)
+LOAD_MAX_ERROR_RATE = env_float("LOAD_MAX_ERROR_RATE", 0.01)
+
+# Prueba de soak del ciclo de vida de un post (test_post_lifecycle_soak.py).
+# Corre hasta SOAK_DURATION segundos o SOAK_ITERATIONS ciclos (0 = sin límite)
+SOAK_TEST = env_bool("SOAK_TEST")
+SOAK_DURATION = env_float("SOAK_DURATION", 300.0)
+SOAK_ITERATIONS = env_int("SOAK_ITERATIONS", 0)
+SOAK_WINDOW = env_float("SOAK_WINDOW", 30.0)
+SOAK_BURST = env_int("SOAK_BURST", 3)
+SOAK_MAX_ERROR_RATE = env_float("SOAK_MAX_ERROR_RATE", 0.01)
+SOAK_MAX_DRIFT = env_float("SOAK_MAX_DRIFT", 2.0)
+SOAK_MAX_MEMORY_GROWTH_MB = env_float("SOAK_MAX_MEMORY_GROWTH_MB", 20.0)
+# tracemalloc señala las líneas que más memoria sumaron, a costa de hacer más lento el proceso
+SOAK_TRACEMALLOC = env_bool("SOAK_TRACEMALLOC")
+
+# Línea base de performance: historial de latencias por test y detección de regresiones
+PERF_BASELINE = env_bool("PERF_BASELINE", True)
+PERF_BASELINE_PATH = os.getenv(
+    "PERF_BASELINE_PATH",
+    os.path.join(os.path.dirname(__file__), "..", "reports", "perf_baseline.json"),
+)
+PERF_BASELINE_HISTORY = env_int("PERF_BASELINE_HISTORY", 30)
+PERF_BASELINE_MIN_RUNS = env_int("PERF_BASELINE_MIN_RUNS", 5)
+PERF_REGRESSION_Z = env_float("PERF_REGRESSION_Z", 3.0)
+PERF_REGRESSION_MIN_RATIO = env_float("PERF_REGRESSION_MIN_RATIO", 1.25)
+PERF_FAIL_ON_REGRESSION = env_bool("PERF_FAIL_ON_REGRESSION")
+
+# Destino de las mediciones en las claves de la línea base: el servidor local, el
+# servicio real y cada juego de reglas del proxy de fallas llevan historiales aparte
+API_PERF_TARGET = "local" if API_LOCAL else API_URL.rstrip("/")
+if API_FAULT_RULES:
+    API_PERF_TARGET += (
+        f" +fallas:{hashlib.sha1(API_FAULT_RULES.encode('utf-8')).hexdigest()[:8]}"
+    )
+SAUCEDEMO_PERF_TARGET = "local" if SAUCEDEMO_LOCAL else SAUCEDEMO_URL.rstrip("/")
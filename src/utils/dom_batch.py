@@ -0,0 +1,144 @@
+"""
+Módulo para leer y operar sobre el DOM en lote con una sola llamada al driver.
+Evita el patrón N+1 de buscar la lista y luego cada elemento por separado.
+"""
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+_CSS_TEMPLATES = {
+    By.ID: "#{}",
+    By.CLASS_NAME: ".{}",
+    By.CSS_SELECTOR: "{}",
+    By.TAG_NAME: "{}",
+    By.NAME: '[name="{}"]',
+}
+
+_READ_ROWS_SCRIPT = """
+const [containerSelector, fields] = arguments;
+return Array.from(document.querySelectorAll(containerSelector)).map((row) => {
+    const data = {};
+    for (const [name, selector, kind] of fields) {
+        const element = selector ? row.querySelector(selector) : row;
+        if (!element) {
+            data[name] = null;
+        } else if (kind === "text") {
+            data[name] = (element.innerText || "").trim();
+        } else if (kind === "element") {
+            data[name] = element;
+        } else {
+            data[name] = element.getAttribute(kind);
+        }
+    }
+    return data;
+});
+"""
+
+_RUN_ACTIONS_SCRIPT = """
+const [actions, start] = arguments;
+const valueSetters = {
+    INPUT: Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, "value").set,
+    TEXTAREA: Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, "value").set,
+};
+for (let i = start; i < actions.length; i++) {
+    const [kind, selector, value] = actions[i];
+    const element = document.querySelector(selector);
+    if (!element) {
+        return i;
+    }
+    if (kind === "fill") {
+        // React ignora asignaciones directas a .value: se usa el setter nativo
+        // y se disparan los eventos que escucha la aplicación
+        element.focus();
+        valueSetters[element.tagName].call(element, value);
+        element.dispatchEvent(new Event("input", { bubbles: true }));
+        element.dispatchEvent(new Event("change", { bubbles: true }));
+        element.blur();
+    } else {
+        element.click();
+    }
+}
+return -1;
+"""
+
+
+def to_css(locator) -> str:
+    """
+    Convierte un localizador (By, valor) de Selenium a un selector CSS.
+    """
+    by, value = locator
+    if by not in _CSS_TEMPLATES:
+        raise ValueError(f"Localizador no soportado para operaciones en lote: {by}")
+    return _CSS_TEMPLATES[by].format(value)
+
+
+def read_rows(driver, container_locator, fields):
+    """
+    Lee todas las filas de una lista en una sola ejecución de script.
+
+    Args:
+        driver: WebDriver de Selenium
+        container_locator: Localizador de cada fila de la lista
+        fields: Dict nombre -> (localizador relativo a la fila o None para la fila misma, tipo),
+            donde tipo es "text", "element" o el nombre de un atributo
+
+    Returns:
+        Lista de diccionarios, uno por fila, con un valor por campo (None si no existe)
+    """
+    container_css = to_css(container_locator)
+    spec = [
+        [name, to_css(locator) if locator else None, kind]
+        for name, (locator, kind) in fields.items()
+    ]
+    rows = driver.execute_script(_READ_ROWS_SCRIPT, container_css, spec)
+
+    # Sin filas puede significar que la lista aún no se renderizó: find_elements
+    # respeta la espera implícita como lo hacían las lecturas fila por fila
+    if not rows and driver.find_elements(*container_locator):
+        rows = driver.execute_script(_READ_ROWS_SCRIPT, container_css, spec)
+    return rows
+
+
+def fill(locator, value: str):
+    """
+    Acción en lote que completa un campo de texto.
+    """
+    return ("fill", locator, value)
+
+
+def click(locator):
+    """
+    Acción en lote que hace clic sobre un elemento.
+    """
+    return ("click", locator, None)
+
+
+def run_actions(driver, actions):
+    """
+    Ejecuta una secuencia de acciones fill/click en una sola llamada al driver.
+    Los campos se completan sin tipeo tecla por tecla, pero disparando los
+    eventos input y change que necesita la aplicación React.
+
+    Args:
+        driver: WebDriver de Selenium
+        actions: Lista de acciones creadas con fill() y click()
+
+    Raises:
+        NoSuchElementException: Si algún elemento no aparece dentro de la espera implícita
+    """
+    spec = [[kind, to_css(locator), value] for kind, locator, value in actions]
+    failed = driver.execute_script(_RUN_ACTIONS_SCRIPT, spec, 0)
+
+    # Si un elemento no existía todavía, se espera con la espera implícita y se
+    # continúa desde esa acción, sin repetir las anteriores
+    while failed != -1:
+        locator = actions[failed][1]
+        retry = failed
+        if driver.find_elements(*locator):
+            retry = driver.execute_script(_RUN_ACTIONS_SCRIPT, spec, failed)
+        if retry == failed:
+            raise NoSuchElementException(
+                f"Elemento no encontrado para la acción en lote: {locator}"
+            )
+        failed = retry
+    return driver
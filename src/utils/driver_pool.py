@@ -0,0 +1,223 @@
+"""
+Módulo para reutilizar instancias de WebDriver entre pruebas.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import ui_logger
+
+
+class PooledDriver:
+    """
+    Envoltorio de un WebDriver con la cantidad de pruebas que ya atendió.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class PoolMetrics:
+    """
+    Métricas de cómo se obtuvieron los drivers entregados a las pruebas.
+    """
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.reused = 0
+        self.prewarmed = 0
+        self.cold_starts = 0
+        self.waits = []
+
+    def record_wait(self, seconds: float):
+        """
+        Registra el tiempo que una prueba esperó a que Chrome terminara de iniciar.
+        """
+        self.waits.append(seconds)
+
+    def summary(self) -> str:
+        """
+        Devuelve un resumen legible de las métricas.
+        """
+        total_wait = sum(self.waits)
+        max_wait = max(self.waits, default=0.0)
+        avg_wait = total_wait / len(self.waits) if self.waits else 0.0
+        return (
+            f"Drivers entregados: {self.acquisitions} "
+            f"(reutilizados: {self.reused}, precalentados: {self.prewarmed}, "
+            f"arranques en frío: {self.cold_starts}) | "
+            f"Esperas: {len(self.waits)} (total {total_wait:.2f}s, "
+            f"promedio {avg_wait:.2f}s, máximo {max_wait:.2f}s)"
+        )
+
+
+class DriverPool:
+    """
+    Pool de WebDrivers de larga duración.
+    Cada driver se entrega a una prueba, se reinicia al devolverse y solo se
+    recicla cuando deja de responder o alcanza la cantidad máxima de usos.
+    Con prewarm activo, un hilo en segundo plano mantiene siempre un Chrome
+    de repuesto iniciándose para que el reemplazo esté listo cuando se pida.
+    """
+
+    def __init__(self, factory, max_uses: int = 50, prewarm: bool = False):
+        self._factory = factory
+        self._max_uses = max_uses
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1) if prewarm else None
+        self._spare = None
+        self.metrics = PoolMetrics()
+        self._schedule_prewarm()
+
+    def acquire(self):
+        """
+        Entrega un driver libre del pool, el de repuesto precalentado o uno nuevo.
+        """
+        # Las métricas se actualizan bajo el lock: el hilo de precalentamiento y
+        # otras pruebas pueden estar usando el pool al mismo tiempo
+        with self._lock:
+            pooled = self._idle.pop() if self._idle else None
+            spare = None
+            if pooled is None:
+                spare, self._spare = self._spare, None
+            self.metrics.acquisitions += 1
+            if pooled is not None:
+                self.metrics.reused += 1
+
+        if pooled is None and spare is not None:
+            pooled = self._take_spare(spare)
+
+        if pooled is None:
+            start = time.perf_counter()
+            pooled = PooledDriver(self._factory())
+            waited = time.perf_counter() - start
+            with self._lock:
+                self.metrics.cold_starts += 1
+                self.metrics.record_wait(waited)
+            ui_logger.debug("Driver nuevo creado para el pool")
+
+        pooled.uses += 1
+        with self._lock:
+            self._in_use[id(pooled.driver)] = pooled
+        self._schedule_prewarm()
+        return pooled.driver
+
+    def _take_spare(self, spare):
+        """
+        Obtiene el driver precalentado, esperando si todavía se está iniciando.
+        """
+        was_ready = spare.done()
+        start = time.perf_counter()
+        try:
+            driver = spare.result()
+        except Exception as e:
+            ui_logger.warning(f"Falló el precalentamiento del driver: {e}")
+            return None
+
+        waited = time.perf_counter() - start
+        with self._lock:
+            self.metrics.prewarmed += 1
+            if not was_ready:
+                self.metrics.record_wait(waited)
+        ui_logger.debug("Driver precalentado entregado")
+        return PooledDriver(driver)
+
+    def _schedule_prewarm(self):
+        """
+        Inicia en segundo plano el próximo Chrome si no hay uno de repuesto.
+        """
+        if self._executor is None:
+            return
+        with self._lock:
+            if self._spare is None:
+                self._spare = self._executor.submit(self._factory)
+
+    def release(self, driver):
+        """
+        Devuelve un driver al pool, reiniciando su estado o reciclándolo si corresponde.
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(driver), None)
+
+        if pooled is None:
+            self._quit(driver)
+            return
+
+        if pooled.uses >= self._max_uses:
+            ui_logger.debug(f"Reciclando driver tras {pooled.uses} usos")
+            self._quit(driver)
+        elif not reset_driver_state(driver):
+            ui_logger.warning("Reciclando driver que no responde al reinicio de estado")
+            self._quit(driver)
+        else:
+            with self._lock:
+                self._idle.append(pooled)
+
+    def close(self):
+        """
+        Cierra todos los drivers del pool.
+        """
+        with self._lock:
+            pooled_drivers = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+            spare, self._spare = self._spare, None
+            executor, self._executor = self._executor, None
+
+        if spare is not None:
+            try:
+                pooled_drivers.append(PooledDriver(spare.result()))
+            except Exception as e:
+                ui_logger.warning(f"Falló el precalentamiento del driver: {e}")
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+        for pooled in pooled_drivers:
+            self._quit(pooled.driver)
+        with self._lock:
+            summary = self.metrics.summary()
+        ui_logger.info(summary)
+
+    @staticmethod
+    def _quit(driver):
+        """
+        Cierra el driver ignorando errores de un navegador que ya no responde.
+        """
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            ui_logger.warning(f"Error al cerrar el driver: {e}")
+
+
+def reset_driver_state(driver) -> bool:
+    """
+    Deja el driver como recién creado: una sola ventana, sin cookies ni storage y en about:blank.
+    Retorna False si el navegador no responde, en cuyo caso debe reciclarse.
+    """
+    try:
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # El storage es por origen, por eso se limpia antes de salir de la página actual
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+        try:
+            # Borra las cookies de todos los dominios, no solo las del actual
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+        return True
+    except (IndexError, WebDriverException):
+        return False
@@ -0,0 +1,96 @@
+"""
+Módulo con una caché de elementos por localizador para los page objects.
+Evita repetir find_element sobre el mismo localizador en flujos de varios pasos.
+"""
+
+import time
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from utils import config
+from utils.perf_baseline import perf_tracker
+
+
+class ElementCache:
+    """
+    Caché de handles de elementos indexada por localizador.
+    Un handle que quedó obsoleto (el documento cambió o el nodo se volvió a
+    renderizar) se vuelve a buscar de forma transparente, y las acciones que
+    navegan vacían la caché completa.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._elements = {}
+
+    def invalidate(self):
+        """
+        Descarta todos los handles guardados, por ejemplo luego de una navegación.
+        """
+        self._elements.clear()
+
+    def get(self, locator):
+        """
+        Retorna el handle guardado para el localizador o lo busca y lo guarda.
+        """
+        element = self._elements.get(locator)
+        if element is None:
+            element = self.driver.find_element(*locator)
+            self._elements[locator] = element
+        return element
+
+    def run(self, locator, action):
+        """
+        Ejecuta action(elemento) y, si el handle estaba obsoleto, lo busca de nuevo y reintenta una vez.
+        """
+        try:
+            return action(self.get(locator))
+        except StaleElementReferenceException:
+            self._elements.pop(locator, None)
+            return action(self.get(locator))
+
+    def navigate(self, url: str):
+        """
+        Navega a la URL indicada, registra el tiempo de carga y vacía la caché.
+        """
+        started = time.perf_counter()
+        self.driver.get(url)
+        perf_tracker.record(
+            f"page_load {urlsplit(url).path}",
+            time.perf_counter() - started,
+            config.SAUCEDEMO_PERF_TARGET,
+        )
+        self.invalidate()
+
+    def click(self, locator, navigates: bool = False):
+        """
+        Hace clic en el elemento; con navigates=True vacía la caché luego del clic.
+        """
+        self.run(locator, lambda element: element.click())
+        if navigates:
+            self.invalidate()
+
+    def text(self, locator) -> str:
+        """
+        Obtiene el texto del elemento.
+        """
+        return self.run(locator, lambda element: element.text)
+
+    def is_displayed(self, locator) -> bool:
+        """
+        Verifica si el elemento está visible.
+        """
+        return self.run(locator, lambda element: element.is_displayed())
+
+    def send_keys(self, locator, value, clear: bool = False):
+        """
+        Tipea el valor en el elemento, limpiándolo antes si clear=True.
+        """
+
+        def _type(element):
+            if clear:
+                element.clear()
+            element.send_keys(value)
+
+        self.run(locator, _type)
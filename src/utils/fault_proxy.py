@@ -0,0 +1,259 @@
+"""
+Módulo con un proxy inverso local que degrada las respuestas de un servidor.
+Se ubica entre las pruebas (requests o Chrome) y el sitio bajo prueba e inyecta
+por ruta latencia, jitter, límite de ancho de banda, conexiones cortadas y
+respuestas 5xx, para ejercitar deliberadamente timeouts y validaciones de tiempo.
+"""
+
+import http.client
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlsplit
+
+from utils.local_server import BackgroundHTTPServer, QuietRequestHandlerMixin
+
+# Headers que describen una conexión puntual y no se reenvían
+_HOP_BY_HOP = {
+    "connection",
+    "keep-alive",
+    "proxy-authenticate",
+    "proxy-authorization",
+    "te",
+    "trailers",
+    "transfer-encoding",
+    "upgrade",
+    "host",
+    "content-length",
+}
+
+
+class FaultRule:
+    """
+    Degradación aplicada a los requests cuyo path coincide con pattern.
+
+    Args:
+        pattern: Expresión regular buscada en el path (con query string)
+        methods: Métodos HTTP a los que aplica (todos si es None)
+        latency: Demora fija antes de responder (segundos)
+        jitter: Variación aleatoria de ±jitter segundos sobre la latencia
+        bandwidth: Bytes por segundo con que se envía el body (sin límite si es None)
+        drop_rate: Probabilidad de cortar la conexión sin responder
+        error_rate: Probabilidad de responder error_status en lugar del upstream
+        error_status: Status de las respuestas de error inyectadas
+    """
+
+    def __init__(
+        self,
+        pattern: str = ".*",
+        methods=None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: int = None,
+        drop_rate: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+    ):
+        self.pattern = re.compile(pattern)
+        self.methods = {method.upper() for method in methods} if methods else None
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.drop_rate = drop_rate
+        self.error_rate = error_rate
+        self.error_status = error_status
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FaultRule":
+        return cls(**data)
+
+    def matches(self, method: str, path: str) -> bool:
+        if self.methods is not None and method not in self.methods:
+            return False
+        return self.pattern.search(path) is not None
+
+
+def parse_rules(text: str):
+    """
+    Lee una lista de reglas en JSON, por ejemplo
+    '[{"pattern": "^/posts", "latency": 0.5, "error_rate": 0.1}]'.
+    """
+    return [FaultRule.from_dict(data) for data in json.loads(text)] if text else []
+
+
+class FaultStats:
+    """
+    Contadores de los requests atendidos y las fallas inyectadas.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.delayed = 0
+        self.throttled = 0
+        self.dropped = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def add(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def summary(self) -> str:
+        return (
+            f"Requests: {self.requests} | Demorados: {self.delayed} | "
+            f"Con ancho de banda limitado: {self.throttled} | "
+            f"Conexiones cortadas: {self.dropped} | Errores inyectados: {self.errors}"
+        )
+
+
+class _ProxyHandler(QuietRequestHandlerMixin, BaseHTTPRequestHandler):
+    """
+    Reenvía cada request al upstream aplicando la primera regla que coincida.
+    """
+
+    proxy: "FaultProxy" = None
+
+    def _handle(self):
+        proxy = self.proxy
+        proxy.stats.add("requests")
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        rule = proxy.match(self.command, self.path)
+
+        if rule is not None:
+            delay = max(rule.latency + proxy.uniform(-rule.jitter, rule.jitter), 0.0)
+            if delay:
+                proxy.stats.add("delayed")
+                time.sleep(delay)
+            if proxy.chance(rule.drop_rate):
+                # Se cierra el socket sin responder: el cliente ve la conexión cortada
+                proxy.stats.add("dropped")
+                self.close_connection = True
+                return
+            if proxy.chance(rule.error_rate):
+                proxy.stats.add("errors")
+                return self._respond_error(
+                    rule.error_status, "Falla inyectada por el proxy"
+                )
+
+        try:
+            status, headers, payload = proxy.forward(
+                self.command, self.path, self.headers, body
+            )
+        except OSError as e:
+            return self._respond_error(502, f"Upstream no disponible: {e}")
+        bandwidth = rule.bandwidth if rule is not None else None
+        if bandwidth:
+            proxy.stats.add("throttled")
+        self._respond(status, headers, payload, bandwidth)
+
+    def _respond_error(self, status: int, message: str):
+        payload = json.dumps({"error": message}).encode("utf-8")
+        content_type = [("Content-Type", "application/json; charset=utf-8")]
+        self._respond(status, content_type, payload, None)
+
+    def _respond(self, status, headers, payload: bytes, bandwidth):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        if not bandwidth:
+            self.wfile.write(payload)
+            return
+        # Se envía en bloques de ~50ms para respetar el ancho de banda indicado
+        chunk_size = max(int(bandwidth / 20), 1)
+        for start in range(0, len(payload), chunk_size):
+            chunk = payload[start : start + chunk_size]
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            time.sleep(len(chunk) / bandwidth)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _handle
+
+
+class FaultProxy(BackgroundHTTPServer):
+    """
+    Proxy inverso hacia upstream con degradaciones configurables por ruta.
+    Las pruebas usan la URL del proxy como URL base del sitio o de la API.
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        rules=(),
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed: int = None,
+        timeout: float = 60.0,
+    ):
+        parts = urlsplit(upstream)
+        self.upstream = upstream.rstrip("/")
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self._timeout = timeout
+        self.rules = list(rules)
+        self.stats = FaultStats()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        handler = type("FaultProxyHandler", (_ProxyHandler,), {"proxy": self})
+        super().__init__(handler, host, port)
+
+    def match(self, method: str, path: str):
+        """
+        Retorna la primera regla que aplica al request o None.
+        """
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule
+        return None
+
+    def uniform(self, low: float, high: float) -> float:
+        with self._rng_lock:
+            return self._rng.uniform(low, high)
+
+    def chance(self, probability: float) -> bool:
+        if probability <= 0:
+            return False
+        with self._rng_lock:
+            return self._rng.random() < probability
+
+    def forward(self, method: str, path: str, headers, body):
+        """
+        Envía el request al upstream y retorna (status, headers, body) de su respuesta.
+        El body se reenvía tal cual, incluso comprimido.
+        """
+        connection_class = (
+            http.client.HTTPSConnection
+            if self._scheme == "https"
+            else http.client.HTTPConnection
+        )
+        connection = connection_class(self._netloc, timeout=self._timeout)
+        try:
+            forwarded = {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in _HOP_BY_HOP
+            }
+            forwarded["Host"] = self._netloc
+            connection.request(
+                method, self._base_path + path, body=body, headers=forwarded
+            )
+            response = connection.getresponse()
+            payload = response.read()
+            response_headers = []
+            for name, value in response.getheaders():
+                if name.lower() in _HOP_BY_HOP:
+                    continue
+                if name.lower() == "location":
+                    value = value.replace(self.upstream, self.url)
+                response_headers.append((name, value))
+            return response.status, response_headers, payload
+        finally:
+            connection.close()
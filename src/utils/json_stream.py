@@ -0,0 +1,99 @@
+"""
+Módulo para recorrer un array JSON de forma incremental a partir de un flujo de bytes.
+Solo mantiene en memoria el elemento que se está decodificando y el bloque leído,
+de modo que colecciones grandes se validan sin cargar la respuesta completa.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+_WHITESPACE = " \t\n\r"
+
+
+class JSONStreamError(ValueError):
+    """
+    El flujo no contiene un array JSON válido.
+    """
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Devuelve uno a uno los elementos de un array JSON recibido en bloques de bytes.
+
+    Args:
+        chunks: Bloques de bytes, por ejemplo response.iter_content()
+        encoding: Codificación del contenido
+
+    Raises:
+        JSONStreamError: Si el contenido no es un array JSON o está incompleto
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    chunks = iter(chunks)
+    buffer = ""
+    position = 0
+    finished = False
+    started = False
+
+    def read_more() -> bool:
+        nonlocal buffer, position, finished
+        if finished:
+            return False
+        chunk = next(chunks, None)
+        if chunk is None:
+            finished = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
+        return True
+
+    def next_token() -> str:
+        # Avanza hasta el próximo carácter significativo, leyendo más bloques si hace falta
+        nonlocal position
+        while True:
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                return ""
+
+    # El contenido puede empezar con BOM
+    if next_token() == "\ufeff":
+        position += 1
+    if next_token() != "[":
+        raise JSONStreamError("La respuesta no es un array JSON")
+    position += 1
+
+    while True:
+        token = next_token()
+        if token == "]":
+            return
+        if not token:
+            raise JSONStreamError("Array JSON incompleto: falta el ']' de cierre")
+        if started:
+            if token != ",":
+                raise JSONStreamError(f"Se esperaba ',' o ']' y se encontró {token!r}")
+            position += 1
+            next_token()
+        started = True
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as error:
+                if not read_more():
+                    raise JSONStreamError(
+                        f"Array JSON incompleto o inválido: {error}"
+                    ) from error
+                continue
+            # Un número al final del bloque puede seguir en el próximo bloque
+            if end == len(buffer) and not finished:
+                read_more()
+                continue
+            break
+
+        position = end
+        yield value
@@ -0,0 +1,154 @@
+"""
+Módulo para acumular latencias de requests en histogramas de memoria acotada.
+Los percentiles se calculan sobre buckets logarítmicos, con un error relativo
+máximo de BUCKET_GROWTH - 1 (5%) sin guardar cada muestra.
+"""
+
+import json
+import math
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict
+from urllib.parse import urlsplit
+
+# Rango cubierto por los buckets: de 0.1ms a 10 minutos
+MIN_LATENCY = 0.0001
+MAX_LATENCY = 600.0
+BUCKET_GROWTH = 1.05
+
+_BUCKET_COUNT = math.ceil(math.log(MAX_LATENCY / MIN_LATENCY, BUCKET_GROWTH)) + 1
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias (segundos) con buckets de crecimiento geométrico.
+    El bucket i cubre hasta MIN_LATENCY * BUCKET_GROWTH ** i segundos.
+    """
+
+    def __init__(self):
+        self.counts = [0] * _BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @staticmethod
+    def _bucket(seconds: float) -> int:
+        if seconds <= MIN_LATENCY:
+            return 0
+        index = math.ceil(math.log(seconds / MIN_LATENCY, BUCKET_GROWTH))
+        return min(index, _BUCKET_COUNT - 1)
+
+    def record(self, seconds: float):
+        """
+        Registra una latencia.
+        """
+        self.counts[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Retorna el límite superior del bucket que contiene el percentil pedido,
+        acotado por la latencia máxima observada. El último bucket no tiene
+        límite (acumula todo lo que supera MAX_LATENCY): ahí retorna el máximo.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(fraction * self.count), 1)
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == _BUCKET_COUNT - 1:
+                    return self.max
+                return min(MIN_LATENCY * BUCKET_GROWTH**index, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Resume el histograma con percentiles en milisegundos.
+        """
+        return {
+            "count": self.count,
+            "mean_ms": self.mean * 1000,
+            "p50_ms": self.percentile(0.50) * 1000,
+            "p90_ms": self.percentile(0.90) * 1000,
+            "p99_ms": self.percentile(0.99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """
+    Clave "MÉTODO path" de un request, con los IDs numéricos reemplazados por {id}
+    para que /posts/1 y /posts/2 se agrupen en el mismo endpoint.
+    """
+    path = _ID_SEGMENT.sub("/{id}", urlsplit(url).path) or "/"
+    return f"{method.upper()} {path}"
+
+
+class LatencyRecorder:
+    """
+    Histogramas de latencia agrupados por endpoint y método, seguros entre hilos.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float):
+        """
+        Registra una latencia bajo la clave indicada.
+        """
+        with self._lock:
+            self.histograms.setdefault(key, LatencyHistogram()).record(seconds)
+
+    def record_response(self, response):
+        """
+        Registra la latencia de un Response de requests bajo su endpoint normalizado.
+        """
+        key = endpoint_key(response.request.method, response.request.url)
+        self.record(key, response.elapsed.total_seconds())
+
+    def __bool__(self) -> bool:
+        return bool(self.histograms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Devuelve los percentiles de cada endpoint en un formato serializable a JSON.
+        """
+        with self._lock:
+            return {
+                key: histogram.to_dict()
+                for key, histogram in sorted(self.histograms.items())
+            }
+
+    def summary(self) -> str:
+        """
+        Devuelve una línea legible por endpoint con sus percentiles.
+        """
+        return "\n".join(
+            f"{key}: {stats['count']} req, p50 {stats['p50_ms']:.0f}ms, "
+            f"p90 {stats['p90_ms']:.0f}ms, p99 {stats['p99_ms']:.0f}ms, "
+            f"máx {stats['max_ms']:.0f}ms"
+            for key, stats in self.to_dict().items()
+        )
+
+    def write_report(self, path):
+        """
+        Escribe los percentiles de cada endpoint en un archivo JSON.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+
+# Latencias de todas las respuestas validadas con validate_api_response
+api_latencies = LatencyRecorder()
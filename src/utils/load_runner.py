@@ -0,0 +1,190 @@
+"""
+Módulo para ejecutar escenarios de API como prueba de carga.
+Usuarios virtuales (hilos) recorren los escenarios en bucle con ramp-up,
+duración y RPS objetivo configurables, y se mide cada request por endpoint.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable
+
+from utils.api_scenarios import send_scenario
+from utils.latency_stats import LatencyHistogram
+
+
+class EndpointStats:
+    """
+    Latencias y errores acumulados de un endpoint durante la prueba de carga.
+    """
+
+    def __init__(self):
+        self.latencies = LatencyHistogram()
+        self.errors = 0
+
+    @property
+    def requests(self) -> int:
+        return self.latencies.count
+
+    def to_dict(self, duration: float) -> Dict[str, Any]:
+        """
+        Resume el endpoint: throughput, tasa de error y percentiles de latencia (ms).
+        """
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.errors / self.requests if self.requests else 0.0,
+            "throughput_rps": self.requests / duration if duration else 0.0,
+            **self.latencies.to_dict(),
+        }
+
+
+class LoadResult:
+    """
+    Resultado de una prueba de carga agrupado por endpoint ("MÉTODO endpoint").
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self.duration = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency: float, error: bool):
+        """
+        Registra un request terminado.
+        """
+        with self._lock:
+            stats = self.endpoints.setdefault(key, EndpointStats())
+            stats.latencies.record(latency)
+            if error:
+                stats.errors += 1
+
+    @property
+    def requests(self) -> int:
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def errors(self) -> int:
+        return sum(stats.errors for stats in self.endpoints.values())
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Devuelve el resultado en un formato serializable a JSON.
+        """
+        return {
+            "duration_s": self.duration,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "throughput_rps": self.requests / self.duration if self.duration else 0.0,
+            "endpoints": {
+                key: stats.to_dict(self.duration)
+                for key, stats in sorted(self.endpoints.items())
+            },
+        }
+
+    def summary(self) -> str:
+        """
+        Devuelve una tabla legible con las métricas de cada endpoint.
+        """
+        data = self.to_dict()
+        lines = [
+            f"Duración: {data['duration_s']:.1f}s | Requests: {data['requests']} | "
+            f"Throughput: {data['throughput_rps']:.1f} req/s | "
+            f"Errores: {data['errors']} ({data['error_rate']:.2%})"
+        ]
+        for key, stats in data["endpoints"].items():
+            lines.append(
+                f"{key}: {stats['requests']} req, {stats['throughput_rps']:.1f} req/s, "
+                f"errores {stats['error_rate']:.2%}, p50 {stats['p50_ms']:.0f}ms, "
+                f"p90 {stats['p90_ms']:.0f}ms, p99 {stats['p99_ms']:.0f}ms, "
+                f"máx {stats['max_ms']:.0f}ms"
+            )
+        return "\n".join(lines)
+
+
+class _Pacer:
+    """
+    Reparte turnos de envío entre todos los usuarios para no superar el RPS objetivo.
+    """
+
+    def __init__(self, target_rps: float):
+        self._interval = 1.0 / target_rps if target_rps > 0 else 0.0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait_turn(self, deadline: float) -> bool:
+        """
+        Espera el próximo turno libre. Retorna False si el turno cae después del deadline.
+        """
+        if not self._interval:
+            return time.monotonic() < deadline
+        with self._lock:
+            slot = max(self._next_slot, time.monotonic())
+            self._next_slot = slot + self._interval
+        if slot >= deadline:
+            return False
+        time.sleep(max(slot - time.monotonic(), 0.0))
+        return True
+
+
+def run_load(
+    client,
+    scenarios: Iterable[Dict[str, Any]],
+    users: int,
+    duration: float,
+    ramp_up: float = 0.0,
+    target_rps: float = 0.0,
+) -> LoadResult:
+    """
+    Ejecuta los escenarios como prueba de carga.
+
+    Args:
+        client: ApiClient compartido por todos los usuarios virtuales
+        scenarios: Escenarios a recorrer en bucle (formato de escenarios_api.json)
+        users: Cantidad de usuarios virtuales concurrentes
+        duration: Duración total de la prueba en segundos, incluido el ramp-up
+        ramp_up: Segundos en los que se van sumando los usuarios de forma escalonada
+        target_rps: Requests por segundo objetivo entre todos los usuarios (0 = sin límite)
+
+    Returns:
+        LoadResult con las métricas por endpoint. Un request cuenta como error si
+        lanza una excepción o su status difiere de status_esperado.
+    """
+    scenarios = list(scenarios)
+    result = LoadResult()
+    pacer = _Pacer(target_rps)
+    start = time.monotonic()
+    deadline = start + duration
+
+    def virtual_user(index: int):
+        time.sleep(ramp_up * index / users)
+        # Cada usuario arranca en un escenario distinto para repartir la carga
+        position = index
+        while pacer.wait_turn(deadline):
+            scenario = scenarios[position % len(scenarios)]
+            position += 1
+            key = f"{scenario['metodo']} {scenario['endpoint']}"
+            sent = time.perf_counter()
+            try:
+                # Cada request de la carga debe llegar al servidor, no a la caché
+                response = send_scenario(client, scenario, cache=False)
+                error = response.status_code != scenario["status_esperado"]
+            except Exception:
+                error = True
+            result.record(key, time.perf_counter() - sent, error)
+
+    threads = [
+        threading.Thread(target=virtual_user, args=(index,), name=f"vu-{index}")
+        for index in range(users)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    result.duration = time.monotonic() - start
+    return result
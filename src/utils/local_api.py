@@ -0,0 +1,314 @@
+"""
+Módulo con un reemplazo local de JSONPlaceholder para correr las pruebas de API sin red.
+Implementa los recursos posts, comments, albums, photos, todos y users con las
+mismas formas de respuesta y status codes que el servicio real.
+
+Como en JSONPlaceholder, las escrituras sobre los datos iniciales se simulan sin
+modificarlos. Los recursos creados con POST sí se guardan en memoria mientras el
+servidor esté activo, para que el ciclo de vida crear -> leer -> modificar ->
+eliminar funcione de punta a punta.
+"""
+
+import json
+import random
+import re
+import threading
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import parse_qsl, urlsplit
+
+from utils.local_server import BackgroundHTTPServer, QuietRequestHandlerMixin
+
+_WORDS = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua enim ad minim veniam quis nostrud "
+    "exercitation ullamco laboris nisi aliquip ex ea commodo consequat duis aute irure "
+    "in reprehenderit voluptate velit esse cillum fugiat nulla pariatur excepteur sint "
+    "occaecat cupidatat non proident sunt culpa qui officia deserunt mollit anim id est"
+).split()
+
+# Recurso padre -> campo que referencia su id en los recursos hijos
+_PARENT_FIELDS = {
+    "posts": "postId",
+    "albums": "albumId",
+    "users": "userId",
+}
+
+_PATH = re.compile(r"^/(?P<resource>\w+)(?:/(?P<id>\d+)(?:/(?P<child>\w+))?)?/?$")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words))
+
+
+def build_dataset(seed: int = 1):
+    """
+    Genera los datos iniciales con la misma cantidad y estructura que JSONPlaceholder.
+
+    Returns:
+        Dict recurso -> lista de elementos ordenados por id
+    """
+    rng = random.Random(seed)
+    users = [
+        {
+            "id": user_id,
+            "name": f"User {user_id}",
+            "username": f"user{user_id}",
+            "email": f"user{user_id}@example.com",
+            "address": {
+                "street": f"{_sentence(rng, 2).title()} Street",
+                "suite": f"Apt. {rng.randint(100, 999)}",
+                "city": _sentence(rng, 1).title(),
+                "zipcode": f"{rng.randint(10000, 99999)}-{rng.randint(1000, 9999)}",
+                "geo": {
+                    "lat": f"{rng.uniform(-90, 90):.4f}",
+                    "lng": f"{rng.uniform(-180, 180):.4f}",
+                },
+            },
+            "phone": f"1-770-736-{rng.randint(1000, 9999)}",
+            "website": f"user{user_id}.org",
+            "company": {
+                "name": _sentence(rng, 2).title(),
+                "catchPhrase": _sentence(rng, 4),
+                "bs": _sentence(rng, 3),
+            },
+        }
+        for user_id in range(1, 11)
+    ]
+    posts = [
+        {
+            "userId": (post_id - 1) // 10 + 1,
+            "id": post_id,
+            "title": _sentence(rng, 6),
+            "body": _sentence(rng, 25),
+        }
+        for post_id in range(1, 101)
+    ]
+    comments = [
+        {
+            "postId": (comment_id - 1) // 5 + 1,
+            "id": comment_id,
+            "name": _sentence(rng, 5),
+            "email": f"commenter{comment_id}@example.com",
+            "body": _sentence(rng, 20),
+        }
+        for comment_id in range(1, 501)
+    ]
+    albums = [
+        {
+            "userId": (album_id - 1) // 10 + 1,
+            "id": album_id,
+            "title": _sentence(rng, 4),
+        }
+        for album_id in range(1, 101)
+    ]
+    photos = [
+        {
+            "albumId": (photo_id - 1) // 50 + 1,
+            "id": photo_id,
+            "title": _sentence(rng, 5),
+            "url": f"https://via.placeholder.com/600/{photo_id:06x}",
+            "thumbnailUrl": f"https://via.placeholder.com/150/{photo_id:06x}",
+        }
+        for photo_id in range(1, 5001)
+    ]
+    todos = [
+        {
+            "userId": (todo_id - 1) // 20 + 1,
+            "id": todo_id,
+            "title": _sentence(rng, 4),
+            "completed": rng.random() < 0.5,
+        }
+        for todo_id in range(1, 201)
+    ]
+    return {
+        "posts": posts,
+        "comments": comments,
+        "albums": albums,
+        "photos": photos,
+        "todos": todos,
+        "users": users,
+    }
+
+
+class ResourceStore:
+    """
+    Datos del servidor: los iniciales (solo lectura) y los creados con POST.
+    """
+
+    def __init__(self, dataset):
+        self._seed = {
+            resource: {item["id"]: item for item in items}
+            for resource, items in dataset.items()
+        }
+        self._created = {resource: {} for resource in dataset}
+        self._next_id = {
+            resource: len(items) + 1 for resource, items in dataset.items()
+        }
+        self._serialized = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, resource: str) -> bool:
+        return resource in self._seed
+
+    def get(self, resource: str, item_id: int):
+        with self._lock:
+            item = self._created[resource].get(item_id)
+        return item if item is not None else self._seed[resource].get(item_id)
+
+    def _items(self, resource: str):
+        return list(self._seed[resource].values()) + list(
+            self._created[resource].values()
+        )
+
+    def list(self, resource: str, filters):
+        """
+        Lista el recurso aplicando filtros campo=valor (comparados como texto).
+        """
+        with self._lock:
+            items = self._items(resource)
+        return [
+            item
+            for item in items
+            if all(str(item.get(field)) == value for field, value in filters)
+        ]
+
+    def list_bytes(self, resource: str) -> bytes:
+        """
+        Colección completa ya serializada; se reutiliza hasta la próxima escritura.
+        """
+        with self._lock:
+            cached = self._serialized.get(resource)
+            if cached is None:
+                cached = json.dumps(self._items(resource), indent=2).encode("utf-8")
+                self._serialized[resource] = cached
+        return cached
+
+    def create(self, resource: str, data: dict) -> dict:
+        with self._lock:
+            item = {**data, "id": self._next_id[resource]}
+            self._next_id[resource] += 1
+            self._created[resource][item["id"]] = item
+            self._serialized.pop(resource, None)
+        return item
+
+    def update(self, resource: str, item_id: int, data: dict, partial: bool):
+        """
+        PUT reemplaza el recurso y PATCH combina los campos. Retorna None si no existe.
+        """
+        current = self.get(resource, item_id)
+        if current is None:
+            return None
+        item = {**current, **data} if partial else {**data}
+        item["id"] = item_id
+        with self._lock:
+            if item_id in self._created[resource]:
+                self._created[resource][item_id] = item
+                self._serialized.pop(resource, None)
+        return item
+
+    def delete(self, resource: str, item_id: int):
+        with self._lock:
+            if self._created[resource].pop(item_id, None) is not None:
+                self._serialized.pop(resource, None)
+
+
+class _Handler(QuietRequestHandlerMixin, BaseHTTPRequestHandler):
+    """
+    Atiende los requests con las rutas de JSONPlaceholder.
+    """
+
+    store: ResourceStore = None
+
+    def _send(self, status: int, payload=None, body: bytes = None):
+        if body is None:
+            payload = {} if payload is None else payload
+            body = json.dumps(payload, indent=2).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self):
+        """
+        Retorna (recurso, id, recurso hijo, filtros) o None si la ruta no existe.
+        """
+        url = urlsplit(self.path)
+        match = _PATH.match(url.path)
+        if match is None or match["resource"] not in self.store:
+            return None
+        child = match["child"]
+        if child is not None and (
+            child not in self.store or match["resource"] not in _PARENT_FIELDS
+        ):
+            return None
+        item_id = int(match["id"]) if match["id"] else None
+        return match["resource"], item_id, child, parse_qsl(url.query)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw) if raw else {}
+
+    def do_GET(self):
+        route = self._route()
+        if route is None:
+            return self._send(404)
+        resource, item_id, child, filters = route
+        if item_id is None:
+            if not filters:
+                return self._send(200, body=self.store.list_bytes(resource))
+            return self._send(200, self.store.list(resource, filters))
+        if child is not None:
+            filters = [(_PARENT_FIELDS[resource], str(item_id)), *filters]
+            return self._send(200, self.store.list(child, filters))
+        item = self.store.get(resource, item_id)
+        return self._send(404) if item is None else self._send(200, item)
+
+    def do_POST(self):
+        route = self._route()
+        if route is None or route[1] is not None:
+            return self._send(404)
+        try:
+            data = self._read_json()
+        except ValueError:
+            return self._send(400)
+        return self._send(201, self.store.create(route[0], data))
+
+    def _update(self, partial: bool):
+        route = self._route()
+        if route is None or route[1] is None or route[2] is not None:
+            return self._send(404)
+        try:
+            data = self._read_json()
+        except ValueError:
+            return self._send(400)
+        item = self.store.update(route[0], route[1], data, partial)
+        return self._send(404) if item is None else self._send(200, item)
+
+    def do_PUT(self):
+        self._update(partial=False)
+
+    def do_PATCH(self):
+        self._update(partial=True)
+
+    def do_DELETE(self):
+        route = self._route()
+        if route is None or route[1] is None or route[2] is not None:
+            return self._send(404)
+        self.store.delete(route[0], route[1])
+        return self._send(200)
+
+
+class LocalApiServer(BackgroundHTTPServer):
+    """
+    Servidor HTTP multihilo con el reemplazo de JSONPlaceholder, en un hilo de fondo.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, dataset=None):
+        handler = type(
+            "JSONPlaceholderHandler",
+            (_Handler,),
+            {"store": ResourceStore(dataset or build_dataset())},
+        )
+        super().__init__(handler, host, port)
@@ -0,0 +1,72 @@
+"""
+Módulo con la base de los servidores HTTP locales que usan las pruebas.
+"""
+
+import socket
+import threading
+from http.server import ThreadingHTTPServer
+
+
+class QuietRequestHandlerMixin:
+    """
+    Base de los handlers de los servidores locales: conexiones keep-alive
+    (HTTP/1.1) y sin log por request, ya que corren dentro de la sesión de pytest.
+    Se combina con BaseHTTPRequestHandler o una de sus subclases.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _NoDelayHTTPServer(ThreadingHTTPServer):
+    """
+    Servidor que desactiva el algoritmo de Nagle en cada conexión aceptada.
+    Los handlers escriben headers y body por separado: con Nagle, el body espera
+    el ACK demorado del cliente (~40ms) en cada respuesta keep-alive.
+    """
+
+    def get_request(self):
+        connection, address = super().get_request()
+        connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return connection, address
+
+
+class BackgroundHTTPServer:
+    """
+    Servidor HTTP multihilo que atiende requests en un hilo de fondo.
+    Con port=0 el sistema operativo asigna un puerto libre.
+    """
+
+    def __init__(self, handler_class, host: str = "127.0.0.1", port: int = 0):
+        self._server = _NoDelayHTTPServer((host, port), handler_class)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Inicia el servidor y retorna su URL base.
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name=type(self).__name__,
+            daemon=True,
+        )
+        self._thread.start()
+        return self.url
+
+    def close(self):
+        """
+        Detiene el servidor y libera el puerto.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
@@ -0,0 +1,195 @@
+"""
+Módulo con la línea base de performance de la suite.
+Guarda el historial de latencias de cada test (endpoints de API y cargas de
+página de UI) y compara cada ejecución contra su propio historial con un test
+estadístico sobre el logaritmo de las latencias.
+"""
+
+import json
+import math
+import statistics
+import threading
+from pathlib import Path
+from typing import Dict, List
+
+from utils import config
+
+# Desvío mínimo (en escala logarítmica) para que un historial muy estable no
+# convierta cualquier variación de milisegundos en una regresión
+_MIN_LOG_STDEV = 0.05
+
+
+class BaselineStore:
+    """
+    Historial persistente en JSON: para cada clave, el valor medio (log de segundos)
+    de las últimas ejecuciones, hasta max_history valores.
+    """
+
+    def __init__(self, path, max_history: int = config.PERF_BASELINE_HISTORY):
+        self.path = Path(path)
+        self.max_history = max_history
+        self._history = None
+
+    @property
+    def history(self) -> Dict[str, List[float]]:
+        if self._history is None:
+            self._history = {}
+            if self.path.exists():
+                try:
+                    self._history = json.loads(self.path.read_text(encoding="utf-8"))
+                except (ValueError, OSError):
+                    # Un archivo dañado no frena la suite: se arranca un historial nuevo
+                    self._history = {}
+        return self._history
+
+    def get(self, key: str) -> List[float]:
+        """
+        Retorna el historial de la clave (vacío si no existe).
+        """
+        return self.history.get(key, [])
+
+    def append(self, key: str, value: float):
+        """
+        Agrega el valor de esta ejecución, descartando los más antiguos.
+        """
+        values = self.history.setdefault(key, [])
+        values.append(value)
+        del values[: -self.max_history]
+
+    def save(self):
+        """
+        Escribe el historial en disco.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.history, indent=1), encoding="utf-8")
+
+
+class Regression:
+    """
+    Métrica de un test que resultó significativamente más lenta que su historial.
+    """
+
+    def __init__(
+        self,
+        test_id: str,
+        metric: str,
+        current: float,
+        baseline: float,
+        z_score: float,
+    ):
+        self.test_id = test_id
+        self.metric = metric
+        self.current = current
+        self.baseline = baseline
+        self.z_score = z_score
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.metric}: {self.current * 1000:.0f}ms contra una línea base de "
+            f"{self.baseline * 1000:.0f}ms (x{self.ratio:.2f}, z={self.z_score:.1f})"
+        )
+
+
+class PerfTracker:
+    """
+    Registra las latencias del test en curso y las compara con la línea base.
+    Cada métrica se resume como la media geométrica de sus muestras en el test
+    y se marca como regresión cuando, con al menos min_runs ejecuciones previas,
+    su z-score supera z_threshold y además es min_ratio veces más lenta.
+    """
+
+    def __init__(
+        self,
+        store: BaselineStore,
+        enabled: bool = config.PERF_BASELINE,
+        min_runs: int = config.PERF_BASELINE_MIN_RUNS,
+        z_threshold: float = config.PERF_REGRESSION_Z,
+        min_ratio: float = config.PERF_REGRESSION_MIN_RATIO,
+    ):
+        self.store = store
+        self.enabled = enabled
+        self.min_runs = min_runs
+        self.z_threshold = z_threshold
+        self.min_ratio = min_ratio
+        self.regressions = []
+        self._current_test = None
+        self._samples = {}
+        self._run_values = {}
+        self._lock = threading.Lock()
+
+    def begin(self, test_id: str):
+        """
+        Comienza a registrar las latencias de un test.
+        """
+        with self._lock:
+            self._current_test = test_id
+            self._samples = {}
+
+    def record(self, metric: str, seconds: float, target: str = ""):
+        """
+        Registra una latencia del test en curso. Fuera de un test no hace nada.
+        target identifica contra qué se midió (API local, servicio real, proxy
+        de fallas...) para no comparar la métrica con el historial de otro destino.
+        """
+        if not self.enabled or seconds <= 0:
+            return
+        if target:
+            metric = f"{metric} @ {target}"
+        with self._lock:
+            if self._current_test is not None:
+                self._samples.setdefault(metric, []).append(math.log(seconds))
+
+    def finish(self, test_id: str) -> List[Regression]:
+        """
+        Cierra el test y retorna las métricas que empeoraron respecto de su historial.
+        """
+        with self._lock:
+            if test_id != self._current_test:
+                return []
+            samples, self._samples = self._samples, {}
+            self._current_test = None
+
+        regressions = []
+        for metric, logs in sorted(samples.items()):
+            key = f"{test_id}::{metric}"
+            current = statistics.fmean(logs)
+            self._run_values[key] = current
+            regression = self._compare(test_id, metric, current, self.store.get(key))
+            if regression is not None:
+                regressions.append(regression)
+        self.regressions.extend(regressions)
+        return regressions
+
+    def _compare(
+        self, test_id: str, metric: str, current: float, history: List[float]
+    ):
+        """
+        Test z unilateral del valor actual contra la distribución de ejecuciones previas.
+        """
+        # El desvío necesita al menos dos ejecuciones previas
+        if len(history) < max(self.min_runs, 2):
+            return None
+        mean = statistics.fmean(history)
+        stdev = max(statistics.stdev(history), _MIN_LOG_STDEV)
+        z_score = (current - mean) / stdev
+        if z_score < self.z_threshold or current - mean < math.log(self.min_ratio):
+            return None
+        return Regression(test_id, metric, math.exp(current), math.exp(mean), z_score)
+
+    def save(self):
+        """
+        Agrega los valores de esta ejecución al historial y lo guarda.
+        """
+        if not self.enabled or not self._run_values:
+            return
+        for key, value in self._run_values.items():
+            self.store.append(key, value)
+        self.store.save()
+
+
+# Línea base compartida por las pruebas de API y de UI
+perf_tracker = PerfTracker(BaselineStore(config.PERF_BASELINE_PATH))
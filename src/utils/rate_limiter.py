@@ -0,0 +1,132 @@
+"""
+Módulo con el limitador de tasa (token bucket) de los requests de las pruebas de API.
+La tasa se adapta sola: ante un 429 o 503 se reduce a la mitad y se pausan los
+envíos el tiempo indicado por Retry-After; con cada respuesta normal se
+recupera de a poco hasta volver al máximo configurado.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Status con los que el servidor indica que se le está enviando demasiado
+THROTTLE_STATUSES = {429, 503}
+
+# Espera máxima ante un Retry-After o un backoff (segundos)
+MAX_BACKOFF = 30.0
+
+
+def retry_after(response, default: float) -> float:
+    """
+    Segundos a esperar según el header Retry-After (en segundos o como fecha HTTP).
+    Si no está o no se puede interpretar, retorna default.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return min(default, MAX_BACKOFF)
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            moment = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return min(default, MAX_BACKOFF)
+        delay = (moment - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), MAX_BACKOFF)
+
+
+class RateLimiter:
+    """
+    Token bucket compartido por todos los hilos que envían requests.
+
+    Args:
+        rate: Requests por segundo máximos
+        burst: Requests que se pueden enviar seguidos antes de esperar
+        retries: Reintentos de un request que recibió 429/503
+    """
+
+    def __init__(self, rate: float, burst: int = 1, retries: int = 3):
+        self.max_rate = rate
+        self.rate = rate
+        self.min_rate = rate / 16
+        self.burst = max(burst, 1)
+        self.retries = retries
+        self.requests = 0
+        self.throttled = 0
+        self.retried = 0
+        self.waited = 0.0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._first = None
+        self._last = None
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Bloquea hasta que el request pueda enviarse respetando la tasa actual.
+        Cada llamada reserva un token: los hilos en espera salen en orden y espaciados.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            wait = max(self._paused_until - now, 0.0)
+            if self._tokens < 0:
+                wait = max(wait, -self._tokens / self.rate)
+            self.requests += 1
+            self.waited += wait
+            self._first = now + wait if self._first is None else self._first
+            self._last = max(self._last or 0.0, now + wait)
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_success(self):
+        """
+        Recupera la tasa de a poco (5% del máximo por respuesta) tras un throttling.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * 0.05)
+
+    def on_throttled(self, delay: float, retry: bool):
+        """
+        Reduce la tasa a la mitad y pausa todos los envíos durante delay segundos.
+        """
+        with self._lock:
+            self.throttled += 1
+            self.retried += 1 if retry else 0
+            self.rate = max(self.rate / 2, self.min_rate)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            # Los tokens acumulados no sirven después de una pausa
+            self._tokens = min(self._tokens, 0.0)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Espera por defecto cuando el servidor no envía Retry-After.
+        """
+        return min((2**attempt) / self.rate, MAX_BACKOFF)
+
+    @property
+    def achieved_rate(self) -> float:
+        """
+        Requests por segundo efectivamente enviados entre el primero y el último.
+        """
+        if self.requests < 2 or self._last <= self._first:
+            return 0.0
+        return (self.requests - 1) / (self._last - self._first)
+
+    def summary(self) -> str:
+        """
+        Devuelve un resumen legible de los contadores.
+        """
+        return (
+            f"Requests: {self.requests} | Tasa lograda: {self.achieved_rate:.1f} req/s | "
+            f"Tasa actual: {self.rate:.1f}/{self.max_rate:.1f} req/s | "
+            f"Espera total: {self.waited:.2f}s | Respuestas 429/503: {self.throttled} | "
+            f"Reintentos: {self.retried}"
+        )
@@ -0,0 +1,156 @@
+"""
+Módulo para recorrer y validar todos los elementos de una colección de la API.
+Lee la colección completa, pide cada elemento por id con concurrencia acotada
+sobre el cliente con pool de conexiones y aplica a cada respuesta los mismos
+niveles que validate_api_response (status, headers, esquema y tiempo), pero
+acumulando los resultados en un resumen en lugar de un check por elemento.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.api_utils import (
+    headers_error,
+    items_error,
+    performance_error,
+    record_response_latency,
+    status_error,
+)
+from utils.latency_stats import LatencyHistogram
+from utils.schema_validator import compile_schema, scan_items
+
+# Cantidad de fallas que se conservan con detalle en el resumen
+MAX_FAILURE_DETAILS = 5
+
+
+class SweepResult:
+    """
+    Resultado del recorrido de una colección: requests, fallas y latencias.
+    """
+
+    def __init__(self, resource: str):
+        self.resource = resource
+        self.expected = 0
+        self.failures = 0
+        self.details: List[Tuple[str, str]] = []
+        self.latencies = LatencyHistogram()
+        self.duration = 0.0
+
+    @property
+    def requests(self) -> int:
+        return self.latencies.count
+
+    def add(self, path: str, latency: Optional[float], error: Optional[str]):
+        """
+        Registra un request terminado; latency es None si no hubo respuesta.
+        """
+        if latency is not None:
+            self.latencies.record(latency)
+        if error is not None:
+            self.failures += 1
+            if len(self.details) < MAX_FAILURE_DETAILS:
+                self.details.append((path, error))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "resource": self.resource,
+            "items": self.expected,
+            "requests": self.requests,
+            "failures": self.failures,
+            "failure_details": [f"{path}: {error}" for path, error in self.details],
+            "duration_s": round(self.duration, 3),
+            "throughput_rps": self.requests / self.duration if self.duration else 0.0,
+            **self.latencies.to_dict(),
+        }
+
+    def summary(self) -> str:
+        """
+        Resumen de una línea del recorrido.
+        """
+        rps = self.requests / self.duration if self.duration else 0.0
+        latencies = self.latencies
+        return (
+            f"/{self.resource}: {self.expected} elementos, {self.requests} requests "
+            f"en {self.duration:.2f}s ({rps:.0f} req/s), {self.failures} fallas, "
+            f"p50 {latencies.percentile(0.5) * 1000:.0f}ms, "
+            f"p99 {latencies.percentile(0.99) * 1000:.0f}ms"
+        )
+
+
+def response_error(response, expected_status: int, validator, max_time: float):
+    """
+    Aplica los niveles de validate_api_response a una respuesta y, en lugar de
+    un check por nivel, retorna el primer error encontrado. Usa las mismas
+    verificaciones de api_utils y registra la latencia igual que la validación
+    completa.
+
+    Returns:
+        Tupla (cuerpo JSON o None, mensaje de error o None)
+    """
+    record_response_latency(response)
+    error = status_error(response, expected_status) or headers_error(
+        response, expected_status
+    )
+    if error is not None:
+        return None, error
+    try:
+        body = response.json()
+    except ValueError as e:
+        return None, f"Error al parsear JSON: {e}"
+    items = body if isinstance(body, list) else [body]
+    error = items_error(*scan_items(validator, items)) or performance_error(
+        response, max_time
+    )
+    return body, error
+
+
+def sweep_resource(
+    client, resource: str, schema, concurrency: int, max_time: float = 15.0
+) -> SweepResult:
+    """
+    Valida la colección /resource y cada elemento /resource/{id} contra el esquema.
+
+    Args:
+        client: ApiClient con pool de conexiones (al menos concurrency conexiones)
+        resource: Nombre de la colección (por ejemplo "posts")
+        schema: Esquema de utils/api_schemas.py de los elementos
+        concurrency: Requests simultáneos máximos
+        max_time: Tiempo máximo de cada respuesta en segundos
+
+    Returns:
+        SweepResult con el resumen del recorrido
+    """
+    result = SweepResult(resource)
+    validator = compile_schema(schema)
+    started = time.perf_counter()
+
+    def fetch(path: str, expected_id: Optional[int] = None):
+        # Los elementos se piden una sola vez: no tiene sentido pasar por la caché
+        try:
+            response = client.get(path, cache=False)
+        except Exception as e:
+            return path, None, None, f"{type(e).__name__}: {e}"
+        body, error = response_error(response, 200, validator, max_time)
+        if error is None and expected_id is not None and body.get("id") != expected_id:
+            error = f"id {body.get('id')} (esperado {expected_id})"
+        return path, response.elapsed.total_seconds(), body, error
+
+    path, latency, collection, error = fetch(f"/{resource}")
+    result.add(path, latency, error)
+    if isinstance(collection, list):
+        ids = [
+            item["id"]
+            for item in collection
+            if isinstance(item, dict) and item.get("id") is not None
+        ]
+        result.expected = len(ids)
+        with ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix=f"sweep-{resource}"
+        ) as executor:
+            paths = (f"/{resource}/{item_id}" for item_id in ids)
+            for path, latency, _, error in executor.map(fetch, paths, ids):
+                result.add(path, latency, error)
+
+    result.duration = time.perf_counter() - started
+    return result
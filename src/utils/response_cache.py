@@ -0,0 +1,125 @@
+"""
+Módulo con la caché de respuestas GET compartida por las pruebas de API de una sesión.
+Las entradas se identifican por URL (con query string) y headers del request,
+vencen a los ttl segundos y se descartan por LRU al superar max_entries. Un
+request que modifica un recurso invalida las entradas de su path, de sus
+subrecursos y de la colección que lo contiene.
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+
+def _path(url: str) -> str:
+    return urlsplit(url).path.rstrip("/") or "/"
+
+
+def _affected_paths(path: str):
+    """
+    Paths cuyo contenido cambia al modificar path: el recurso y su colección.
+    Por ejemplo, /posts/1 afecta a /posts/1 y a /posts.
+    """
+    parent = path.rsplit("/", 1)[0]
+    return {path, parent} if parent else {path}
+
+
+class ResponseCache:
+    """
+    Caché LRU con vencimiento de respuestas de requests ya descargadas.
+
+    Args:
+        ttl: Segundos que una respuesta se considera vigente
+        max_entries: Cantidad máxima de respuestas guardadas
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(request) -> tuple:
+        """
+        Clave de un PreparedRequest: URL completa y headers sin distinguir mayúsculas.
+        """
+        headers = tuple(
+            sorted((name.lower(), value) for name, value in request.headers.items())
+        )
+        return request.url, headers
+
+    def get(self, key: tuple):
+        """
+        Retorna una copia de la respuesta vigente para la clave, o None.
+        La copia lleva from_cache=True para distinguirla de una respuesta de red.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        response = copy.copy(entry[1])
+        response.from_cache = True
+        return response
+
+    def put(self, key: tuple, response):
+        """
+        Guarda una respuesta exitosa con el contenido ya descargado.
+        """
+        if response.status_code != 200 or not response._content_consumed:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, url: str):
+        """
+        Descarta las entradas afectadas por un request que modificó url:
+        el mismo recurso, sus subrecursos y la colección que lo contiene.
+        """
+        path = _path(url)
+        affected = _affected_paths(path)
+        prefix = path + "/"
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if _path(key[0]) in affected or _path(key[0]).startswith(prefix)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def summary(self) -> str:
+        """
+        Devuelve un resumen legible de los contadores.
+        """
+        total = self.hits + self.misses
+        ratio = self.hits / total if total else 0.0
+        return (
+            f"Aciertos: {self.hits} | Fallos: {self.misses} | "
+            f"Tasa de aciertos: {ratio:.0%} | Invalidaciones: {self.invalidations} | "
+            f"Descartes por tamaño: {self.evictions} | Entradas: {len(self)}"
+        )
@@ -0,0 +1,192 @@
+"""
+Módulo para validar respuestas JSON contra esquemas declarativos.
+Cada esquema se compila una sola vez a funciones Python generadas (sin
+interpretar el esquema por elemento) y se cachea por identidad.
+
+Formato de los esquemas:
+    - Un tipo (str, int, float, bool, None, dict, list) o una tupla de tipos
+      alternativos. float acepta también enteros y bool no se acepta como int.
+    - Un dict de campo -> esquema para objetos. Los campos terminados en "?"
+      son opcionales y los campos no declarados se ignoran.
+    - Una lista con un único esquema para listas de elementos de ese esquema.
+"""
+
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+_MISSING = object()
+
+# Tipos de Python que produce json para cada tipo declarado en un esquema
+_JSON_TYPES = {
+    str: (str,),
+    int: (int,),
+    float: (float, int),
+    bool: (bool,),
+    None: (type(None),),
+    type(None): (type(None),),
+    dict: (dict,),
+    list: (list,),
+}
+
+# Validadores compilados: id(esquema) -> (esquema, validador). Se guarda el
+# esquema para que su id no pueda reutilizarse mientras siga en la caché
+_COMPILED = {}
+
+
+class SchemaError(ValueError):
+    """
+    El esquema declarado no tiene un formato válido.
+    """
+
+
+class _Compiler:
+    """
+    Genera el código fuente de una función por cada objeto o lista del esquema.
+    Cada función retorna None si el valor es válido o un mensaje con la ruta
+    relativa del primer error.
+    """
+
+    def __init__(self):
+        self.namespace = {"_MISSING": _MISSING}
+        self.sources = []
+        self._counter = 0
+
+    def _name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def _types_constant(self, spec) -> Tuple[str, str]:
+        """
+        Registra el conjunto de tipos aceptados y retorna (nombre, descripción).
+        """
+        alternatives = spec if isinstance(spec, tuple) else (spec,)
+        accepted = []
+        for alternative in alternatives:
+            if alternative not in _JSON_TYPES:
+                raise SchemaError(f"Tipo no soportado en el esquema: {alternative!r}")
+            accepted.extend(_JSON_TYPES[alternative])
+        name = self._name("t")
+        self.namespace[name] = frozenset(accepted)
+        description = " | ".join(
+            "null" if alternative in (None, type(None)) else alternative.__name__
+            for alternative in alternatives
+        )
+        return name, description
+
+    def check_lines(self, spec, variable: str, path: str, indent: str):
+        """
+        Líneas que validan variable contra spec y retornan el error con la ruta dada.
+        path es una expresión Python que evalúa a la ruta del valor.
+        """
+        if isinstance(spec, (dict, list)):
+            function = self.compile(spec)
+            return [
+                f"{indent}error = {function}({variable})",
+                f"{indent}if error is not None:",
+                f"{indent}    return {path} + error",
+            ]
+        types, description = self._types_constant(spec)
+        return [
+            f"{indent}if type({variable}) not in {types}:",
+            f"{indent}    return {path} + ': se esperaba {description}, se obtuvo ' "
+            f"+ type({variable}).__name__",
+        ]
+
+    def compile(self, spec) -> str:
+        """
+        Genera la función que valida spec y retorna su nombre.
+        """
+        if isinstance(spec, dict):
+            return self._compile_object(spec)
+        if isinstance(spec, list):
+            return self._compile_list(spec)
+        name = self._name("v")
+        lines = [f"def {name}(value):"]
+        lines += self.check_lines(spec, "value", "''", "    ")
+        lines.append("    return None")
+        self.sources.append("\n".join(lines))
+        return name
+
+    def _compile_object(self, spec: dict) -> str:
+        name = self._name("o")
+        lines = [
+            f"def {name}(value):",
+            "    if type(value) is not dict:",
+            "        return ': se esperaba un objeto, se obtuvo '"
+            " + type(value).__name__",
+        ]
+        for key, field_spec in spec.items():
+            optional = key.endswith("?")
+            field = key[:-1] if optional else key
+            path = repr(f".{field}")
+            lines.append(f"    field = value.get({field!r}, _MISSING)")
+            if optional:
+                lines.append("    if field is not _MISSING:")
+                lines += self.check_lines(field_spec, "field", path, "        ")
+            else:
+                lines.append("    if field is _MISSING:")
+                lines.append(f"        return {path} + ': campo faltante'")
+                lines += self.check_lines(field_spec, "field", path, "    ")
+        lines.append("    return None")
+        self.sources.append("\n".join(lines))
+        return name
+
+    def _compile_list(self, spec: list) -> str:
+        if len(spec) != 1:
+            raise SchemaError(
+                "Un esquema de lista debe declarar un único esquema de elemento"
+            )
+        name = self._name("l")
+        lines = [
+            f"def {name}(value):",
+            "    if type(value) is not list:",
+            "        return ': se esperaba una lista, se obtuvo '"
+            " + type(value).__name__",
+            "    for index, item in enumerate(value):",
+        ]
+        lines += self.check_lines(spec[0], "item", "f'[{index}]'", "        ")
+        lines.append("    return None")
+        self.sources.append("\n".join(lines))
+        return name
+
+
+def compile_schema(schema) -> Callable[[Any], Optional[str]]:
+    """
+    Compila el esquema a un validador, o lo retorna de la caché si ya se compiló.
+
+    Returns:
+        Función que recibe un valor y retorna None si es válido o el mensaje del
+        primer error con su ruta (por ejemplo ".address.geo.lat: campo faltante")
+    """
+    cached = _COMPILED.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    compiler = _Compiler()
+    root = compiler.compile(schema)
+    exec("\n\n".join(compiler.sources), compiler.namespace)
+    validator = compiler.namespace[root]
+    _COMPILED[id(schema)] = (schema, validator)
+    return validator
+
+
+def scan_items(
+    validator: Callable[[Any], Optional[str]], items: Iterable[Any]
+) -> Tuple[int, int, Optional[Tuple[int, str]]]:
+    """
+    Aplica el validador a cada elemento de items.
+
+    Returns:
+        Tupla (total de elementos, elementos inválidos, (índice, error) del primer
+        inválido o None si todos son válidos)
+    """
+    total = 0
+    failing = 0
+    first_failure = None
+    for index, item in enumerate(items):
+        total += 1
+        error = validator(item)
+        if error is not None:
+            failing += 1
+            if first_failure is None:
+                first_failure = (index, error)
+    return total, failing, first_failure
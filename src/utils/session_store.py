@@ -0,0 +1,105 @@
+"""
+Módulo para reutilizar sesiones autenticadas de SauceDemo entre drivers.
+Se captura la sesión luego de un login por UI y se inyecta en los drivers
+siguientes para evitar repetir el formulario de login en cada prueba.
+"""
+
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from utils.logger import ui_logger
+
+# Clave de localStorage donde SauceDemo guarda el carrito; no forma parte de la sesión
+CART_STORAGE_KEY = "cart-contents"
+
+_sessions = {}
+_lock = threading.Lock()
+
+
+def capture_session(driver, username: str):
+    """
+    Guarda las cookies y el localStorage del driver como sesión del usuario indicado.
+    """
+    try:
+        cookies = driver.get_cookies()
+        local_storage = driver.execute_script(
+            "return Object.assign({}, window.localStorage);"
+        )
+    except WebDriverException as e:
+        ui_logger.warning(f"No se pudo capturar la sesión de {username}: {e}")
+        return
+
+    local_storage = dict(local_storage or {})
+    local_storage.pop(CART_STORAGE_KEY, None)
+    with _lock:
+        _sessions[username] = {"cookies": cookies, "local_storage": local_storage}
+    ui_logger.debug(f"Sesión capturada para {username}")
+
+
+def forget_session(username: str):
+    """
+    Descarta la sesión guardada del usuario indicado.
+    """
+    with _lock:
+        _sessions.pop(username, None)
+
+
+def inject_session(driver, username: str, base_url: str, landing_url: str) -> bool:
+    """
+    Inyecta la sesión guardada del usuario y navega a landing_url.
+    Retorna False si no hay sesión guardada o si el sitio no la aceptó.
+    """
+    with _lock:
+        session = _sessions.get(username)
+    if session is None:
+        return False
+
+    try:
+        if not _set_cookies_without_navigation(driver, session["cookies"]):
+            # Sin CDP las cookies solo pueden agregarse estando en el dominio
+            driver.get(base_url)
+            for cookie in session["cookies"]:
+                driver.add_cookie(cookie)
+
+        driver.get(landing_url)
+        if session["local_storage"]:
+            driver.execute_script(
+                "for (const [k, v] of Object.entries(arguments[0])) {"
+                " window.localStorage.setItem(k, v); }",
+                session["local_storage"],
+            )
+
+        if landing_url not in driver.current_url:
+            raise WebDriverException(f"Redirigido a {driver.current_url}")
+    except WebDriverException as e:
+        ui_logger.warning(f"Falló la inyección de sesión para {username}: {e}")
+        forget_session(username)
+        return False
+
+    ui_logger.debug(f"Sesión inyectada para {username}")
+    return True
+
+
+def _set_cookies_without_navigation(driver, cookies) -> bool:
+    """
+    Carga las cookies mediante el protocolo DevTools de Chrome, sin visitar el dominio.
+    """
+    try:
+        for cookie in cookies:
+            params = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain"),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+            }
+            if "expiry" in cookie:
+                params["expires"] = cookie["expiry"]
+            if "sameSite" in cookie:
+                params["sameSite"] = cookie["sameSite"]
+            driver.execute_cdp_cmd("Network.setCookie", params)
+        return True
+    except (AttributeError, WebDriverException):
+        return False
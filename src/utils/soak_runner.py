@@ -0,0 +1,295 @@
+"""
+Módulo para repetir el ciclo de vida de un post durante una prueba de soak.
+El ciclo crear -> leer -> PATCH -> PUT -> eliminar se ejecuta en bucle por una
+duración o cantidad de iteraciones, y se registra por ventanas de tiempo:
+percentiles de latencia por paso, errores, rachas de errores consecutivos y
+memoria residente (RSS) del propio proceso de pruebas. Opcionalmente, tracemalloc
+señala las líneas de código Python que más memoria sumaron.
+"""
+
+import mmap
+import sys
+import time
+import tracemalloc
+from typing import Any, Dict, List, Optional
+
+from utils.latency_stats import LatencyHistogram
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Líneas de código con mayor crecimiento de memoria que se incluyen en el reporte
+TOP_MEMORY_GROWTH = 5
+
+POST_PAYLOAD = {
+    "title": "Post para soak test",
+    "body": "Contenido del post repetido en la prueba de soak",
+    "userId": 1,
+}
+
+
+def process_memory() -> int:
+    """
+    Memoria residente (RSS) del proceso en bytes, incluida la que no pasa por el
+    heap de Python. Lee /proc/self/statm; donde no existe usa el máximo que
+    informa getrusage, y retorna 0 si tampoco está disponible.
+    """
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, ValueError, IndexError):
+        pass
+    if resource is None:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS informa bytes; Linux y los BSD, KB
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def lifecycle_steps(post_id: int):
+    """
+    Pasos del ciclo de vida como (nombre, método, endpoint, payload, status esperado).
+    """
+    endpoint = f"/posts/{post_id}"
+    return [
+        ("read", "GET", endpoint, None, 200),
+        ("patch", "PATCH", endpoint, {"title": "Titulo actualizado por soak"}, 200),
+        ("put", "PUT", endpoint, {**POST_PAYLOAD, "id": post_id}, 200),
+        ("delete", "DELETE", endpoint, None, 200),
+    ]
+
+
+class SoakWindow:
+    """
+    Métricas de una ventana de tiempo de la prueba de soak.
+    """
+
+    def __init__(self, index: int, started: float):
+        self.index = index
+        self.started = started
+        self.iterations = 0
+        self.errors = 0
+        self.steps: Dict[str, LatencyHistogram] = {}
+        self.overall = LatencyHistogram()
+        self.memory = 0
+
+    def record(self, step: str, latency: float, error: bool):
+        self.steps.setdefault(step, LatencyHistogram()).record(latency)
+        self.overall.record(latency)
+        if error:
+            self.errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "window": self.index,
+            "start_s": round(self.started, 3),
+            "iterations": self.iterations,
+            "requests": self.overall.count,
+            "errors": self.errors,
+            "memory_kb": round(self.memory / 1024, 1),
+            "latency": self.overall.to_dict(),
+            "steps": {step: stats.to_dict() for step, stats in self.steps.items()},
+        }
+
+
+class SoakResult:
+    """
+    Resultado de la prueba de soak: ventanas, rachas de errores y memoria.
+    """
+
+    def __init__(self):
+        self.windows: List[SoakWindow] = []
+        self.bursts: List[Dict[str, Any]] = []
+        self.memory_growth = 0
+        self.memory_top: List[str] = []
+        self.duration = 0.0
+
+    @property
+    def iterations(self) -> int:
+        return sum(window.iterations for window in self.windows)
+
+    @property
+    def requests(self) -> int:
+        return sum(window.overall.count for window in self.windows)
+
+    @property
+    def errors(self) -> int:
+        return sum(window.errors for window in self.windows)
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def drift(self, fraction: float = 0.9) -> float:
+        """
+        Cociente entre el percentil de la última ventana y el de la primera.
+        Con menos de dos ventanas retorna 1.0.
+        """
+        windows = [window for window in self.windows if window.overall.count]
+        if len(windows) < 2:
+            return 1.0
+        first = windows[0].overall.percentile(fraction)
+        last = windows[-1].overall.percentile(fraction)
+        return last / first if first else 1.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "duration_s": round(self.duration, 3),
+            "iterations": self.iterations,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "p90_drift": round(self.drift(), 3),
+            "memory_growth_kb": round(self.memory_growth / 1024, 1),
+            "memory_top_growth": self.memory_top,
+            "error_bursts": self.bursts,
+            "windows": [window.to_dict() for window in self.windows],
+        }
+
+    def summary(self) -> str:
+        """
+        Devuelve un resumen legible: totales y una línea por ventana.
+        """
+        lines = [
+            f"{self.iterations} ciclos, {self.requests} requests "
+            f"en {self.duration:.1f}s | "
+            f"Errores: {self.errors} ({self.error_rate:.2%}) | "
+            f"Rachas de errores: {len(self.bursts)} | "
+            f"Deriva p90: x{self.drift():.2f} | "
+            f"Crecimiento de memoria: {self.memory_growth / 1024:.1f} KB"
+        ]
+        for window in self.windows:
+            overall = window.overall
+            lines.append(
+                f"  ventana {window.index} (+{window.started:.0f}s): "
+                f"{window.iterations} ciclos, {window.errors} errores, "
+                f"p50 {overall.percentile(0.5) * 1000:.0f}ms, "
+                f"p90 {overall.percentile(0.9) * 1000:.0f}ms, "
+                f"p99 {overall.percentile(0.99) * 1000:.0f}ms, "
+                f"memoria {window.memory / 1024:.0f} KB"
+            )
+        return "\n".join(lines)
+
+
+def _send(client, method: str, endpoint: str, payload, expected_status: int):
+    """
+    Envía un paso del ciclo. Retorna (latencia, Response o None, error o None).
+    """
+    kwargs = {} if payload is None else {"json": payload}
+    started = time.perf_counter()
+    try:
+        response = client.request(method, endpoint, **kwargs)
+    except Exception as e:
+        return time.perf_counter() - started, None, f"{type(e).__name__}: {e}"
+    latency = response.elapsed.total_seconds()
+    if response.status_code != expected_status:
+        return latency, response, f"status {response.status_code}"
+    return latency, response, None
+
+
+def run_soak(
+    client,
+    duration: float,
+    iterations: int = 0,
+    window: float = 10.0,
+    burst_threshold: int = 3,
+    reuse_created: bool = False,
+    trace_allocations: bool = False,
+) -> SoakResult:
+    """
+    Repite el ciclo de vida de un post hasta cumplir la duración o las iteraciones.
+
+    Args:
+        client: ApiClient con el que se envían los requests
+        duration: Duración máxima en segundos (0 = sin límite de tiempo)
+        iterations: Ciclos máximos (0 = sin límite de ciclos)
+        window: Segundos de cada ventana de métricas
+        burst_threshold: Errores consecutivos que forman una racha
+        reuse_created: Opera sobre el post creado en cada ciclo. Si es False usa
+            el post 1, porque JSONPlaceholder no guarda los posts creados
+        trace_allocations: Activa tracemalloc para reportar las líneas con mayor
+            crecimiento de memoria. Hace más lento cada request
+
+    Returns:
+        SoakResult con las métricas por ventana
+    """
+    if duration <= 0 and iterations <= 0:
+        raise ValueError("La prueba de soak necesita una duración o iteraciones")
+
+    started_tracing = trace_allocations and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    result = SoakResult()
+    started = time.perf_counter()
+    current = SoakWindow(0, 0.0)
+    baseline: Optional[tracemalloc.Snapshot] = None
+    streak = 0
+    streak_start = 0.0
+
+    def close_window():
+        nonlocal baseline
+        current.memory = process_memory()
+        result.windows.append(current)
+        # La primera ventana calienta conexiones y cachés: se mide desde su cierre
+        if len(result.windows) == 1:
+            result.memory_growth = -current.memory
+            if tracemalloc.is_tracing():
+                baseline = tracemalloc.take_snapshot()
+
+    def register(step: str, latency: float, error: Optional[str], now: float):
+        nonlocal streak, streak_start
+        current.record(step, latency, error is not None)
+        if error is None:
+            if streak >= burst_threshold:
+                result.bursts.append(
+                    {"start_s": round(streak_start, 3), "errors": streak}
+                )
+            streak = 0
+            return
+        if streak == 0:
+            streak_start = now
+        streak += 1
+
+    try:
+        cycle = 0
+        while True:
+            now = time.perf_counter() - started
+            if (duration > 0 and now >= duration) or (0 < iterations <= cycle):
+                break
+            if now - current.started >= window:
+                close_window()
+                current = SoakWindow(len(result.windows), now)
+
+            latency, response, error = _send(
+                client, "POST", "/posts", POST_PAYLOAD, 201
+            )
+            register("create", latency, error, time.perf_counter() - started)
+            post_id = 1
+            if reuse_created and error is None:
+                post_id = response.json().get("id", 1)
+            for step, method, endpoint, payload, status in lifecycle_steps(post_id):
+                latency, _, error = _send(client, method, endpoint, payload, status)
+                register(step, latency, error, time.perf_counter() - started)
+            current.iterations += 1
+            cycle += 1
+
+        result.duration = time.perf_counter() - started
+        if streak >= burst_threshold:
+            result.bursts.append({"start_s": round(streak_start, 3), "errors": streak})
+        close_window()
+        if len(result.windows) > 1:
+            result.memory_growth += current.memory
+            if baseline is not None:
+                growth = tracemalloc.take_snapshot().compare_to(baseline, "lineno")
+                result.memory_top = [
+                    str(stat) for stat in growth[:TOP_MEMORY_GROWTH]
+                ]
+        else:
+            result.memory_growth = 0
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+    return result
@@ -0,0 +1,51 @@
+"""
+Módulo con un servidor local de sitios estáticos para las pruebas de UI.
+Sirve una copia del front end de SauceDemo desde disco; las rutas del SPA que
+no corresponden a un archivo (por ejemplo /inventory.html) devuelven index.html
+para que el router de la aplicación las resuelva.
+"""
+
+import os
+from functools import partial
+from http.server import SimpleHTTPRequestHandler
+from pathlib import Path
+
+from utils.local_server import BackgroundHTTPServer, QuietRequestHandlerMixin
+
+# Los assets del build llevan hash en el nombre: se pueden cachear sin revalidar
+_IMMUTABLE_PREFIX = "/static/"
+
+
+class _SpaHandler(QuietRequestHandlerMixin, SimpleHTTPRequestHandler):
+    """
+    Handler de archivos estáticos con fallback a index.html y conexiones keep-alive.
+    """
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.exists(path):
+            # Ruta del SPA: la resuelve el router de la aplicación
+            self.path = "/index.html"
+        return super().send_head()
+
+    def end_headers(self):
+        if self.path.startswith(_IMMUTABLE_PREFIX):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+
+class StaticSiteServer(BackgroundHTTPServer):
+    """
+    Servidor HTTP multihilo que sirve el directorio indicado en un hilo de fondo.
+    """
+
+    def __init__(self, directory, host: str = "127.0.0.1", port: int = 0):
+        self.directory = Path(directory)
+        if not (self.directory / "index.html").is_file():
+            raise FileNotFoundError(
+                f"No se encontró index.html en {self.directory.resolve()}"
+            )
+        handler = partial(_SpaHandler, directory=str(self.directory))
+        super().__init__(handler, host, port)
@@ -0,0 +1,83 @@
+"""
+Módulo de esperas para verificar presencia y ausencia de elementos.
+Durante estas verificaciones se suspende la espera implícita del driver, de
+modo que un elemento ausente no bloquee la prueba durante toda esa espera:
+las ausencias se dan por confirmadas tras FAST_WAIT_TIMEOUT, mientras que lo
+que debe aparecer se espera hasta SELENIUM_EXPLICIT_WAIT.
+"""
+
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+from utils import config
+
+
+@contextmanager
+def implicit_wait_suppressed(driver):
+    """
+    Suspende temporalmente la espera implícita del driver y, al salir, restaura
+    el valor que tenía antes (no necesariamente SELENIUM_IMPLICIT_WAIT).
+    """
+    previous = driver.timeouts.implicit_wait
+    driver.implicitly_wait(0)
+    try:
+        yield driver
+    finally:
+        driver.implicitly_wait(previous)
+
+
+def poll(condition, timeout: float, interval: float = 0.05, max_interval: float = 0.5):
+    """
+    Evalúa la condición con un intervalo que crece de forma adaptativa hasta
+    que retorne un valor verdadero o se agote el tiempo.
+    Retorna el último valor obtenido de la condición.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = condition()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 1.5, max_interval)
+
+
+def _find_matching(driver, locator, visible: bool):
+    """
+    Retorna el primer elemento que coincide con el localizador (y es visible si se pide) o None.
+    """
+    for element in driver.find_elements(*locator):
+        try:
+            if not visible or element.is_displayed():
+                return element
+        except StaleElementReferenceException:
+            continue
+    return None
+
+
+def expect_present(driver, locator, timeout: float = None, visible: bool = False):
+    """
+    Espera a que el elemento exista (y sea visible si visible=True).
+    Por defecto espera SELENIUM_EXPLICIT_WAIT: lo que debe aparecer no se
+    verifica con el timeout corto de las ausencias.
+
+    Returns:
+        El elemento encontrado o None si no apareció dentro del timeout
+    """
+    timeout = config.SELENIUM_EXPLICIT_WAIT if timeout is None else timeout
+    with implicit_wait_suppressed(driver):
+        return poll(lambda: _find_matching(driver, locator, visible), timeout)
+
+
+def expect_absent(driver, locator, timeout: float = None, visible: bool = False) -> bool:
+    """
+    Espera a que el elemento deje de existir (o de ser visible si visible=True).
+
+    Returns:
+        True si el elemento está ausente, False si siguió presente durante todo el timeout
+    """
+    timeout = config.FAST_WAIT_TIMEOUT if timeout is None else timeout
+    with implicit_wait_suppressed(driver):
+        return poll(lambda: _find_matching(driver, locator, visible) is None, timeout)